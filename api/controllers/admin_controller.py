@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from api.schemas.requests import AdminDashboardUserActivityRequest, AdminDashboardUserActivityStatsRequest
 from api.schemas.responses import AdminDashboardUserActivityResponse, AdminDashboardUserActivityStatsResponse
 from domain.services.user_service import UserService
+from infrastructure.http_client import http_clients
 from typing import List
 
 from utils.logger import Logger
@@ -54,3 +55,10 @@ async def fetch_admin_dashboard_stats(request: AdminDashboardUserActivityStatsRe
     logger.info("API endpoint called: /admin-dashboard/users/stats")
     logger.debug(f"Request body: {request}")
     return await controller.fetch_admin_dashboard_stats(request)
+
+
+@router.get("/admin/http-clients/stats", tags=["Admin", "Read"])
+async def fetch_http_client_stats():
+    """Connection pool stats of this worker's outbound HTTP clients"""
+    logger.info("API endpoint called: /admin/http-clients/stats")
+    return http_clients.stats()
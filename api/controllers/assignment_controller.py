@@ -71,7 +71,9 @@ class AssignmentController:
                     total_count=total_count,
                     page=page,
                     pagesize=pagesize,
-                    total_pages=total_pages)
+                    total_pages=total_pages,
+                    total_count_exact=result.get("total_count_exact", True),
+                    next_cursor=result.get("next_cursor"))
 
             logger.debug(
                 f"Assignments fetched: {len(assignments)} out of {total_count} total"
@@ -108,7 +110,9 @@ class AssignmentController:
                     total_count=total_count,
                     page=page,
                     pagesize=pagesize,
-                    total_pages=total_pages)
+                    total_pages=total_pages,
+                    total_count_exact=result.get("total_count_exact", True),
+                    next_cursor=result.get("next_cursor"))
 
             # Add pagination metadata to the response
             response_data.pagination = pagination_metadata
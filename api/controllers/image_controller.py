@@ -1,37 +1,181 @@
-from fastapi import APIRouter, HTTPException
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
 from bson import ObjectId
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
+from api.schemas.requests import ImageSize
 from infrastructure.database import Database
+from infrastructure.image_cache import CachedImage, image_cache
+from infrastructure.image_store import ImageStore
 
 from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
 
+# Images are tenant data behind auth: browsers may keep them, shared caches
+# must not
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
 
 router = APIRouter()
 
 
+def parse_range(range_header: Optional[str],
+                size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive ``(start, end)``
+
+    Returns None when the whole image should be served (no header, a
+    multi-range or a malformed header) and raises ValueError when the range
+    can't be satisfied.
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    first, last = (part.strip() for part in spec.split("-", 1))
+    if not (first or last) or any(part and not part.isdigit()
+                                  for part in (first, last)):
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Range not satisfiable")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    end = int(last) if last else size - 1
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates)
+
+
 class ImageController:
     def __init__(self):
         self.db = Database()
+        self.image_store = ImageStore()
         logger.info("ImageController initialized.")
-    
-    async def get_image(self, image_id: str):
-        """Retrieve an image by ID"""
-        logger.info(f"Received request to fetch image with ID: {image_id}")
+
+    async def _load_image(
+            self, image_id: str, size: ImageSize,
+            cache_key: str) -> Tuple[dict, Optional[CachedImage]]:
+        """Fetch the requested variant, caching its bytes when small enough"""
+        image_id_object = ObjectId(image_id)
+        logger.debug(f"Converted image_id to ObjectId: {image_id_object}")
+
+        image = await self.db.images.find_one({"_id": image_id_object})
+        if not image:
+            logger.warning(f"No image found for ID: {image_id}")
+            raise HTTPException(status_code=404, detail="Image not found")
+
+        logger.info(f"Image found for ID: {image_id}")
+        image = self.image_store.variant(image, size.value)
+        if not image_cache.cacheable(self.image_store.size(image)):
+            return image, None
+
+        cached = CachedImage(
+            data=await self.image_store.read(image),
+            content_type=image["contentType"],
+            # Image content never changes for an id; the content hash (or
+            # the id for legacy inline images) is a strong validator
+            etag=image.get("sha256") or image_id,
+            last_modified=image.get("uploadedAt")
+            or image_id_object.generation_time)
+        image_cache.put(cache_key, cached)
+        return image, cached
+
+    async def get_image(self,
+                        image_id: str,
+                        request: Request,
+                        size: ImageSize = ImageSize.ORIGINAL):
+        """Retrieve an image by ID
+
+        ``size`` selects a resized/WebP derivative; images without one are
+        served at original size. Honours ``If-None-Match`` (304) and single
+        byte ranges (206). Hot images are served from the per-worker byte
+        cache without touching Mongo.
+        """
+        logger.info(f"Received request to fetch image with ID: {image_id}, "
+                    f"size={size.value}")
         try:
-            image_id_object = ObjectId(image_id)
-            logger.debug(f"Converted image_id to ObjectId: {image_id_object}")
-    
-            image = await self.db.images.find_one({"_id": image_id_object})
-            if not image:
-                logger.warning(f"No image found for ID: {image_id}")
-                raise HTTPException(status_code=404, detail="Image not found")
-    
-            logger.info(f"Image found for ID: {image_id}")
-            return Response(content=image["data"],
-                            media_type=image["contentType"])
-    
+            image = None
+            cache_key = (image_id if size == ImageSize.ORIGINAL else
+                         f"{image_id}:{size.value}")
+            cached = image_cache.get(cache_key)
+            if not cached:
+                image, cached = await self._load_image(image_id, size,
+                                                       cache_key)
+
+            if cached:
+                etag, total_bytes = cached.etag, len(cached.data)
+                content_type = cached.content_type
+                last_modified = cached.last_modified
+            else:
+                etag = image.get("sha256") or image_id
+                total_bytes = self.image_store.size(image)
+                content_type = image["contentType"]
+                last_modified = image.get("uploadedAt") or ObjectId(
+                    image_id).generation_time
+
+            headers = {
+                "ETag": f'"{etag}"',
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+                "Accept-Ranges": "bytes"
+            }
+            if last_modified:
+                headers["Last-Modified"] = format_datetime(
+                    last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+            if etag_matches(request.headers.get("if-none-match"), f'"{etag}"'):
+                logger.debug(f"Image {image_id} not modified")
+                return Response(status_code=304, headers=headers)
+
+            byte_range = None
+            if_range = request.headers.get("if-range")
+            if not if_range or if_range == f'"{etag}"':
+                try:
+                    byte_range = parse_range(request.headers.get("range"),
+                                             total_bytes)
+                except ValueError:
+                    return Response(status_code=416,
+                                    headers={
+                                        **headers, "Content-Range":
+                                        f"bytes */{total_bytes}"
+                                    })
+
+            status_code = 200
+            start, end = 0, total_bytes - 1
+            if byte_range:
+                status_code = 206
+                start, end = byte_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{total_bytes}"
+            headers["Content-Length"] = str(max(end - start + 1, 0))
+
+            if cached:
+                return Response(content=cached.data[start:end + 1],
+                                status_code=status_code,
+                                media_type=content_type,
+                                headers=headers)
+            return StreamingResponse(self.image_store.iter_chunks(
+                image, start, end),
+                                     status_code=status_code,
+                                     media_type=content_type,
+                                     headers=headers)
+
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving image with ID {image_id}: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500,
@@ -40,7 +184,15 @@ class ImageController:
 
 controller = ImageController()
 
+@router.get("/images/cache/stats", tags=["Images"])
+async def get_image_cache_stats():
+    """Hit/miss counters of this worker's image byte cache"""
+    return image_cache.stats()
+
+
 @router.get("/images/{image_id}", tags=["Images"])
-async def get_image(image_id: str):
-    """Get image by ID"""
-    return await controller.get_image(image_id)
+async def get_image(image_id: str,
+                    request: Request,
+                    size: ImageSize = ImageSize.ORIGINAL):
+    """Get image by ID, optionally as a resized/WebP derivative"""
+    return await controller.get_image(image_id, request, size)
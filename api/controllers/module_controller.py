@@ -71,7 +71,9 @@ class ModuleController:
                     total_count=total_count,
                     page=page,
                     pagesize=pagesize,
-                    total_pages=total_pages
+                    total_pages=total_pages,
+                    total_count_exact=result.get("total_count_exact", True),
+                    next_cursor=result.get("next_cursor")
                 )
 
             logger.info(f"Fetched {len(modules)} module(s) out of {total_count} total.")
@@ -0,0 +1,53 @@
+import json
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import ValidationError
+
+from api.schemas.requests import RetellWebhookRequest
+from config import RETELL_API_KEY, RETELL_WEBHOOK_VERIFY
+from domain.services.simulation_service import SimulationService
+from utils.logger import Logger
+from utils.retell_webhook import verify_signature
+
+logger = Logger.get_logger(__name__)
+
+router = APIRouter()
+
+
+class RetellWebhookController:
+
+    def __init__(self):
+        self.service = SimulationService()
+        logger.info("RetellWebhookController initialized.")
+
+    async def handle_webhook(self, request: Request) -> Response:
+        """Verify and ingest a Retell call webhook
+
+        Acknowledges immediately; scoring runs in the background so Retell
+        doesn't time out and redeliver.
+        """
+        body = (await request.body()).decode()
+        if RETELL_WEBHOOK_VERIFY and not verify_signature(
+                body, RETELL_API_KEY,
+                request.headers.get("x-retell-signature")):
+            raise HTTPException(status_code=401,
+                                detail="Invalid webhook signature")
+        try:
+            webhook = RetellWebhookRequest(**json.loads(body))
+        except (ValueError, ValidationError) as e:
+            logger.warning(f"Malformed Retell webhook: {str(e)}")
+            raise HTTPException(status_code=400,
+                                detail="Malformed webhook payload")
+
+        await self.service.handle_retell_webhook(webhook.event, webhook.call)
+        return Response(status_code=204)
+
+
+controller = RetellWebhookController()
+
+
+@router.post("/retell/webhook", tags=["Simulations", "Webhooks"])
+async def retell_webhook(request: Request) -> Response:
+    """Retell call_started/call_ended/call_analyzed events"""
+    logger.info("API endpoint called: POST /retell/webhook")
+    return await controller.handle_webhook(request)
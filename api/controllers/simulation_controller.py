@@ -1,11 +1,11 @@
 from fastapi import APIRouter, HTTPException, File, UploadFile, Request
-from typing import Dict, List
+from typing import Dict, List, Optional
 from bson import ObjectId
 from datetime import datetime
-import aiohttp
 from utils.logger import Logger  # <-- Added import for Logger
 from domain.services.simulation_service import SimulationService
 from infrastructure.database import Database
+from infrastructure.http_client import http_clients
 from domain.services.chat_service import ChatService
 
 from api.schemas.requests import (
@@ -28,7 +28,8 @@ from api.schemas.requests import (
     EndVisualAudioAttemptRequest,
     EndVisualChatAttemptRequest,
     EndVisualAttemptRequest,
-    UpdateImageMaskingObjectRequest
+    UpdateImageMaskingObjectRequest,
+    ImageDelivery
 )
 from api.schemas.responses import (
     CreateSimulationResponse, UpdateSimulationResponse,
@@ -181,13 +182,14 @@ class SimulationController:
         try:
 
             result = await self.service.start_visual_audio_preview(
-                request.sim_id, request.user_id)
+                request.sim_id, request.user_id, request.image_delivery)
             logger.info("Visual-audio preview started successfully.")
             return StartVisualAudioPreviewResponse(
                 simulation=result.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in result.images
                 ])
         except Exception as e:
@@ -202,13 +204,14 @@ class SimulationController:
         try:
 
             result = await self.service.start_visual_chat_preview(
-                request.sim_id, request.user_id)
+                request.sim_id, request.user_id, request.image_delivery)
             logger.info("Visual-chat preview started successfully.")
             return StartVisualChatPreviewResponse(
                 simulation=result.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in result.images
                 ])
         except Exception as e:
@@ -224,13 +227,14 @@ class SimulationController:
         try:
 
             result = await self.service.start_visual_preview(
-                request.sim_id, request.user_id)
+                request.sim_id, request.user_id, request.image_delivery)
             logger.info("Visual preview started successfully.")
             return StartVisualPreviewResponse(
                 simulation=result.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in result.images
                 ])
         except Exception as e:
@@ -305,6 +309,7 @@ class SimulationController:
                 "userId": request.user_id,
                 "simulationId": request.sim_id,
                 "assignmentId": request.assignment_id,
+                "workspace": simulation.get("workspace"),
                 "type": "audio",
                 "status": "in_progress",
                 "callId": web_call.get("call_id"),
@@ -313,6 +318,7 @@ class SimulationController:
                 "lastModifiedAt": datetime.utcnow(),
             }
             result = await self.db.user_sim_progress.insert_one(progress_doc)
+            await self.service.progress_summaries.record_start(progress_doc)
 
             # Extract simulation details for response
             sim_details = {
@@ -467,6 +473,7 @@ class SimulationController:
                     "userId": request.user_id,
                     "simulationId": request.sim_id,
                     "assignmentId": request.assignment_id,
+                    "workspace": simulation.get("workspace"),
                     "type": "chat",
                     "status": "in_progress",
                     "chatHistory": [],
@@ -489,6 +496,7 @@ class SimulationController:
 
                 result = await self.db.user_sim_progress.insert_one(
                     progress_doc)
+                await self.service.progress_summaries.record_start(progress_doc)
                 logger.info(
                     "New user simulation progress created successfully.")
                 return StartSimulationResponse(
@@ -502,11 +510,17 @@ class SimulationController:
                 status_code=500,
                 detail=f"Error starting chat simulation: {str(e)}")
 
+    async def _simulation_workspace(self, sim_id: str) -> Optional[str]:
+        """Workspace of a simulation, copied onto the attempts started on it"""
+        simulation = await self.db.simulations.find_one(
+            {"_id": ObjectId(sim_id)}, {"workspace": 1})
+        return (simulation or {}).get("workspace")
+
     async def _create_web_call(self, agent_id: str) -> Dict:
         """Create a web call using Retell API"""
         logger.debug(f"Creating web call with agent_id={agent_id}")
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("retell") as session:
                 headers = {
                     "Authorization": f"Bearer {RETELL_API_KEY}",
                     "Content-Type": "application/json"
@@ -547,6 +561,12 @@ class SimulationController:
                 status_code=500,
                 detail=f"Error ending audio simulation: {str(e)}")
 
+    async def get_audio_simulation_status(
+            self, usersimulationprogress_id: str) -> EndSimulationResponse:
+        logger.info("Received request for audio simulation status.")
+        return await self.service.get_audio_simulation_status(
+            usersimulationprogress_id)
+
     async def end_chat_simulation(
             self, request: EndChatSimulationRequest) -> EndSimulationResponse:
         logger.info("Received request to end chat simulation.")
@@ -605,7 +625,10 @@ class SimulationController:
         try:
             # Pass the pagination parameters and workspace to the service layer
             result = await self.service.fetch_simulations(
-                request.user_id, workspace, pagination=request.pagination)
+                request.user_id,
+                workspace,
+                pagination=request.pagination,
+                view=request.view)
 
             simulations = result["simulations"]
             total_count = result["total_count"]
@@ -622,7 +645,9 @@ class SimulationController:
                     total_count=total_count,
                     page=page,
                     pagesize=pagesize,
-                    total_pages=total_pages)
+                    total_pages=total_pages,
+                    total_count_exact=result.get("total_count_exact", True),
+                    next_cursor=result.get("next_cursor"))
 
             logger.info(
                 f"Fetched {len(simulations)} simulation(s) out of {total_count} total."
@@ -634,8 +659,12 @@ class SimulationController:
             raise HTTPException(status_code=500,
                                 detail=f"Error fetching simulations: {str(e)}")
 
-    async def get_simulation_by_id(self, simulation_id: str,
-                                   workspace: str) -> SimulationByIDResponse:
+    async def get_simulation_by_id(
+        self,
+        simulation_id: str,
+        workspace: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> SimulationByIDResponse:
         """Get a single simulation by ID"""
         logger.info(
             f"Received request to get simulation by ID: {simulation_id} from workspace {workspace}"
@@ -643,7 +672,7 @@ class SimulationController:
         try:
 
             simulation = await self.service.get_simulation_by_id(
-                simulation_id, workspace)
+                simulation_id, workspace, image_delivery)
             if not simulation:
                 logger.warning(
                     f"Simulation with id {simulation_id} not found in workspace {workspace}."
@@ -660,13 +689,18 @@ class SimulationController:
             raise
 
     async def start_visual_audio_attempt(
-            self, sim_id: str, user_id: str,
-            assignment_id: str) -> StartVisualAudioAttemptResponse:
+        self,
+        sim_id: str,
+        user_id: str,
+        assignment_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualAudioAttemptResponse:
         try:
             progress_doc = {
                 "userId": user_id,
                 "simulationId": sim_id,
                 "assignmentId": assignment_id,
+                "workspace": await self._simulation_workspace(sim_id),
                 "type": "visual_audio",
                 "status": "in_progress",
                 "createdAt": datetime.utcnow(),
@@ -674,9 +708,10 @@ class SimulationController:
             }
 
             result = await self.db.user_sim_progress.insert_one(progress_doc)
+            await self.service.progress_summaries.record_start(progress_doc)
 
             sim_data = await self.service.start_visual_audio_preview(
-                sim_id, user_id)
+                sim_id, user_id, image_delivery)
             logger.info("Visual-audio preview started successfully.")
 
             return StartVisualAudioAttemptResponse(
@@ -685,7 +720,8 @@ class SimulationController:
                 simulation=sim_data.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in sim_data.images
                 ])
         except Exception as e:
@@ -695,13 +731,18 @@ class SimulationController:
                                 detail="Internal server error")
 
     async def start_visual_chat_attempt(
-            self, sim_id: str, user_id: str,
-            assignment_id: str) -> StartVisualChatAttemptResponse:
+        self,
+        sim_id: str,
+        user_id: str,
+        assignment_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualChatAttemptResponse:
         try:
             progress_doc = {
                 "userId": user_id,
                 "simulationId": sim_id,
                 "assignmentId": assignment_id,
+                "workspace": await self._simulation_workspace(sim_id),
                 "type": "visual_chat",
                 "status": "in_progress",
                 "createdAt": datetime.utcnow(),
@@ -709,8 +750,9 @@ class SimulationController:
             }
 
             result = await self.db.user_sim_progress.insert_one(progress_doc)
+            await self.service.progress_summaries.record_start(progress_doc)
             sim_data = await self.service.start_visual_chat_preview(
-                sim_id, user_id)
+                sim_id, user_id, image_delivery)
             logger.info("Visual-chat preview started successfully.")
 
             return StartVisualChatAttemptResponse(
@@ -719,7 +761,8 @@ class SimulationController:
                 simulation=sim_data.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in sim_data.images
                 ])
         except Exception as e:
@@ -729,13 +772,18 @@ class SimulationController:
                                 detail="Internal server error")
 
     async def start_visual_attempt(
-            self, sim_id: str, user_id: str,
-            assignment_id: str) -> StartVisualAttemptResponse:
+        self,
+        sim_id: str,
+        user_id: str,
+        assignment_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualAttemptResponse:
         try:
             progress_doc = {
                 "userId": user_id,
                 "simulationId": sim_id,
                 "assignmentId": assignment_id,
+                "workspace": await self._simulation_workspace(sim_id),
                 "type": "visual",
                 "status": "in_progress",
                 "createdAt": datetime.utcnow(),
@@ -743,7 +791,9 @@ class SimulationController:
             }
 
             result = await self.db.user_sim_progress.insert_one(progress_doc)
-            sim_data = await self.service.start_visual_preview(sim_id, user_id)
+            await self.service.progress_summaries.record_start(progress_doc)
+            sim_data = await self.service.start_visual_preview(
+                sim_id, user_id, image_delivery)
             logger.info("Visual preview started successfully.")
             return StartVisualAttemptResponse(
                 id=str(result.inserted_id),
@@ -751,7 +801,8 @@ class SimulationController:
                 simulation=sim_data.simulation,
                 images=[
                     SlideImageData(image_id=img.image_id,
-                                   image_data=img.image_data)
+                                   image_data=img.image_data,
+                                   image_url=img.image_url)
                     for img in sim_data.images
                 ])
         except Exception as e:
@@ -1004,6 +1055,17 @@ async def end_audio_simulation(
     return await controller.end_audio_simulation(request)
 
 
+@router.get("/simulations/end-audio/{usersimulationprogress_id}/status",
+            tags=["Simulations", "Read"])
+async def get_audio_simulation_status(
+        usersimulationprogress_id: str) -> EndSimulationResponse:
+    """Poll until an ended audio attempt is scored (status != pending)"""
+    logger.info("API endpoint called: GET /simulations/end-audio/"
+                f"{usersimulationprogress_id}/status")
+    return await controller.get_audio_simulation_status(
+        usersimulationprogress_id)
+
+
 @router.post("/simulations/end-chat", tags=["Simulations", "End"])
 async def end_chat_simulation(
         request: EndChatSimulationRequest) -> EndSimulationResponse:
@@ -1055,14 +1117,17 @@ async def start_visual_preview(
 
 @router.get("/simulations/fetch/{simulation_id}", tags=["Simulations", "Read"])
 async def get_simulation_by_id(
-        simulation_id: str,
-        current_request: Request) -> SimulationByIDResponse:
+    simulation_id: str,
+    current_request: Request,
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
+) -> SimulationByIDResponse:
     """Get a single simulation by ID"""
     logger.info(f"API endpoint called: GET /simulations/fetch/{simulation_id}")
     workspace = current_request.headers.get('x-workspace-id')
     if not workspace:
         raise HTTPException(status_code=400, detail="Workspace ID is required")
-    return await controller.get_simulation_by_id(simulation_id, workspace)
+    return await controller.get_simulation_by_id(simulation_id, workspace,
+                                                 image_delivery)
 
 
 @router.post("/simulations/create", tags=["Simulations", "Create"])
@@ -1099,7 +1164,8 @@ async def start_visual_audio_attempt(
         "API endpoint called: POST /simulations/start-visual-audio-attempt")
     return await controller.start_visual_audio_attempt(request.sim_id,
                                                        request.user_id,
-                                                       request.assignment_id)
+                                                       request.assignment_id,
+                                                       request.image_delivery)
 
 
 @router.post("/simulations/start-visual-chat-attempt",
@@ -1112,7 +1178,8 @@ async def start_visual_chat_attempt(
         "API endpoint called: POST /simulations/start-visual-chat-attempt")
     return await controller.start_visual_chat_attempt(request.sim_id,
                                                       request.user_id,
-                                                      request.assignment_id)
+                                                      request.assignment_id,
+                                                      request.image_delivery)
 
 
 @router.post("/simulations/start-visual-attempt",
@@ -1123,7 +1190,8 @@ async def start_visual_attempt(
     logger.info("API endpoint called: POST /simulations/start-visual-attempt")
     return await controller.start_visual_attempt(request.sim_id,
                                                  request.user_id,
-                                                 request.assignment_id)
+                                                 request.assignment_id,
+                                                 request.image_delivery)
 
 
 @router.post("/simulations/end-visual-audio-attempt",
@@ -12,6 +12,23 @@ class SortDirection(str, Enum):
     DESC = "desc"
 
 
+class ImageDelivery(str, Enum):
+    INLINE = "inline"  # base64 image bytes in the response
+    URL = "url"  # references to GET /images/{image_id}
+
+
+class ImageSize(str, Enum):
+    ORIGINAL = "original"
+    THUMB = "thumb"  # IMAGE_THUMB_WIDTH wide, WebP
+    MEDIUM = "medium"  # IMAGE_MEDIUM_WIDTH wide, WebP
+    WEBP = "webp"  # original resolution, WebP
+
+
+class SimulationView(str, Enum):
+    SUMMARY = "summary"
+    FULL = "full"
+
+
 class PaginationParams(BaseModel):
     page: int = 1
     pagesize: int = 50
@@ -31,6 +48,9 @@ class PaginationParams(BaseModel):
     createdTo: Optional[datetime] = None
     modifiedFrom: Optional[datetime] = None
     modifiedTo: Optional[datetime] = None
+    # Keyset paging: opt in with useCursor, then pass back next_cursor
+    useCursor: bool = False
+    cursor: Optional[str] = None
 
 
 class ChatHistoryItem(BaseModel):
@@ -80,6 +100,11 @@ class EndAudioSimulationRequest(BaseModel):
     call_id: str
 
 
+class RetellWebhookRequest(BaseModel):
+    event: str
+    call: Dict[str, Any]
+
+
 class EndChatSimulationRequest(BaseModel):
     user_id: str
     simulation_id: str
@@ -258,6 +283,8 @@ class StartAudioSimulationRequest(BaseModel):
 class FetchSimulationsRequest(BaseModel):
     user_id: str
     pagination: Optional[PaginationParams] = None
+    # summary skips script and slidesData for list pages
+    view: SimulationView = SimulationView.FULL
 
 
 class CreateModuleRequest(BaseModel):
@@ -362,16 +389,19 @@ class FetchAssignedPlansRequest(BaseModel):
 class StartVisualAudioPreviewRequest(BaseModel):
     user_id: str
     sim_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class StartVisualChatPreviewRequest(BaseModel):
     user_id: str
     sim_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class StartVisualPreviewRequest(BaseModel):
     user_id: str
     sim_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class CreateTagRequest(BaseModel):
@@ -387,18 +417,21 @@ class StartVisualAudioAttemptRequest(BaseModel):
     user_id: str
     sim_id: str
     assignment_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class StartVisualChatAttemptRequest(BaseModel):
     user_id: str
     sim_id: str
     assignment_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class StartVisualAttemptRequest(BaseModel):
     user_id: str
     sim_id: str
     assignment_id: str
+    image_delivery: ImageDelivery = ImageDelivery.INLINE
 
 
 class EndVisualAudioAttemptRequest(BaseModel):
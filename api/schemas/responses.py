@@ -10,6 +10,9 @@ class PaginationMetadata(BaseModel):
     page: int
     pagesize: int
     total_pages: int
+    # False when total_count is estimated or served from the count cache
+    total_count_exact: bool = True
+    next_cursor: Optional[str] = None
 
 
 class TrainingDataResponse(BaseModel):
@@ -43,6 +46,8 @@ class AttemptsStatsResponse(BaseModel):
 class AttemptsResponse(BaseModel):
     attempts: List[SimulationAttemptModel]
     total_attempts: int
+    total_attempts_exact: bool = True
+    next_cursor: Optional[str] = None
 
 
 class AttemptResponse(BaseModel):
@@ -353,7 +358,8 @@ class FetchAssignedPlansResponse(BaseModel):
 
 class SlideImageData(BaseModel):
     image_id: str
-    image_data: bytes
+    image_data: Optional[bytes] = None
+    image_url: Optional[str] = None
 
 
 class StartVisualAudioPreviewResponse(BaseModel):
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,6 +20,125 @@ AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
 AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY")
 AZURE_OPENAI_BASE_URL = os.getenv("AZURE_OPENAI_BASE_URL")
 
+# Read consolidated progress from simulationProgressSummaries instead of
+# scanning userSimulationProgress (enable once the summaries are backfilled
+# with `python -m scripts.rebuild_progress_summaries`)
+PROGRESS_SUMMARY_READS = os.getenv("PROGRESS_SUMMARY_READS",
+                                   "false").lower() == "true"
+
+# How long exact pagination totals are reused before being recounted
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "15"))
+
+# Per-worker LRU of hot /images bytes; larger images are always streamed
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES",
+                                      str(64 * 1024 * 1024)))
+IMAGE_CACHE_MAX_ITEM_BYTES = int(
+    os.getenv("IMAGE_CACHE_MAX_ITEM_BYTES", str(4 * 1024 * 1024)))
+
+# Resized/WebP slide variants generated at upload, served via ?size=
+IMAGE_THUMB_WIDTH = int(os.getenv("IMAGE_THUMB_WIDTH", "320"))
+IMAGE_MEDIUM_WIDTH = int(os.getenv("IMAGE_MEDIUM_WIDTH", "1024"))
+IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", "2"))
+
+# Slide uploads in update_simulation
+SLIDE_UPLOAD_CONCURRENCY = int(os.getenv("SLIDE_UPLOAD_CONCURRENCY", "8"))
+SLIDE_UPLOAD_CHUNK_BYTES = int(
+    os.getenv("SLIDE_UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+SLIDE_BULK_INSERT_MAX_BYTES = int(
+    os.getenv("SLIDE_BULK_INSERT_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Pooled outbound HTTP clients (Retell, Deepgram, SBERT, Qwen, audio)
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30"))
+HTTP_DNS_CACHE_TTL_SECONDS = int(os.getenv("HTTP_DNS_CACHE_TTL_SECONDS",
+                                           "300"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(
+    os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "10"))
+HTTP_TOTAL_TIMEOUT_SECONDS = float(os.getenv("HTTP_TOTAL_TIMEOUT_SECONDS",
+                                             "300"))
+
+# Audio attempts are scored from Retell's call_ended/call_analyzed webhook;
+# get-call polling with backoff is the fallback when no webhook arrives
+RETELL_WEBHOOK_VERIFY = os.getenv("RETELL_WEBHOOK_VERIFY",
+                                  "true").lower() == "true"
+RETELL_CALL_POLL_INITIAL_SECONDS = float(
+    os.getenv("RETELL_CALL_POLL_INITIAL_SECONDS", "5"))
+RETELL_CALL_POLL_MAX_INTERVAL_SECONDS = float(
+    os.getenv("RETELL_CALL_POLL_MAX_INTERVAL_SECONDS", "30"))
+RETELL_CALL_POLL_TIMEOUT_SECONDS = float(
+    os.getenv("RETELL_CALL_POLL_TIMEOUT_SECONDS", "600"))
+AUDIO_SCORING_LEASE_SECONDS = float(
+    os.getenv("AUDIO_SCORING_LEASE_SECONDS", "300"))
+
+# Background scoring job queue (drained by `python -m worker`). Only enable
+# it in deployments that run the worker, or jobs queue up and never run
+SCORING_JOBS_ENABLED = os.getenv("SCORING_JOBS_ENABLED",
+                                 "false").lower() == "true"
+SCORING_WORKER_CONCURRENCY = int(os.getenv("SCORING_WORKER_CONCURRENCY", "4"))
+SCORING_WORKER_POLL_SECONDS = float(
+    os.getenv("SCORING_WORKER_POLL_SECONDS", "2"))
+SCORING_JOB_LEASE_SECONDS = float(os.getenv("SCORING_JOB_LEASE_SECONDS",
+                                            "300"))
+SCORING_JOB_MAX_ATTEMPTS = int(os.getenv("SCORING_JOB_MAX_ATTEMPTS", "5"))
+SCORING_JOB_BACKOFF_BASE_SECONDS = float(
+    os.getenv("SCORING_JOB_BACKOFF_BASE_SECONDS", "10"))
+SCORING_JOB_BACKOFF_MAX_SECONDS = float(
+    os.getenv("SCORING_JOB_BACKOFF_MAX_SECONDS", "600"))
+# Queued jobs still unclaimed this long after they were due are
+# dead-lettered by the worker's periodic sweep
+SCORING_JOB_QUEUED_MAX_AGE_SECONDS = float(
+    os.getenv("SCORING_JOB_QUEUED_MAX_AGE_SECONDS", str(24 * 60 * 60)))
+SCORING_JOB_SWEEP_INTERVAL_SECONDS = float(
+    os.getenv("SCORING_JOB_SWEEP_INTERVAL_SECONDS", "60"))
+
+# Process pool for librosa/pyworld audio analysis
+AUDIO_DSP_WORKERS = int(os.getenv("AUDIO_DSP_WORKERS", "2"))
+AUDIO_DSP_TIMEOUT_SECONDS = float(os.getenv("AUDIO_DSP_TIMEOUT_SECONDS",
+                                            "120"))
+
+# On-disk cache of call recordings, keyed by recording URL
+AUDIO_CACHE_DIR = os.getenv("AUDIO_CACHE_DIR",
+                            os.path.join(tempfile.gettempdir(), "audio-cache"))
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("AUDIO_CACHE_MAX_BYTES",
+                                      str(2 * 1024 * 1024 * 1024)))
+AUDIO_DOWNLOAD_CHUNK_BYTES = int(os.getenv("AUDIO_DOWNLOAD_CHUNK_BYTES",
+                                           str(256 * 1024)))
+
+# SBERT sentence embeddings; "stub" swaps in a deterministic local encoder
+SBERT_ENCODE_URL = os.getenv(
+    "SBERT_ENCODE_URL",
+    "https://eu2simudal001.eastus2.cloudapp.azure.com/sbert/encode")
+SBERT_ENCODER = os.getenv("SBERT_ENCODER", "remote")
+# Sentences from concurrent scoring jobs are encoded together
+SBERT_BATCH_MAX_SENTENCES = int(os.getenv("SBERT_BATCH_MAX_SENTENCES", "64"))
+SBERT_BATCH_WAIT_SECONDS = float(os.getenv("SBERT_BATCH_WAIT_SECONDS",
+                                           "0.02"))
+
+# Per-process LRU of BM25/keyword indexes built from simulation scripts
+SCRIPT_INDEX_CACHE_MAX_ENTRIES = int(
+    os.getenv("SCRIPT_INDEX_CACHE_MAX_ENTRIES", "256"))
+
+# How keyword scoring pairs script lines with transcript turns: "index" (line
+# i with turn i) or "banded" (sequence alignment tolerant of extra/missing
+# turns, searching KEYWORD_ALIGNMENT_BAND turns either side of the diagonal)
+KEYWORD_ALIGNMENT_MODE = os.getenv("KEYWORD_ALIGNMENT_MODE", "index")
+KEYWORD_ALIGNMENT_BAND = int(os.getenv("KEYWORD_ALIGNMENT_BAND", "8"))
+KEYWORD_ALIGNMENT_GAP_COST = float(
+    os.getenv("KEYWORD_ALIGNMENT_GAP_COST", "0.5"))
+
+# Azure OpenAI scoring calls: in flight per process, and the budget of each
+# scoring pass's (contextual, behavioural) LLM call. The budget starts once
+# the call holds one of the LLM_MAX_CONCURRENCY slots, so queueing behind
+# other attempts under load never times a pass out
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_PASS_TIMEOUT_SECONDS = float(os.getenv("LLM_PASS_TIMEOUT_SECONDS", "90"))
+
+# Build startup indexes in the background so large collections stay writable
+INDEX_BUILD_BACKGROUND = os.getenv("INDEX_BUILD_BACKGROUND",
+                                   "true").lower() == "true"
+
 # Validate configuration
 if not MONGO_URI:
     raise ValueError(
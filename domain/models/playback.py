@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 class WordTimestampModel(BaseModel):
@@ -39,6 +39,8 @@ class AttemptAnalyticsModel(BaseModel):
     completedAt: str
     type: str
     simLevel: str
+    # Filled in by the scoring worker once its analysis has run
+    advancedScores: Optional[Dict[str, Any]] = None
 
 class SimulationAttemptModel(BaseModel):
     id: str
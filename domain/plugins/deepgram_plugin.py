@@ -1,6 +1,6 @@
-import aiohttp
 from typing import List, Dict
 from semantic_kernel.functions import kernel_function
+from infrastructure.http_client import http_clients
 from utils.logger import Logger  # Make sure this path matches your project structure
 
 logger = Logger.get_logger(__name__)
@@ -27,7 +27,7 @@ class DeepgramPlugin:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("deepgram") as session:
                 logger.debug(f"POST to Deepgram API: {url}")
                 async with session.post(url,
                                         headers=headers,
@@ -65,7 +65,7 @@ class DeepgramPlugin:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("deepgram") as session:
                 logger.debug(f"POST to Deepgram API: {url}")
                 async with session.post(url,
                                         headers=headers,
@@ -11,18 +11,19 @@ from rank_bm25 import BM25Okapi
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
-import librosa
-import pyworld as pw
-import tempfile
-import os
 
 # Configuration - should be moved to config.py
 QWEN_API_URL = "https://eu2simudal001.eastus2.cloudapp.azure.com/qwen/chat"
 SBERT_SIMILARITY_URL = "https://eu2simudal001.eastus2.cloudapp.azure.com/sbert/similarity"
-SBERT_ENCODE_URL = "https://eu2simudal001.eastus2.cloudapp.azure.com/sbert/encode"
-SBERT_BATCH_SIMILARITY_URL = "https://eu2simudal001.eastus2.cloudapp.azure.com/sbert/batch_similarity"
 
+from config import AUDIO_DSP_TIMEOUT_SECONDS, HTTP_TOTAL_TIMEOUT_SECONDS
 from infrastructure.database import Database
+from infrastructure.process_pool import dsp_pool
+from domain.services.audio_dsp import analyze_pitch_variance
+from infrastructure.audio_cache import audio_cache
+from infrastructure.embedding_client import embedding_client
+from infrastructure.script_index_cache import script_index_cache
+from infrastructure.http_client import http_clients
 from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
@@ -33,12 +34,14 @@ class AdvancedScoringService:
         "confidence": {
             "information_accuracy": {
                 "weight": 0.30,
+                "component_timeout": 120,  # Seconds, LLM retries included
                 "bm25_threshold": 0.7,
                 "normalization_factor": 15.0  # For BM25 score normalization
             },
             "speech_clarity": {
                 "weight": 0.20,
                 "enabled": True,
+                "component_timeout": 30,
                 "filler_words": [
                     "um", "uh", "er", "ah", "like", "you know", "sort of", "kind of",
                     "actually", "basically", "literally", "obviously", "seriously",
@@ -59,6 +62,7 @@ class AdvancedScoringService:
             "objection_handling": {
                 "weight": 0.20,
                 "enabled": True,
+                "component_timeout": 180,
                 "effectiveness_weight": 0.85,  # 85% for handling quality
                 "timing_weight": 0.15,  # 15% for response time
                 "sbert_objection_threshold": 0.7,  # Similarity threshold for objection detection
@@ -87,6 +91,10 @@ class AdvancedScoringService:
                 "weight": 0.15,
                 "enabled": True,
                 "audio_required": True,  # Only works with audio files
+                # Outlasts the download and the DSP pool's own timeout, so
+                # an overrunning pitch job is stopped by the pool first
+                "component_timeout":
+                HTTP_TOTAL_TIMEOUT_SECONDS + AUDIO_DSP_TIMEOUT_SECONDS + 10,
                 # Pitch variance scoring thresholds (standard deviation)
                 "scoring_thresholds": {
                     "low_deviation": 50.0,    # Below this = 100% score
@@ -104,6 +112,15 @@ class AdvancedScoringService:
                 "sample_rate": 16000,  # Default sample rate for processing
                 "hop_length": 256,     # Frame hop length for WORLD analysis
                 "frame_period": 5.0,   # Frame period in milliseconds
+                # Analyse agent speech in a few concatenated blocks at a
+                # reduced rate instead of running pyworld once per segment.
+                # Off until scripts.benchmark_pitch_variance shows score
+                # parity on production recordings
+                "vectorized_pitch": False,
+                "analysis_sample_rate": 8000,  # Well above 2 * max_f0
+                "pitch_block_seconds": 30.0,
+                "pitch_join_guard_ms": 50.0,  # F0 frames dropped at splices
+                "dio_speed": 2,        # DIO internal decimation (1-12)
                 # Voice filtering parameters
                 "min_f0": 70.0,        # Minimum F0 (pitch) in Hz
                 "max_f0": 400.0,       # Maximum F0 (pitch) in Hz
@@ -139,7 +156,8 @@ class AdvancedScoringService:
                 **Important**: Provide ONLY a numeric score between 0 and 100. Do not include any explanation or additional text.
                 """,
                 "retry_attempts": 3,
-                "timeout": 30,
+                "timeout": 30,  # Per LLM call
+                "component_timeout": 120,
                 "default_score": 50.0  # Fallback score if analysis fails
             }
         },
@@ -154,6 +172,10 @@ class AdvancedScoringService:
         }
     }
 
+    CONFIDENCE_COMPONENTS = ("information_accuracy", "speech_clarity",
+                             "objection_handling", "tone_volume",
+                             "consistency")
+
     def __init__(self):
         self.db = Database()
         # Download required NLTK data
@@ -165,7 +187,16 @@ class AdvancedScoringService:
             nltk.download('stopwords')
         logger.info("AdvancedScoringService initialized.")
 
-    async def calculate_confidence_score(self, original_script: List[Dict], transcript: str, user_simulation_progress_id: str, audio_url: Optional[str] = None, transcript_object: Optional[List[Dict]] = None, simulation_type: str = "audio") -> Dict[str, float]:
+    async def warm_up(self) -> None:
+        """Embed the objection patterns before the first job needs them"""
+        try:
+            await embedding_client.embed_static(
+                self.SCORING_CONFIG["confidence"]["objection_handling"]["objection_patterns"])
+        except Exception as e:
+            # Retried lazily by the first objection detection
+            logger.warning(f"Failed to pre-embed objection patterns: {str(e)}")
+
+    async def calculate_confidence_score(self, original_script: List[Dict], transcript: str, user_simulation_progress_id: str, audio_url: Optional[str] = None, transcript_object: Optional[List[Dict]] = None, simulation_type: str = "audio", simulation_id: Optional[str] = None) -> Dict[str, float]:
         """
         Calculate overall confidence score based on multiple components
         This method is designed to be called asynchronously without blocking the main workflow
@@ -177,6 +208,7 @@ class AdvancedScoringService:
             audio_url: Optional URL to audio file for future analysis
             transcript_object: Optional transcript object with timing information (for audio simulations)
             simulation_type: Type of simulation ("audio", "chat", "visual-chat", etc.)
+            simulation_id: Simulation the script belongs to, for caching its BM25 index
 
         Returns:
             Dictionary containing component scores and total confidence score
@@ -199,47 +231,39 @@ class AdvancedScoringService:
         try:
             logger.info(f"Starting confidence score calculation for progress ID: {user_simulation_progress_id}")
 
-            # Calculate information accuracy score (30%)
-            info_accuracy_score = await self._calculate_information_accuracy(original_script, transcript)
-
-            # Calculate speech clarity score (20%)
-            speech_clarity_score = 0.0
-            if self.SCORING_CONFIG["confidence"]["speech_clarity"]["enabled"]:
-                speech_clarity_score = await self._calculate_speech_clarity(transcript, transcript_object, simulation_type)
-
-            # Calculate objection handling score (20%)
-            objection_handling_score = 0.0
-            if self.SCORING_CONFIG["confidence"]["objection_handling"]["enabled"]:
-                objection_handling_score = await self._calculate_objection_handling(
-                    original_script, transcript, transcript_object, simulation_type
-                )
-
-            # Calculate tone and volume score (15%)
-            tone_volume_score = 0.0
-            if (self.SCORING_CONFIG["confidence"]["tone_volume"]["enabled"] and 
-                simulation_type == "audio" and audio_url):
-                tone_volume_score = await self._calculate_tone_volume(audio_url, transcript_object)
-
-            # Calculate consistency score (15%)
-            consistency_score = 0.0
-            if self.SCORING_CONFIG["confidence"]["consistency"]["enabled"]:
-                consistency_score = await self._calculate_consistency(original_script, transcript)
-
-            # Calculate total confidence score with all implemented components
-            scores = {
-                "information_accuracy": info_accuracy_score,
-                "speech_clarity": speech_clarity_score,
-                "objection_handling": objection_handling_score,
-                "tone_volume": tone_volume_score,
-                "consistency": consistency_score,
-                "total_confidence": (
-                    info_accuracy_score * self.SCORING_CONFIG["confidence"]["information_accuracy"]["weight"] +
-                    speech_clarity_score * self.SCORING_CONFIG["confidence"]["speech_clarity"]["weight"] +
-                    objection_handling_score * self.SCORING_CONFIG["confidence"]["objection_handling"]["weight"] +
-                    tone_volume_score * self.SCORING_CONFIG["confidence"]["tone_volume"]["weight"] +
-                    consistency_score * self.SCORING_CONFIG["confidence"]["consistency"]["weight"]
-                )
+            # The components are independent, so run them concurrently: the
+            # wall-clock time is that of the slowest one, and one that fails
+            # or overruns its budget falls back to its failure score
+            confidence_config = self.SCORING_CONFIG["confidence"]
+            components = {
+                "information_accuracy":
+                self._calculate_information_accuracy(original_script, transcript,
+                                                     simulation_id)
             }
+            if confidence_config["speech_clarity"]["enabled"]:
+                components["speech_clarity"] = self._calculate_speech_clarity(
+                    transcript, transcript_object, simulation_type)
+            if confidence_config["objection_handling"]["enabled"]:
+                components["objection_handling"] = self._calculate_objection_handling(
+                    original_script, transcript, transcript_object, simulation_type)
+            if (confidence_config["tone_volume"]["enabled"] and
+                    simulation_type == "audio" and audio_url):
+                components["tone_volume"] = self._calculate_tone_volume(
+                    audio_url, transcript_object)
+            if confidence_config["consistency"]["enabled"]:
+                components["consistency"] = self._calculate_consistency(
+                    original_script, transcript)
+
+            results = await asyncio.gather(*(
+                self._run_component(name, coroutine)
+                for name, coroutine in components.items()))
+
+            # Disabled components score 0, as before
+            scores = {name: 0.0 for name in self.CONFIDENCE_COMPONENTS}
+            scores.update(zip(components, results))
+            scores["total_confidence"] = sum(
+                scores[name] * confidence_config[name]["weight"]
+                for name in self.CONFIDENCE_COMPONENTS)
 
             # Store the scores in the database asynchronously
             await self._store_confidence_scores(user_simulation_progress_id, scores)
@@ -254,6 +278,25 @@ class AdvancedScoringService:
             await self._store_error(user_simulation_progress_id, f"Confidence score calculation failed: {str(e)}")
             return self._get_default_scores()
 
+    async def _run_component(self, name: str, coroutine) -> float:
+        """Await one confidence component within its time budget
+
+        A component that raises or exceeds its ``component_timeout`` scores
+        what it returns when it fails on its own: its ``default_score`` if it
+        has one, otherwise 0.
+        """
+        config = self.SCORING_CONFIG["confidence"][name]
+        timeout = config["component_timeout"]
+        try:
+            return await asyncio.wait_for(coroutine, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Confidence component {name} exceeded {timeout}s; "
+                           f"using its fallback score")
+        except Exception as e:
+            logger.error(f"Confidence component {name} failed: {str(e)}",
+                         exc_info=True)
+        return config.get("default_score", 0.0)
+
     def _get_default_scores(self) -> Dict[str, float]:
         """Return default scores when calculation fails"""
         return {
@@ -265,6 +308,15 @@ class AdvancedScoringService:
             "total_confidence": 0.0
         }
 
+    _stop_word_set = None
+
+    @classmethod
+    def _stop_words(cls) -> set:
+        # stopwords.words() re-reads the corpus file on every call
+        if cls._stop_word_set is None:
+            cls._stop_word_set = set(stopwords.words('english'))
+        return cls._stop_word_set
+
     def _preprocess_text(self, text: str) -> List[str]:
         """
         Preprocess text for BM25 scoring
@@ -276,7 +328,7 @@ class AdvancedScoringService:
             # Tokenize
             tokens = word_tokenize(text.lower())
             # Remove stopwords and punctuation
-            stop_words = set(stopwords.words('english'))
+            stop_words = self._stop_words()
             min_length = self.SCORING_CONFIG["bm25"]["min_token_length"]
             tokens = [token for token in tokens 
                      if token.isalnum() 
@@ -287,13 +339,13 @@ class AdvancedScoringService:
             logger.error(f"Error preprocessing text: {str(e)}", exc_info=True)
             return []
 
-    async def _calculate_information_accuracy(self, original_script: List[Dict], transcript: str) -> float:
+    async def _calculate_information_accuracy(self, original_script: List[Dict], transcript: str, simulation_id: Optional[str] = None) -> float:
         """
         Calculate information accuracy score using BM25 and LLM
         """
         try:
             # First try BM25 matching
-            bm25_score = await self._calculate_bm25_score(original_script, transcript)
+            bm25_score = await self._calculate_bm25_score(original_script, transcript, simulation_id)
 
             # If BM25 score is below threshold, use LLM
             if bm25_score < self.SCORING_CONFIG["confidence"]["information_accuracy"]["bm25_threshold"]:
@@ -364,9 +416,10 @@ class AdvancedScoringService:
             for attempt in range(retry_attempts):
                 try:
                     timeout_config = aiohttp.ClientTimeout(total=timeout)
-                    async with aiohttp.ClientSession(timeout=timeout_config) as session:
+                    async with http_clients.session("qwen") as session:
                         async with session.post(
                             QWEN_API_URL,
+                            timeout=timeout_config,
                             json={"message": prompt},
                             headers={"Content-Type": "application/json"}
                         ) as response:
@@ -590,32 +643,21 @@ class AdvancedScoringService:
             # Prepare sentences for batch comparison
             customer_sentences = [s['content'] for s in customer_segments]
 
-            # Use SBERT batch similarity to compare with objection patterns
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    SBERT_BATCH_SIMILARITY_URL,
-                    json={
-                        "sentences1": customer_sentences,
-                        "sentences2": objection_patterns
-                    },
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        similarities = result.get("similarities", [])
-
-                        # Check each customer sentence for objections
-                        for i, sentence_similarities in enumerate(similarities):
-                            max_similarity = max(sentence_similarities)
-                            if max_similarity > threshold:
-                                objection_segment = customer_segments[i].copy()
-                                objection_segment['similarity_score'] = max_similarity
-                                objection_segment['matched_pattern'] = objection_patterns[
-                                    sentence_similarities.index(max_similarity)
-                                ]
-                                objections.append(objection_segment)
-                    else:
-                        logger.warning(f"SBERT API returned status {response.status}")
+            # Pattern embeddings are cached per process; customer sentences
+            # are batched with other jobs' and compared locally
+            pattern_vectors = await embedding_client.embed_static(objection_patterns)
+            sentence_vectors = await embedding_client.embed(customer_sentences)
+            similarities = sentence_vectors @ pattern_vectors.T
+
+            # Check each customer sentence for objections
+            best_patterns = similarities.argmax(axis=1)
+            for i, pattern_index in enumerate(best_patterns):
+                max_similarity = float(similarities[i, pattern_index])
+                if max_similarity > threshold:
+                    objection_segment = customer_segments[i].copy()
+                    objection_segment['similarity_score'] = max_similarity
+                    objection_segment['matched_pattern'] = objection_patterns[pattern_index]
+                    objections.append(objection_segment)
 
             return objections
 
@@ -714,9 +756,10 @@ class AdvancedScoringService:
             for attempt in range(retry_attempts):
                 try:
                     timeout_config = aiohttp.ClientTimeout(total=timeout)
-                    async with aiohttp.ClientSession(timeout=timeout_config) as session:
+                    async with http_clients.session("qwen") as session:
                         async with session.post(
                             QWEN_API_URL,
+                            timeout=timeout_config,
                             json={"message": prompt},
                             headers={"Content-Type": "application/json"}
                         ) as response:
@@ -835,31 +878,19 @@ class AdvancedScoringService:
             Tone and volume score (0-100)
         """
         try:
-            # Download and process audio file
-            audio_file_path = await self._download_audio_file(audio_url)
-
-            # Load audio with librosa
-            y, sr = librosa.load(audio_file_path, sr=self.SCORING_CONFIG["confidence"]["tone_volume"]["sample_rate"])
+            # Cached locally; re-scoring a call doesn't download it again
+            audio_file_path = await audio_cache.fetch(audio_url)
 
-            # Extract agent speech segments if transcript object is available
-            agent_segments = []
-            if transcript_object:
-                agent_segments = self._extract_agent_speech_segments(transcript_object, len(y), sr)
-
-            # Calculate pitch variance for agent speech
-            if agent_segments:
-                pitch_variance = await self._calculate_agent_pitch_variance(y, sr, agent_segments)
-            else:
-                # Analyze entire audio if no transcript timing available
-                pitch_variance = await self._calculate_pitch_variance(y, sr)
+            # librosa decoding and pyworld F0 extraction are CPU-bound; run
+            # them in the DSP process pool so the event loop stays free
+            pitch_variance = await dsp_pool.run(
+                analyze_pitch_variance, audio_file_path,
+                self.SCORING_CONFIG["confidence"]["tone_volume"],
+                transcript_object)
 
             # Convert variance to score
             score = self._variance_to_score(pitch_variance)
 
-            # Clean up temporary file
-            if os.path.exists(audio_file_path):
-                os.remove(audio_file_path)
-
             logger.debug(f"Tone and volume: pitch variance = {pitch_variance:.2f}, score = {score:.2f}")
             return score
 
@@ -867,173 +898,6 @@ class AdvancedScoringService:
             logger.error(f"Error calculating tone and volume: {str(e)}", exc_info=True)
             return 0.0
 
-    async def _download_audio_file(self, audio_url: str) -> str:
-        """
-        Download audio file from URL to temporary location
-
-        Args:
-            audio_url: URL of the audio file
-
-        Returns:
-            Path to temporary audio file
-        """
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp:
-                temp_path = tmp.name
-
-            # Download audio file
-            async with aiohttp.ClientSession() as session:
-                async with session.get(audio_url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        with open(temp_path, 'wb') as f:
-                            f.write(content)
-                        return temp_path
-                    else:
-                        raise HTTPException(status_code=response.status, detail="Failed to download audio file")
-
-        except Exception as e:
-            logger.error(f"Error downloading audio file: {str(e)}", exc_info=True)
-            raise
-
-    def _extract_agent_speech_segments(self, transcript_object: List[Dict], audio_length_samples: int, sample_rate: int) -> List[tuple]:
-        """
-        Extract time segments where agent/trainee is speaking
-
-        Args:
-            transcript_object: Transcript with timing information
-            audio_length_samples: Total length of audio in samples
-            sample_rate: Audio sample rate
-
-        Returns:
-            List of (start_sample, end_sample) tuples for agent speech
-        """
-        try:
-            agent_segments = []
-
-            for segment in transcript_object:
-                if segment.get("role", "").lower() in ["agent", "trainee"]:
-                    words = segment.get("words", [])
-                    if words:
-                        # Get start and end times for this segment
-                        start_time = words[0].get("start", 0)
-                        end_time = words[-1].get("end", 0)
-
-                        # Convert to sample indices
-                        start_sample = int(start_time * sample_rate)
-                        end_sample = int(end_time * sample_rate)
-
-                        # Ensure within bounds
-                        start_sample = max(0, start_sample)
-                        end_sample = min(audio_length_samples - 1, end_sample)
-
-                        if start_sample < end_sample:
-                            agent_segments.append((start_sample, end_sample))
-
-            return agent_segments
-
-        except Exception as e:
-            logger.error(f"Error extracting agent speech segments: {str(e)}", exc_info=True)
-            return []
-
-    async def _calculate_agent_pitch_variance(self, y: np.ndarray, sr: int, agent_segments: List[tuple]) -> float:
-        """
-        Calculate pitch variance for agent speech segments
-
-        Args:
-            y: Audio signal
-            sr: Sample rate
-            agent_segments: List of (start, end) sample indices for agent speech
-
-        Returns:
-            Pitch variance (standard deviation)
-        """
-        try:
-            all_f0_values = []
-            config = self.SCORING_CONFIG["confidence"]["tone_volume"]
-
-            for start_sample, end_sample in agent_segments:
-                # Extract audio segment
-                segment = y[start_sample:end_sample]
-
-                if len(segment) > 0:
-                    # Calculate pitch for this segment
-                    f0, _ = self._extract_pitch_pyworld(segment, sr)
-
-                    # Filter out unvoiced frames and outliers
-                    valid_f0 = f0[(f0 > config["min_f0"]) & (f0 < config["max_f0"])]
-
-                    if len(valid_f0) > 0:
-                        all_f0_values.extend(valid_f0)
-
-            if len(all_f0_values) > 1:
-                return float(np.std(all_f0_values))
-            else:
-                logger.warning("No valid pitch values found in agent speech")
-                return 0.0
-
-        except Exception as e:
-            logger.error(f"Error calculating agent pitch variance: {str(e)}", exc_info=True)
-            return 0.0
-
-    async def _calculate_pitch_variance(self, y: np.ndarray, sr: int) -> float:
-        """
-        Calculate pitch variance for entire audio signal
-
-        Args:
-            y: Audio signal
-            sr: Sample rate
-
-        Returns:
-            Pitch variance (standard deviation)
-        """
-        try:
-            config = self.SCORING_CONFIG["confidence"]["tone_volume"]
-
-            # Extract pitch using pyworld
-            f0, _ = self._extract_pitch_pyworld(y, sr)
-
-            # Filter out unvoiced frames and outliers
-            valid_f0 = f0[(f0 > config["min_f0"]) & (f0 < config["max_f0"])]
-
-            if len(valid_f0) > 1:
-                return float(np.std(valid_f0))
-            else:
-                logger.warning("No valid pitch values found in audio")
-                return 0.0
-
-        except Exception as e:
-            logger.error(f"Error calculating pitch variance: {str(e)}", exc_info=True)
-            return 0.0
-
-    def _extract_pitch_pyworld(self, y: np.ndarray, sr: int) -> tuple:
-        """
-        Extract pitch (F0) using pyworld
-
-        Args:
-            y: Audio signal
-            sr: Sample rate
-
-        Returns:
-            Tuple of (f0, time_axis)
-        """
-        try:
-            config = self.SCORING_CONFIG["confidence"]["tone_volume"]
-
-            # Convert to double precision for pyworld
-            x = y.astype(np.float64)
-
-            # Perform pyworld analysis
-            _f0, t = pw.dio(x, sr, frame_period=config["frame_period"])  # Raw F0 estimation
-            f0 = pw.stonemask(x, _f0, t, sr)  # Refined F0 estimation
-
-            return f0, t
-
-        except Exception as e:
-            logger.error(f"Error extracting pitch with pyworld: {str(e)}", exc_info=True)
-            return np.array([]), np.array([])
-
     def _variance_to_score(self, variance: float) -> float:
         """
         Convert pitch variance to score based on thresholds
@@ -1181,9 +1045,19 @@ class AdvancedScoringService:
             logger.error(f"Error applying speech clarity scale: {str(e)}", exc_info=True)
             return 0.0
 
-    async def _calculate_bm25_score(self, original_script: List[Dict], transcript: str) -> float:
+    def _build_bm25(self, original_sentences: List[str]) -> Optional[BM25Okapi]:
+        """BM25 model over the preprocessed script sentences, if any"""
+        original_tokens = [self._preprocess_text(sent) for sent in original_sentences if sent.strip()]
+        if not original_tokens:
+            return None
+        return BM25Okapi(original_tokens)
+
+    async def _calculate_bm25_score(self, original_script: List[Dict], transcript: str, simulation_id: Optional[str] = None) -> float:
         """
         Calculate BM25 similarity score between original script and transcript
+
+        The BM25 model only depends on the script, so it is cached per
+        simulation and script version and shared by every attempt.
         """
         try:
             # Extract script sentences, handling potential nested data structures
@@ -1198,16 +1072,15 @@ class AdvancedScoringService:
                 else:
                     original_sentences.append(str(item))
 
-            # Preprocess original script sentences
-            original_tokens = [self._preprocess_text(sent) for sent in original_sentences if sent.strip()]
+            bm25 = script_index_cache.get_or_build(
+                "bm25", simulation_id,
+                script_index_cache.script_hash(original_sentences),
+                lambda: self._build_bm25(original_sentences))
 
-            if not original_tokens:
+            if bm25 is None:
                 logger.warning("No valid original script sentences found")
                 return 0.0
 
-            # Create BM25 model
-            bm25 = BM25Okapi(original_tokens)
-
             # Split transcript into lines and preprocess
             transcript_lines = [line.strip() for line in transcript.split('\n') if line.strip()]
 
@@ -1283,9 +1156,10 @@ class AdvancedScoringService:
             for attempt in range(retry_attempts):
                 try:
                     timeout_config = aiohttp.ClientTimeout(total=timeout)
-                    async with aiohttp.ClientSession(timeout=timeout_config) as session:
+                    async with http_clients.session("qwen") as session:
                         async with session.post(
                             QWEN_API_URL,
+                            timeout=timeout_config,
                             json={"message": prompt},
                             headers={"Content-Type": "application/json"}
                         ) as response:
@@ -2,6 +2,8 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from bson import ObjectId
 from infrastructure.database import Database
+from infrastructure.loaders import AssignedPlanLoader
+from infrastructure.pagination import KeysetPage, fetch_page, is_cursor_mode
 from api.schemas.requests import (CreateAssignmentRequest, PaginationParams)
 from api.schemas.responses import (AssignmentData, FetchAssignmentsResponse,
                                    FetchAssignedPlansResponse,
@@ -267,9 +269,6 @@ class AssignmentService:
                 # Default sort by lastModifiedAt
                 sort_options.append(("lastModifiedAt", -1))
 
-            # Get total count for pagination metadata
-            total_count = await self.db.assignments.count_documents(query)
-
             # Calculate pagination
             skip = 0
             limit = 50  # Default limit
@@ -282,12 +281,19 @@ class AssignmentService:
             logger.debug(f"Sort options: {sort_options}")
             logger.debug(f"Skip: {skip}, Limit: {limit}")
 
-            # Execute the query with pagination
-            cursor = self.db.assignments.find(query).sort(sort_options).skip(
-                skip).limit(limit)
+            # Fetch the page and its total in as few scans as possible
+            keyset = None
+            if is_cursor_mode(pagination):
+                try:
+                    keyset = KeysetPage(sort_options, pagination.cursor)
+                except ValueError as ve:
+                    raise HTTPException(status_code=400, detail=str(ve))
+            page = await fetch_page(self.db.assignments, query, sort_options,
+                                    skip, limit, keyset)
+            total_count = page.total_count
             assignments = []
 
-            async for doc in cursor:
+            for doc in page.docs:
                 team_ids = []
                 if doc.get("teamId"):
                     for team in doc["teamId"]:
@@ -314,7 +320,14 @@ class AssignmentService:
             logger.info(
                 f"Fetched {len(assignments)} assignment(s) from the database. Total count: {total_count}"
             )
-            return {"assignments": assignments, "total_count": total_count}
+            return {
+                "assignments": assignments,
+                "total_count": total_count,
+                "total_count_exact": page.total_exact,
+                "next_cursor": keyset.next_cursor if keyset else None
+            }
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error(f"Error fetching assignments: {str(e)}",
                          exc_info=True)
@@ -395,9 +408,6 @@ class AssignmentService:
                 # Default sort by lastModifiedAt
                 sort_options.append(("lastModifiedAt", -1))
 
-            # Get total count for pagination metadata
-            total_count = await self.db.assignments.count_documents(query)
-
             # Apply pagination to the query
             skip = 0
             limit = 50  # Default limit
@@ -410,9 +420,21 @@ class AssignmentService:
             logger.debug(f"Sort options: {sort_options}")
             logger.debug(f"Skip: {skip}, Limit: {limit}")
 
-            # Execute the paginated query
-            assignments = await self.db.assignments.find(query).sort(
-                sort_options).skip(skip).limit(limit).to_list(None)
+            # Fetch the page and its total in as few scans as possible
+            keyset = None
+            if is_cursor_mode(pagination):
+                try:
+                    keyset = KeysetPage(sort_options, pagination.cursor)
+                except ValueError as ve:
+                    raise HTTPException(status_code=400, detail=str(ve))
+            page = await fetch_page(self.db.assignments, query, sort_options,
+                                    skip, limit, keyset)
+            total_count = page.total_count
+            assignments = page.docs
+
+            # Resolve the whole page graph up front with one query per collection
+            loader = AssignedPlanLoader(self.db, [user_id], workspace)
+            await loader.load(assignments)
 
             training_plans = []
             modules = []
@@ -422,12 +444,8 @@ class AssignmentService:
             for assignment in assignments:
                 logger.debug(f"Processing assignment: {assignment}")
                 if assignment["type"] == "TrainingPlan":
-                    training_plan = await self.db.training_plans.find_one({
-                        "_id":
-                        ObjectId(assignment["id"]),
-                        "workspace":
-                        workspace
-                    })
+                    training_plan = loader.training_plans.get(
+                        assignment["id"])
                     if training_plan:
                         plan_modules = []
                         plan_total_simulations = 0
@@ -437,7 +455,8 @@ class AssignmentService:
                             if added_obj["type"] == "module":
                                 module_details = await self._get_module_details(
                                     added_obj["id"], assignment["endDate"],
-                                    str(assignment["_id"]), user_id, workspace)
+                                    str(assignment["_id"]), user_id, workspace,
+                                    loader)
                                 if module_details:
                                     plan_modules.append(module_details)
                                     plan_total_simulations += module_details.total_simulations
@@ -449,7 +468,8 @@ class AssignmentService:
                             elif added_obj["type"] == "simulation":
                                 sim_details = await self._get_simulation_details(
                                     added_obj["id"], assignment["endDate"],
-                                    str(assignment["_id"]), user_id, workspace)
+                                    str(assignment["_id"]), user_id, workspace,
+                                    loader)
                                 if sim_details:
                                     plan_modules.append(
                                         ModuleDetails(
@@ -491,14 +511,14 @@ class AssignmentService:
                 elif assignment["type"] == "Module":
                     module_details = await self._get_module_details(
                         assignment["id"], assignment["endDate"],
-                        str(assignment["_id"]), user_id, workspace)
+                        str(assignment["_id"]), user_id, workspace, loader)
                     if module_details:
                         modules.append(module_details)
                         total_simulations += module_details.total_simulations
                 elif assignment["type"] == "Simulation":
                     sim_details = await self._get_simulation_details(
                         assignment["id"], assignment["endDate"],
-                        str(assignment["_id"]), user_id, workspace)
+                        str(assignment["_id"]), user_id, workspace, loader)
                     if sim_details:
                         # Consolidate duplicates by assignment with precedence
                         existing_index = next(
@@ -547,7 +567,11 @@ class AssignmentService:
                     stats=stats,
                 ),
                 "total_count":
-                total_count
+                total_count,
+                "total_count_exact":
+                page.total_exact,
+                "next_cursor":
+                keyset.next_cursor if keyset else None
             }
         except HTTPException as he:
             raise he
@@ -559,30 +583,43 @@ class AssignmentService:
                 detail=f"Error fetching assigned plans: {str(e)}")
 
     async def _get_simulation_details(
-            self, sim_id: str, due_date: str, assignment_id: str, user_id: str,
-            workspace: str) -> SimulationDetails | None:
+            self,
+            sim_id: str,
+            due_date: str,
+            assignment_id: str,
+            user_id: str,
+            workspace: str,
+            loader: Optional[AssignedPlanLoader] = None
+    ) -> SimulationDetails | None:
         """Helper method to get simulation details with status precedence"""
         logger.debug(f"Fetching simulation details for sim_id={sim_id}")
         try:
-            sim = await self.db.simulations.find_one({
-                "_id": ObjectId(sim_id),
-                "workspace": workspace
-            })
+            if loader:
+                sim = loader.simulations.get(sim_id)
+            else:
+                sim = await self.db.simulations.find_one({
+                    "_id": ObjectId(sim_id),
+                    "workspace": workspace
+                })
             if not sim:
                 logger.warning(f"Simulation {sim_id} not found.")
                 return None
 
             # Fetch **all** user simulation progress rows for this sim + assignment
-            progress_list = await self.db.user_sim_progress.find({
-                "userId":
-                user_id,
-                "assignmentId":
-                assignment_id,
-                "simulationId":
-                sim_id,
-                "workspace":
-                workspace
-            }).to_list(None)
+            if loader:
+                progress_list = loader.progress.get(user_id, assignment_id,
+                                                     sim_id)
+            else:
+                progress_list = await self.db.user_sim_progress.find({
+                    "userId":
+                    user_id,
+                    "assignmentId":
+                    assignment_id,
+                    "simulationId":
+                    sim_id,
+                    "workspace":
+                    workspace
+                }).to_list(None)
 
             # Determine status with precedence: completed > in_progress > not_started
             status = "not_started"
@@ -628,15 +665,23 @@ class AssignmentService:
                          exc_info=True)
             return None
 
-    async def _get_module_details(self, module_id: str, due_date: str,
-                                  assignment_id: str, user_id: str,
-                                  workspace: str) -> ModuleDetails:
+    async def _get_module_details(
+            self,
+            module_id: str,
+            due_date: str,
+            assignment_id: str,
+            user_id: str,
+            workspace: str,
+            loader: Optional[AssignedPlanLoader] = None) -> ModuleDetails:
         logger.debug(f"Fetching module details for module_id={module_id}")
         try:
-            module = await self.db.modules.find_one({
-                "_id": ObjectId(module_id),
-                "workspace": workspace
-            })
+            if loader:
+                module = loader.modules.get(module_id)
+            else:
+                module = await self.db.modules.find_one({
+                    "_id": ObjectId(module_id),
+                    "workspace": workspace
+                })
             if not module:
                 logger.warning(f"Module {module_id} not found.")
                 return None
@@ -646,7 +691,8 @@ class AssignmentService:
 
             for sim_id in module.get("simulationIds", []):
                 sim_details = await self._get_simulation_details(
-                    sim_id, due_date, assignment_id, user_id, workspace)
+                    sim_id, due_date, assignment_id, user_id, workspace,
+                    loader)
                 if sim_details:
                     module_simulations.append(sim_details)
                     sim_statuses.append(sim_details.status)
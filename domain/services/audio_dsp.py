@@ -0,0 +1,274 @@
+"""CPU-bound audio analysis for AdvancedScoringService
+
+Runs inside the ``dsp_pool`` worker processes, so every entry point is a
+module-level function taking plain, picklable arguments.
+"""
+from typing import Dict, List, Optional
+
+import librosa
+import numpy as np
+import pyworld as pw
+
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def analyze_pitch_variance(audio_path: str, config: Dict,
+                           transcript_object: Optional[List[Dict]]) -> float:
+    """Load an audio file and return the pitch variance of the agent
+
+    Args:
+        audio_path: Local path of the downloaded recording
+        config: ``tone_volume`` scoring config
+        transcript_object: Transcript with timing information to focus on
+            agent speech; the whole recording is analysed without it
+
+    Returns:
+        Pitch variance (standard deviation of F0 in Hz)
+    """
+    vectorized = config.get("vectorized_pitch", False)
+    # The vectorized path analyses at analysis_sample_rate; decode straight
+    # to it instead of resampling twice
+    y, sr = librosa.load(audio_path,
+                         sr=config.get("analysis_sample_rate",
+                                       config["sample_rate"])
+                         if vectorized else config["sample_rate"])
+
+    agent_segments = []
+    if transcript_object:
+        agent_segments = extract_agent_speech_segments(transcript_object,
+                                                       len(y), sr)
+
+    if vectorized:
+        return calculate_pitch_variance_vectorized(
+            y, sr, agent_segments or [(0, len(y))], config)
+    if agent_segments:
+        return calculate_agent_pitch_variance(y, sr, agent_segments, config)
+    # Analyze entire audio if no transcript timing available
+    return calculate_pitch_variance(y, sr, config)
+
+
+def extract_agent_speech_segments(transcript_object: List[Dict],
+                                  audio_length_samples: int,
+                                  sample_rate: int) -> List[tuple]:
+    """
+    Extract time segments where agent/trainee is speaking
+
+    Args:
+        transcript_object: Transcript with timing information
+        audio_length_samples: Total length of audio in samples
+        sample_rate: Audio sample rate
+
+    Returns:
+        List of (start_sample, end_sample) tuples for agent speech
+    """
+    try:
+        agent_segments = []
+
+        for segment in transcript_object:
+            if segment.get("role", "").lower() in ["agent", "trainee"]:
+                words = segment.get("words", [])
+                if words:
+                    # Get start and end times for this segment
+                    start_time = words[0].get("start", 0)
+                    end_time = words[-1].get("end", 0)
+
+                    # Convert to sample indices
+                    start_sample = int(start_time * sample_rate)
+                    end_sample = int(end_time * sample_rate)
+
+                    # Ensure within bounds
+                    start_sample = max(0, start_sample)
+                    end_sample = min(audio_length_samples - 1, end_sample)
+
+                    if start_sample < end_sample:
+                        agent_segments.append((start_sample, end_sample))
+
+        return agent_segments
+
+    except Exception as e:
+        logger.error(f"Error extracting agent speech segments: {str(e)}",
+                     exc_info=True)
+        return []
+
+
+def calculate_agent_pitch_variance(y: np.ndarray, sr: int,
+                                   agent_segments: List[tuple],
+                                   config: Dict) -> float:
+    """
+    Calculate pitch variance for agent speech segments
+
+    Args:
+        y: Audio signal
+        sr: Sample rate
+        agent_segments: List of (start, end) sample indices for agent speech
+        config: ``tone_volume`` scoring config
+
+    Returns:
+        Pitch variance (standard deviation)
+    """
+    try:
+        all_f0_values = []
+
+        for start_sample, end_sample in agent_segments:
+            # Extract audio segment
+            segment = y[start_sample:end_sample]
+
+            if len(segment) > 0:
+                # Calculate pitch for this segment
+                f0, _ = extract_pitch_pyworld(segment, sr, config)
+
+                # Filter out unvoiced frames and outliers
+                valid_f0 = f0[(f0 > config["min_f0"]) & (f0 < config["max_f0"])]
+
+                if len(valid_f0) > 0:
+                    all_f0_values.extend(valid_f0)
+
+        if len(all_f0_values) > 1:
+            return float(np.std(all_f0_values))
+        else:
+            logger.warning("No valid pitch values found in agent speech")
+            return 0.0
+
+    except Exception as e:
+        logger.error(f"Error calculating agent pitch variance: {str(e)}",
+                     exc_info=True)
+        return 0.0
+
+
+def calculate_pitch_variance_vectorized(y: np.ndarray, sr: int,
+                                        agent_segments: List[tuple],
+                                        config: Dict) -> float:
+    """
+    Calculate pitch variance for agent speech in one sweep
+
+    The signal is downsampled once to ``analysis_sample_rate`` and the agent
+    segments are concatenated into blocks of at most ``pitch_block_seconds``,
+    so pyworld runs a handful of times with DIO's search band limited to
+    [min_f0, max_f0]. Blocks stay bounded because DIO's cost grows faster
+    than linearly with signal length. F0 frames within
+    ``pitch_join_guard_ms`` of a splice between segments are dropped, since
+    their analysis windows straddle two unrelated stretches of audio.
+
+    Args:
+        y: Audio signal
+        sr: Sample rate
+        agent_segments: List of (start, end) sample indices for agent speech
+        config: ``tone_volume`` scoring config
+
+    Returns:
+        Pitch variance (standard deviation)
+    """
+    try:
+        analysis_sr = config.get("analysis_sample_rate", sr)
+        min_f0, max_f0 = config["min_f0"], config["max_f0"]
+        if analysis_sr != sr:
+            y = librosa.resample(y, orig_sr=sr, target_sr=analysis_sr)
+        ratio = analysis_sr / sr
+        block_samples = int(config.get("pitch_block_seconds", 30) *
+                            analysis_sr)
+
+        guard = config.get("pitch_join_guard_ms", 0.0) / 1000.0
+
+        blocks, block, block_len = [], [], 0
+        for start_sample, end_sample in agent_segments:
+            segment = y[int(start_sample * ratio):int(end_sample * ratio)]
+            # Long monologues (or the whole recording) are split as well
+            for offset in range(0, len(segment), block_samples):
+                piece = segment[offset:offset + block_samples]
+                if block_len and block_len + len(piece) > block_samples:
+                    blocks.append(block)
+                    block, block_len = [], 0
+                block.append(piece)
+                block_len += len(piece)
+        if block_len:
+            blocks.append(block)
+
+        valid_f0 = []
+        for block in blocks:
+            # Splice points between consecutive pieces, in seconds
+            joins = np.cumsum([len(piece) for piece in block])[:-1] / analysis_sr
+            x = np.concatenate(block).astype(np.float64)
+            _f0, t = pw.dio(x,
+                            analysis_sr,
+                            f0_floor=min_f0,
+                            f0_ceil=max_f0,
+                            frame_period=config["frame_period"],
+                            speed=config.get("dio_speed", 1))
+            f0 = pw.stonemask(x, _f0, t, analysis_sr)
+            valid = (f0 > min_f0) & (f0 < max_f0)
+            if guard and len(joins):
+                nearest = np.abs(t[:, None] - joins[None, :]).min(axis=1)
+                valid &= nearest > guard
+            valid_f0.append(f0[valid])
+
+        valid_f0 = np.concatenate(valid_f0) if valid_f0 else np.array([])
+        if valid_f0.size > 1:
+            return float(valid_f0.std())
+        logger.warning("No valid pitch values found in agent speech")
+        return 0.0
+
+    except Exception as e:
+        logger.error(f"Error calculating vectorized pitch variance: {str(e)}",
+                     exc_info=True)
+        return 0.0
+
+
+def calculate_pitch_variance(y: np.ndarray, sr: int, config: Dict) -> float:
+    """
+    Calculate pitch variance for entire audio signal
+
+    Args:
+        y: Audio signal
+        sr: Sample rate
+        config: ``tone_volume`` scoring config
+
+    Returns:
+        Pitch variance (standard deviation)
+    """
+    try:
+        # Extract pitch using pyworld
+        f0, _ = extract_pitch_pyworld(y, sr, config)
+
+        # Filter out unvoiced frames and outliers
+        valid_f0 = f0[(f0 > config["min_f0"]) & (f0 < config["max_f0"])]
+
+        if len(valid_f0) > 1:
+            return float(np.std(valid_f0))
+        else:
+            logger.warning("No valid pitch values found in audio")
+            return 0.0
+
+    except Exception as e:
+        logger.error(f"Error calculating pitch variance: {str(e)}",
+                     exc_info=True)
+        return 0.0
+
+
+def extract_pitch_pyworld(y: np.ndarray, sr: int, config: Dict) -> tuple:
+    """
+    Extract pitch (F0) using pyworld
+
+    Args:
+        y: Audio signal
+        sr: Sample rate
+        config: ``tone_volume`` scoring config
+
+    Returns:
+        Tuple of (f0, time_axis)
+    """
+    try:
+        # Convert to double precision for pyworld
+        x = y.astype(np.float64)
+
+        # Perform pyworld analysis
+        _f0, t = pw.dio(x, sr, frame_period=config["frame_period"])  # Raw F0 estimation
+        f0 = pw.stonemask(x, _f0, t, sr)  # Refined F0 estimation
+
+        return f0, t
+
+    except Exception as e:
+        logger.error(f"Error extracting pitch with pyworld: {str(e)}",
+                     exc_info=True)
+        return np.array([]), np.array([])
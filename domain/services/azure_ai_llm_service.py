@@ -1,4 +1,6 @@
-from config import (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_KEY, AZURE_OPENAI_BASE_URL)
+import asyncio
+from config import (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_KEY, AZURE_OPENAI_BASE_URL,
+                    LLM_MAX_CONCURRENCY)
 from fastapi import HTTPException
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
@@ -12,16 +14,19 @@ from utils.logger import Logger
 logger = Logger.get_logger(__name__)
 
 class AzureAILLMService:
-    def __init__(self, system_prompt: str):
-        try:
-            logger.info("AzureAILLMService initialized.")
-            self.db = Database()
-            self.system_prompt = system_prompt
+    # One Kernel/AzureChatCompletion (and its connection pool) per process,
+    # shared by every instance; only the system prompt is per instance
+    _shared_client = None
+    _llm_slots: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def get_shared_client(cls):
+        if cls._shared_client is None:
             logger.debug("Initializing Semantic Kernel...")
-            self.kernel = Kernel()
+            kernel = Kernel()
 
             logger.debug("Setting up AzureChatCompletion service...")
-            self.chat_completion = AzureChatCompletion(
+            chat_completion = AzureChatCompletion(
                 service_id="azure_gpt4",
                 deployment_name=AZURE_OPENAI_DEPLOYMENT_NAME,
                 endpoint=AZURE_OPENAI_BASE_URL,
@@ -29,24 +34,39 @@ class AzureAILLMService:
                 api_version="2025-01-01-preview")
 
             logger.debug("Adding AzureChatCompletion to Kernel...")
-            self.kernel.add_service(self.chat_completion)
+            kernel.add_service(chat_completion)
             logger.info("AzureChatCompletion added to Kernel successfully.")
 
             logger.debug("Configuring execution settings...")
-            self.execution_settings = AzureChatPromptExecutionSettings(
+            execution_settings = AzureChatPromptExecutionSettings(
                 service_id="azure_gpt4",
                 ai_model_id=AZURE_OPENAI_DEPLOYMENT_NAME,
                 temperature=0.1,
                 top_p=1.0,
                 max_tokens=4096)
             logger.info("Execution settings configured successfully.")
+            cls._shared_client = (kernel, chat_completion, execution_settings)
+        return cls._shared_client
+
+    @classmethod
+    def get_llm_slots(cls) -> asyncio.Semaphore:
+        """Bounds concurrent chat completions per process"""
+        if cls._llm_slots is None:
+            cls._llm_slots = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        return cls._llm_slots
 
+    def __init__(self, system_prompt: str):
+        try:
+            self.db = Database()
+            self.system_prompt = system_prompt
+            self.kernel, self.chat_completion, self.execution_settings = \
+                self.get_shared_client()
         except Exception as e:
             logger.error(
                 "Error during Semantic Kernel or AzureChatCompletion setup.")
             logger.exception(e)
 
-        logger.info("AzureAILLMService initialized.")
+        logger.debug("AzureAILLMService initialized.")
     
     @property
     def system_prompt(self):
@@ -58,13 +78,25 @@ class AzureAILLMService:
         """Setter method for system_prompt"""
         self._system_prompt = _system_prompt
 
-    async def get_chat_completion(self, user_prompt: Optional[str] = None):
+    async def get_chat_completion(self, user_prompt: Optional[str] = None,
+                                  timeout: Optional[float] = None):
+        """Chat completion for ``user_prompt``
+
+        ``timeout`` bounds the completion call only; it starts once an LLM
+        slot is held, so time spent queued behind other calls doesn't count.
+        """
         try:
             history = ChatHistory()
             history.add_system_message(self.system_prompt)
             if user_prompt:
                 history.add_user_message(user_prompt)
-            return await self.chat_completion.get_chat_message_content(history, settings=self.execution_settings)
+            async with self.get_llm_slots():
+                return await asyncio.wait_for(
+                    self.chat_completion.get_chat_message_content(history, settings=self.execution_settings),
+                    timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Chat completion exceeded {timeout}s.")
+            raise HTTPException(status_code=504, detail="Chat completion timed out.")
         except Exception as e:
             logger.error("Error during chat completion.")
             logger.exception(e)
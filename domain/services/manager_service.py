@@ -74,6 +74,9 @@ class ManagerService:
         try:
             #assignmentWithUserAttemptsByAssignmentId = {}
             assignmentWithUserAttemptsByAssignmentId, unique_teams, pagination_params = await self.repository.fetch_assignments_by_training_entity(user_id, reporting_userIds, reporting_teamIds, type, filters, training_entity_filters, pagination)
+            # Per-user stats for the whole page, computed with a single progress aggregation
+            stats_by_assignment_user = await self.repository.get_training_entity_stats_bulk(
+                [assignment for assignment_attempts in assignmentWithUserAttemptsByAssignmentId.values() for assignment in assignment_attempts])
             training_plans = []
             modules = []
             simulations = []
@@ -98,7 +101,7 @@ class ManagerService:
                     assignment_type = assignment["type"]
                     if assignment["type"] == "TrainingPlan":
                         for userId in assignment['traineeId']:
-                            training_plan_user_stats = await self.repository.get_training_plan_stats(assignment, userId)
+                            training_plan_user_stats = stats_by_assignment_user.get((str(assignment["_id"]), userId))
                             if training_plan_user_stats:
                                 training_plans_by_user.append(training_plan_user_stats)
                                 if user_map.get(userId):
@@ -110,7 +113,7 @@ class ManagerService:
                                 training_plan_est_time = getattr(training_plan_user_stats, "est_time", 0)
                     elif assignment["type"] == "Module":
                         for userId in assignment['traineeId']:
-                            module_details = await self.repository.get_module_stats(assignment["id"], str(assignment["_id"]), userId, assignment["endDate"])
+                            module_details = stats_by_assignment_user.get((str(assignment["_id"]), userId))
                             if module_details:
                                 module_by_user_stats.append(module_details)
                                 if user_map.get(userId):
@@ -122,7 +125,7 @@ class ManagerService:
                                 module_est_time = getattr(module_details, "est_time", 0)
                     elif assignment["type"] == "Simulation":
                         for userId in assignment['traineeId']:
-                            sim_details = await self.repository.get_simulation_stats(assignment["id"], str(assignment["_id"]), userId, assignment["endDate"])
+                            sim_details = stats_by_assignment_user.get((str(assignment["_id"]), userId))
                             if sim_details:
                                 simulation_by_user_stats.append(sim_details)
                                 total_simulations += 1
@@ -2,6 +2,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from bson import ObjectId
 from infrastructure.database import Database
+from infrastructure.pagination import KeysetPage, fetch_page, is_cursor_mode
 from api.schemas.requests import (CreateModuleRequest, UpdateModuleRequest,
                                   CloneModuleRequest, PaginationParams)
 from api.schemas.responses import ModuleData, PaginationMetadata
@@ -325,9 +326,6 @@ class ModuleService:
                 # Default sort by lastModifiedAt
                 sort_options.append(("lastModifiedAt", -1))
 
-            # Get total count for pagination metadata
-            total_count = await self.db.modules.count_documents(query)
-
             # Calculate pagination
             skip = 0
             limit = 50  # Default limit
@@ -340,12 +338,19 @@ class ModuleService:
             logger.debug(f"Sort options: {sort_options}")
             logger.debug(f"Skip: {skip}, Limit: {limit}")
 
-            # Execute the query with pagination
-            cursor = self.db.modules.find(query).sort(sort_options).skip(
-                skip).limit(limit)
+            # Fetch the page and its total in as few scans as possible
+            keyset = None
+            if is_cursor_mode(pagination):
+                try:
+                    keyset = KeysetPage(sort_options, pagination.cursor)
+                except ValueError as ve:
+                    raise HTTPException(status_code=400, detail=str(ve))
+            page = await fetch_page(self.db.modules, query, sort_options,
+                                    skip, limit, keyset)
+            total_count = page.total_count
             modules = []
 
-            async for doc in cursor:
+            for doc in page.docs:
                 total_estimated_time = 0
                 for sim_id in doc.get("simulationIds", []):
                     try:
@@ -380,7 +385,14 @@ class ModuleService:
             logger.info(
                 f"Total modules fetched: {len(modules)}, Total count: {total_count}"
             )
-            return {"modules": modules, "total_count": total_count}
+            return {
+                "modules": modules,
+                "total_count": total_count,
+                "total_count_exact": page.total_exact,
+                "next_cursor": keyset.next_cursor if keyset else None
+            }
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error(f"Error fetching modules: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500,
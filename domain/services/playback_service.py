@@ -1,6 +1,7 @@
 from typing import List, Optional
 from domain.models.playback import SimulationAttemptModel, AttemptAnalyticsModel, SimulationAttemptDetailModel
 from infrastructure.database import Database
+from infrastructure.pagination import KeysetPage, fetch_page, is_cursor_mode
 from infrastructure.repositories.playback_repository import PlaybackRepository
 from domain.interfaces.playback_repository import IPlaybackRepository
 from bson import ObjectId
@@ -42,9 +43,6 @@ class PlaybackService:
                     query["$or"] = [{
                         "name": search_regex
                     }]
-            
-            # Get total count for pagination metadata
-            total_count = await self.db.user_sim_progress.count_documents(query)
 
             # Calculate pagination
             skip = 0
@@ -58,11 +56,18 @@ class PlaybackService:
             logger.debug(f"Query filter: {query}")
             logger.debug(f"Skip: {skip}, Limit: {limit}")
 
-            cursor = self.db.user_sim_progress.find(query).skip(
-                skip).limit(limit)
+            keyset = None
+            if is_cursor_mode(pagination):
+                try:
+                    keyset = KeysetPage([], pagination.cursor)
+                except ValueError as ve:
+                    raise HTTPException(status_code=400, detail=str(ve))
+            page = await fetch_page(self.db.user_sim_progress, query, [],
+                                    skip, limit, keyset)
+            total_count = page.total_count
             # attempts = await self.db.sim_attempts.find({"userId": user_id})
             attempts = []
-            async for doc in cursor:
+            for doc in page.docs:
                 attempts.append(
                     {
                         "id": doc.get("_id", ""),
@@ -118,7 +123,11 @@ class PlaybackService:
                         attemptCount=4
                     )
                 )
-            return AttemptsResponse(attempts=simulationsAttemps, total_attempts=total_count)
+            return AttemptsResponse(attempts=simulationsAttemps, total_attempts=total_count,
+                                    total_attempts_exact=page.total_exact,
+                                    next_cursor=keyset.next_cursor if keyset else None)
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error(f"Error fetching attempts for dashboard: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error fetching attempts for dashboard: {str(e)}")
@@ -165,7 +174,8 @@ class PlaybackService:
                         name="" if attemptObj.get("simulation") is None else attemptObj["simulation"].get("name", ""),
                         completedAt= '', # attemptObj.get("completedAt", ""),
                         type="" if attemptObj.get("simulation") is None else attemptObj["simulation"].get("type", ""),
-                        simLevel=simLevel or ""
+                        simLevel=simLevel or "",
+                        advancedScores=attemptObj.get("advancedScores")
                     )
             await self.repository.get_attempt_by_id(user_id, attempt_id)
             return attempt 
@@ -0,0 +1,115 @@
+import re
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict
+
+from bson import ObjectId
+
+from config import SCORING_JOBS_ENABLED
+from infrastructure.database import Database
+from infrastructure.job_queue import JobQueue
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+ATTEMPT_ANALYSIS_JOB = "attempt_analysis"
+
+
+class ScoringJobService:
+    """Enqueues and runs the heavy, non-blocking scoring of an attempt
+
+    The ``end_*`` paths keep the cheap keyword score inline and enqueue an
+    ``attempt_analysis`` job. The worker then runs the LLM contextual and
+    behavioural analysis and the advanced confidence score, stored under
+    ``advancedScores`` on the progress document and returned with the
+    attempt by ``POST /attempt/fetch``. Nothing is enqueued unless
+    ``SCORING_JOBS_ENABLED`` is set for a deployment running the worker.
+    """
+
+    def __init__(self):
+        self.db = Database()
+        self.queue = JobQueue()
+
+    async def enqueue_attempt_analysis(self, usersimulationprogress_id: str,
+                                       simulation_type: str) -> None:
+        if not SCORING_JOBS_ENABLED:
+            return
+        try:
+            await self.queue.enqueue(
+                ATTEMPT_ANALYSIS_JOB, {
+                    "usersimulationprogress_id": usersimulationprogress_id,
+                    "simulation_type": simulation_type
+                },
+                dedupe_key=f"{ATTEMPT_ANALYSIS_JOB}:{usersimulationprogress_id}")
+        except Exception as e:
+            # Ending the attempt must not fail because analysis can't queue
+            logger.error(f"Failed to enqueue attempt analysis for "
+                         f"{usersimulationprogress_id}: {str(e)}",
+                         exc_info=True)
+
+
+class ScoringJobHandlers:
+    """Job type -> coroutine, as run by ``python -m worker``"""
+
+    def __init__(self):
+        # librosa/pyworld/nltk are only loaded by the worker process
+        from domain.services.advanced_scoring_service import AdvancedScoringService
+        from domain.services.scoring_service import ScoringService
+
+        self.db = Database()
+        self.scoring_service = ScoringService()
+        self.advanced_scoring_service = AdvancedScoringService()
+        self.handlers: Dict[str, Callable[[Dict[str, Any]],
+                                          Awaitable[None]]] = {
+            ATTEMPT_ANALYSIS_JOB: self.run_attempt_analysis
+        }
+
+    async def run(self, job: Dict[str, Any]) -> None:
+        handler = self.handlers.get(job["type"])
+        if not handler:
+            raise ValueError(f"Unknown job type {job['type']}")
+        await handler(job["payload"])
+
+    async def run_attempt_analysis(self, payload: Dict[str, Any]) -> None:
+        progress_id = payload["usersimulationprogress_id"]
+        progress = await self.db.user_sim_progress.find_one(
+            {"_id": ObjectId(progress_id)})
+        if not progress:
+            logger.warning(f"Attempt {progress_id} no longer exists")
+            return
+        transcript = progress.get("transcript")
+        if not transcript:
+            logger.info(f"Attempt {progress_id} has no transcript to analyse")
+            return
+        simulation = await self.db.simulations.find_one(
+            {"_id": ObjectId(progress["simulationId"])}, {"script": 1})
+        original_script = [{
+            **sentence, "script_sentence":
+            re.sub('<.*?>', '', sentence.get("script_sentence", ""))
+        } for sentence in (simulation or {}).get("script") or []]
+        if not original_script:
+            logger.info(f"Simulation of attempt {progress_id} has no script")
+            return
+
+        # Failures raise and are retried by the queue
+        analysis = await self.scoring_service.calculate_attempt_scores_chat_type(
+            original_script, transcript)
+        await self.db.user_sim_progress.update_one(
+            {"_id": progress["_id"]}, {
+                "$set": {
+                    "advancedScores.attemptAnalysis": analysis.dict(),
+                    "advancedScores.lastUpdated": datetime.utcnow()
+                }
+            })
+
+        # Stores its own result (or error) under advancedScores.confidence
+        transcript_object = progress.get("transcriptObject")
+        await self.advanced_scoring_service.calculate_confidence_score(
+            original_script,
+            transcript,
+            progress_id,
+            audio_url=progress.get("audioUrl") or None,
+            transcript_object=transcript_object
+            if isinstance(transcript_object, list) else None,
+            simulation_type=payload.get("simulation_type", "audio"),
+            simulation_id=str(progress["simulationId"]))
+        logger.info(f"Attempt analysis stored for {progress_id}")
@@ -1,13 +1,19 @@
 from domain.services.azure_ai_llm_service import AzureAILLMService
 from infrastructure.database import Database
+from config import (KEYWORD_ALIGNMENT_MODE, KEYWORD_ALIGNMENT_BAND,
+                    KEYWORD_ALIGNMENT_GAP_COST, LLM_PASS_TIMEOUT_SECONDS)
 from fastapi import HTTPException
+import asyncio
 import json
 from api.schemas.responses import (KeywordScoreAnalysisScript, KeywordScoreAnalysisWithScriptResponse,
 ContextualScoreAnalysisScript, ContextualScoreAnalysisWithScriptResponse, BehaviouralScoreAnalysis,
 ChatTypeScoreResponse, KeywordAnalysis)
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 import math
 import domain.utils.constants as constants
+from domain.utils.keyword_matcher import KeywordMatcher
+from domain.utils.transcript_alignment import align_transcript
+from infrastructure.script_index_cache import script_index_cache
 import re
 import string
 from utils.logger import Logger
@@ -79,16 +85,57 @@ class ScoringService:
                     keyword_score=0
                 )
     
-    async def get_keyword_score_analysis_regex(self, inputScript, transcript: str) -> KeywordScoreAnalysisWithScriptResponse:
+    def get_keyword_index(self, inputScript) -> Tuple[Dict[int, List[Tuple[str, str]]], KeywordMatcher]:
+        """(keyword, normalised keyword) pairs of each Trainee line and one
+        matcher over all of them, cached per script version"""
+        trainee_keywords = [(i, script_line["keywords"]) for i, script_line in enumerate(inputScript)
+                            if script_line["role"] == "Trainee" or script_line["role"] == 'assistant']
+
+        def build():
+            line_keywords_by_index = {
+                i: [(keyword, self.normalize_text(keyword)) for keyword in keywords if keyword]
+                for i, keywords in trainee_keywords
+            }
+            matcher = KeywordMatcher(normalized_keyword
+                                     for line_keywords in line_keywords_by_index.values()
+                                     for _, normalized_keyword in line_keywords)
+            return line_keywords_by_index, matcher
+
+        return script_index_cache.get_or_build(
+            "keywords", None,
+            script_index_cache.script_hash([json.dumps(trainee_keywords)]),
+            build)
+
+    def get_actual_sentences(self, inputScript, parsed_transcript: List[Dict[str, str]], alignment: str) -> List[str]:
+        """The transcript sentence each script line is scored against"""
+        if alignment != "banded":
+            return [parsed_transcript[i]["actual_sentence"] if i < len(parsed_transcript) else ""
+                    for i in range(len(inputScript))]
+
+        # Align role-tagged lines so an extra or skipped turn doesn't shift
+        # every later comparison
+        aligned = align_transcript(
+            [(script_line["role"] == "Trainee" or script_line["role"] == 'assistant',
+              self.normalize_text(script_line["script_sentence"])) for script_line in inputScript],
+            [(turn["role"] == "Trainee", self.normalize_text(turn["actual_sentence"]))
+             for turn in parsed_transcript],
+            band=KEYWORD_ALIGNMENT_BAND,
+            gap_cost=KEYWORD_ALIGNMENT_GAP_COST)
+        return [parsed_transcript[j]["actual_sentence"] if j is not None else "" for j in aligned]
+
+    async def get_keyword_score_analysis_regex(self, inputScript, transcript: str, alignment: Optional[str] = None) -> KeywordScoreAnalysisWithScriptResponse:
         try:
             parsed_transcript = self.parse_transcript(transcript)
+            actual_sentences = self.get_actual_sentences(
+                inputScript, parsed_transcript, alignment or KEYWORD_ALIGNMENT_MODE)
+            line_keywords_by_index, matcher = self.get_keyword_index(inputScript)
 
             result: List[KeywordScoreAnalysisScript] = []
 
             for i, script_line in enumerate(inputScript):
                 role = script_line["role"]
                 script_sentence = script_line["script_sentence"]
-                actual_sentence = parsed_transcript[i]["actual_sentence"] if i < len(parsed_transcript) else ""
+                actual_sentence = actual_sentences[i]
                 if role != "Trainee" and role != 'assistant':
                     result.append(KeywordScoreAnalysisScript(
                         role=role,
@@ -98,19 +145,15 @@ class ScoringService:
                     ))
                     continue
 
-                keywords = script_line["keywords"]
-                normalized_actual = self.normalize_text(actual_sentence)
-
-                missing_keywords = []
-                total_keywords = 0
-                for keyword in keywords:
-                    if keyword:
-                        normalized_keyword = self.normalize_text(keyword)
-                        # Word-boundary not needed due to punctuation tolerance
-                        if not re.search(rf"\b{re.escape(normalized_keyword)}\b", normalized_actual):
-                            if normalized_keyword not in normalized_actual:
-                                missing_keywords.append(keyword)
-                        total_keywords += 1
+                # A keyword counts as present when it occurs anywhere in the
+                # normalised line, so one automaton pass finds them all
+                line_keywords = line_keywords_by_index[i]
+                found = matcher.find_all(self.normalize_text(actual_sentence))
+                missing_keywords = [
+                    keyword for keyword, normalized_keyword in line_keywords
+                    if normalized_keyword and normalized_keyword not in found
+                ]
+                total_keywords = len(line_keywords)
                 keyword_analysis = KeywordAnalysis(
                     total_keywords=total_keywords,
                     missing_keywords=len(missing_keywords),
@@ -203,11 +246,13 @@ class ScoringService:
             )
             user_prompt = user_prompt.format(original_script=script_text, transcript=transcript)
             llm_service = AzureAILLMService(system_message)
-            response = await llm_service.get_chat_completion(user_prompt)
+            response = await llm_service.get_chat_completion(user_prompt, timeout=LLM_PASS_TIMEOUT_SECONDS)
             response_cleaned = self.clean_llm_response_string(str(response))
             response_object = self.convert_string_to_response_dict(response_cleaned)
             context_score_analysis_list: List[ContextualScoreAnalysisScript] = [ContextualScoreAnalysisScript(**entry) for entry in response_object]
             return self.get_context_score_response(context_score_analysis_list)
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error("Failed to calculate context accuracy.")
             logger.exception(e)
@@ -229,22 +274,39 @@ class ScoringService:
             )
             user_prompt = user_prompt.format(original_script=script_text, transcript=transcript)
             llm_service = AzureAILLMService(system_message)
-            response = await llm_service.get_chat_completion(user_prompt)
+            response = await llm_service.get_chat_completion(user_prompt, timeout=LLM_PASS_TIMEOUT_SECONDS)
             response_cleaned = self.clean_llm_response_string(str(response))
             response_object = self.convert_string_to_response_dict(response_cleaned)
             behavioural_score_analysis_list: BehaviouralScoreAnalysis = BehaviouralScoreAnalysis(**response_object)
             return behavioural_score_analysis_list
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error("Failed to calculate behavioural score for attempt.")
             logger.exception(e)
             raise HTTPException(status_code=500, detail="Failed to calculate behavioural score for attempt.")
     
+    async def run_llm_passes(self, passes: Dict[str, Any]) -> List[Any]:
+        """Run independent scoring passes concurrently; raises the first
+        failure once all settle. Each pass bounds its LLM call with
+        LLM_PASS_TIMEOUT_SECONDS, counted from when it holds an LLM slot."""
+        results = await asyncio.gather(*passes.values(), return_exceptions=True)
+        for name, result in zip(passes, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{name} scoring pass failed: {result}")
+                raise result
+        return results
+
     async def calculate_attempt_scores_chat_type(self, inputScript = None, transcript = None):
         try:
             if inputScript and transcript:
                 keyword_score_analysis: KeywordScoreAnalysisWithScriptResponse = await self.get_keyword_score_analysis_regex(inputScript, transcript)
-                context_score_analysis: ContextualScoreAnalysisWithScriptResponse = await self.get_context_score_analysis(inputScript, transcript)
-                behavioural_score_analysis: BehaviouralScoreAnalysis = await self.get_behavioural_score_analysis(inputScript, transcript)
+                # The contextual and behavioural passes are independent LLM
+                # calls; run them side by side
+                context_score_analysis, behavioural_score_analysis = await self.run_llm_passes({
+                    "Contextual": self.get_context_score_analysis(inputScript, transcript),
+                    "Behavioural": self.get_behavioural_score_analysis(inputScript, transcript)
+                })
                 chat_score_analysis: ChatTypeScoreResponse = ChatTypeScoreResponse(
                     keyword_accuracy=keyword_score_analysis,
                     contextual_accuracy=context_score_analysis,
@@ -1,20 +1,31 @@
 import asyncio
-from typing import Any, Dict, List, Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 import json
-import aiohttp
 import base64
-from datetime import datetime
+from datetime import datetime, timedelta
 from bson import ObjectId
 import traceback
 import re
 from config import (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_KEY,
-                    AZURE_OPENAI_BASE_URL, RETELL_API_KEY)
+                    AZURE_OPENAI_BASE_URL, RETELL_API_KEY,
+                    SLIDE_UPLOAD_CONCURRENCY, SLIDE_UPLOAD_CHUNK_BYTES,
+                    SLIDE_BULK_INSERT_MAX_BYTES,
+                    RETELL_CALL_POLL_INITIAL_SECONDS,
+                    RETELL_CALL_POLL_MAX_INTERVAL_SECONDS,
+                    RETELL_CALL_POLL_TIMEOUT_SECONDS,
+                    AUDIO_SCORING_LEASE_SECONDS)
 from infrastructure.database import Database
+from infrastructure.http_client import http_clients
+from infrastructure.image_store import ImageStore
+from infrastructure.pagination import KeysetPage, fetch_page, is_cursor_mode
+from infrastructure.script_index_cache import script_index_cache
 from api.schemas.requests import (CreateSimulationRequest,
                                   UpdateSimulationRequest,
                                   CloneSimulationRequest, PaginationParams,
                                   SimulationScoringMetrics, MetricWeightage,
-                                  AttemptModel, ChatHistoryItem)
+                                  AttemptModel, ChatHistoryItem,
+                                  SimulationView, ImageDelivery)
 from api.schemas.responses import SimulationByIDResponse, SimulationData
 from fastapi import HTTPException, UploadFile
 from semantic_kernel import Kernel
@@ -33,6 +44,9 @@ from api.schemas.responses import (StartVisualAudioPreviewResponse,
                                    SimulationByIDResponse, EndSimulationResponse, UpdateImageMaskingObjectResponse)
 
 from domain.services.scoring_service import ScoringService
+from domain.services.scoring_job_service import ScoringJobService
+from infrastructure.repositories.progress_summary_repository import ProgressSummaryRepository
+from pymongo import ReturnDocument
 
 from bson import ObjectId
 
@@ -43,6 +57,51 @@ logger = Logger.get_logger(__name__)
 
 COPY_PREFIX = "Copy "
 
+# Background webhook/poll scoring tasks; referenced so they aren't collected
+_call_poll_tasks = set()
+
+
+async def shutdown_call_tasks() -> None:
+    """Cancel the background poll/finalize tasks and wait for them to unwind
+
+    Ended calls that are still unscored are picked up again by
+    ``SimulationService.resume_call_polls`` on the next start.
+    """
+    tasks = list(_call_poll_tasks)
+    if not tasks:
+        return
+    logger.warning(f"Cancelling {len(tasks)} Retell call task(s) on shutdown")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def call_ready(call_data: Dict[str, Any]) -> bool:
+    """Whether Retell has finished the call and its transcript"""
+    return call_data.get("call_status") in ("ended", "error")
+
+# Fields a simulation list row needs; scripts and slide sequences stay in Mongo
+SIMULATION_SUMMARY_PROJECTION = {
+    "name": 1,
+    "version": 1,
+    "lvl1": 1,
+    "lvl2": 1,
+    "lvl3": 1,
+    "type": 1,
+    "status": 1,
+    "tags": 1,
+    "estimatedTimeToAttemptInMins": 1,
+    "lastModified": 1,
+    "lastModifiedBy": 1,
+    "createdOn": 1,
+    "createdBy": 1,
+    "isLocked": 1,
+    "divisionId": 1,
+    "departmentId": 1,
+    "simulationScoringMetrics": 1,
+    "metricWeightage": 1,
+}
+
 
 class SimulationService:
 
@@ -55,6 +114,9 @@ class SimulationService:
             logger.info("Database initialized successfully.")
 
             self.scoring_service = ScoringService()
+            self.progress_summaries = ProgressSummaryRepository()
+            self.scoring_jobs = ScoringJobService()
+            self.image_store = ImageStore()
         except Exception as e:
             logger.error("Failed to initialize database.")
             logger.exception(e)
@@ -91,44 +153,140 @@ class SimulationService:
 
         logger.info("SimulationService initialized.")
 
-    async def _store_slide_file(self, slide_data: dict,
-                                file: UploadFile) -> dict:
-        """Store slide file in MongoDB and return updated slide data"""
-        logger.info("Storing slide file in MongoDB.")
-        logger.debug(f"Slide data: {slide_data}, File: {file.filename}")
-        try:
-            file_bytes = await file.read()
-            # Build the document to insert
-            image_doc = {
-                "imageId": slide_data["imageId"],
-                "name": slide_data.get("imageName", file.filename),
-                "contentType": file.content_type,
-                "data": file_bytes,
-                "uploadedAt": datetime.utcnow()
-            }
-
-            logger.debug(f"Image doc being inserted: {image_doc}")
-
-            # Insert into the images collection
-            result = await self.db.images.insert_one(image_doc)
+    async def _read_slide_file(
+            self, file: UploadFile) -> Tuple[Optional[bytes], str, int]:
+        """Hash an upload in chunks, keeping its bytes only while it's small
 
-            logger.info(
-                f"Image inserted successfully, id={result.inserted_id}")
-
-            # Build the image URL
-            image_url = f"/api/images/{result.inserted_id}"
-
-            # Update slide data with the image URL
-            slide_data_copy = slide_data.copy()
-            slide_data_copy["imageUrl"] = image_url
-            return slide_data_copy
+        Returns ``(data, digest, length)``. ``data`` is None for files over
+        SLIDE_BULK_INSERT_MAX_BYTES; those are streamed to storage later.
+        """
+        hasher = hashlib.sha256()
+        chunks: Optional[List[bytes]] = []
+        length = 0
+        while True:
+            chunk = await file.read(SLIDE_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            length += len(chunk)
+            if chunks is not None:
+                chunks.append(chunk)
+                if length > SLIDE_BULK_INSERT_MAX_BYTES:
+                    chunks = None
+        data = None if chunks is None else b"".join(chunks)
+        return data, hasher.hexdigest(), length
+
+    async def _store_slide_files(
+            self, slides: List[dict],
+            slides_files: Dict[str, UploadFile]) -> List[dict]:
+        """Store uploaded slide files concurrently and return updated slides
+
+        Files are read and written at most SLIDE_UPLOAD_CONCURRENCY at a
+        time. Files up to SLIDE_BULK_INSERT_MAX_BYTES are held in memory and
+        share one bulk write of their images documents; larger ones are
+        streamed from their spooled upload into GridFS in
+        SLIDE_UPLOAD_CHUNK_BYTES chunks and saved individually.
+        """
+        image_ids = list(
+            dict.fromkeys(slide["imageId"] for slide in slides
+                          if slide.get("imageId") in slides_files))
+        logger.info(f"Storing {len(image_ids)} slide file(s) in MongoDB.")
+        try:
+            semaphore = asyncio.Semaphore(SLIDE_UPLOAD_CONCURRENCY)
+
+            async def read(
+                    file: UploadFile) -> Tuple[Optional[bytes], str, int]:
+                async with semaphore:
+                    return await self._read_slide_file(file)
+
+            contents = await asyncio.gather(
+                *(read(slides_files[image_id]) for image_id in image_ids))
+            names = {}
+            for slide in slides:
+                if slide.get("imageId") in slides_files:
+                    names.setdefault(slide["imageId"], slide.get("imageName"))
+            small, large = [], []
+            for image_id, (data, digest, length) in zip(image_ids, contents):
+                file = slides_files[image_id]
+                meta = (image_id, names[image_id] or file.filename,
+                        file.content_type)
+                if data is None:
+                    large.append((*meta, file, length, digest))
+                else:
+                    small.append((*meta, data, digest))
+
+            async def save(image) -> Any:
+                async with semaphore:
+                    return await self.image_store.save_stream(
+                        *image, SLIDE_UPLOAD_CHUNK_BYTES)
+
+            bulk_ids, *large_ids = await asyncio.gather(
+                self.image_store.save_many(small, SLIDE_UPLOAD_CONCURRENCY),
+                *(save(image) for image in large))
+            inserted_ids = dict(
+                zip([image[0] for image in small + large],
+                    bulk_ids + large_ids))
+
+            processed_slides = []
+            for slide in slides:
+                if slide.get("imageId") in inserted_ids:
+                    slide = {
+                        **slide, "imageUrl":
+                        f"/api/images/{inserted_ids[slide['imageId']]}"
+                    }
+                processed_slides.append(slide)
+            logger.info(f"Stored {len(inserted_ids)} slide file(s) "
+                        f"({len(small)} bulk, {len(large)} individually)")
+            return processed_slides
 
         except Exception as e:
-            logger.error(f"Error in _store_slide_file: {str(e)}",
+            logger.error(f"Error in _store_slide_files: {str(e)}",
                          exc_info=True)
             raise HTTPException(status_code=500,
                                 detail=f"Error storing slide file: {str(e)}")
 
+    async def _load_slide_images(
+            self, slides: Optional[List[dict]],
+            image_delivery: ImageDelivery) -> List[Dict[str, Any]]:
+        """Resolve slide images with one $in query, as URLs or inline base64"""
+        image_ids = [
+            slide["imageId"] for slide in slides or [] if slide.get("imageId")
+        ]
+        if not image_ids:
+            return []
+
+        inline = image_delivery == ImageDelivery.INLINE
+        try:
+            image_docs = {}
+            async for image_doc in self.db.images.find(
+                {"imageId": {
+                    "$in": list(dict.fromkeys(image_ids))
+                }}, None if inline else {"imageId": 1}):
+                # Keep the first match per imageId, as find_one did
+                image_docs.setdefault(image_doc["imageId"], image_doc)
+        except Exception as image_err:
+            logger.warning(f"Failed to load images for slides: {image_err}")
+            return []
+
+        found = [(image_id, image_docs[image_id]) for image_id in image_ids
+                 if image_id in image_docs]
+        if not inline:
+            return [{
+                "image_id": image_id,
+                "image_url": f"/api/images/{image_doc['_id']}"
+            } for image_id, image_doc in found]
+
+        image_bytes = await asyncio.gather(
+            *(self.image_store.read(image_doc) for _, image_doc in found))
+        # Encoding large slide decks is CPU-bound; keep it off the event loop
+        encoded = await asyncio.to_thread(lambda: [
+            base64.b64encode(data).decode("utf-8") for data in image_bytes
+        ])
+        return [{
+            "image_id": image_id,
+            "image_data": data
+        } for (image_id, _), data in zip(found, encoded)]
+
     async def _store_slide_image(self, slide_data: dict) -> dict:
         """Store image data in MongoDB and return updated slide data"""
         logger.info("Storing slide image in MongoDB.")
@@ -140,20 +298,13 @@ class SimulationService:
             # Decode base64 image data
             image_data = base64.b64decode(slide_data["imageData"]["data"])
 
-            # Create image document
-            image_doc = {
-                "imageId": slide_data["imageId"],
-                "name": slide_data["imageName"],
-                "contentType": slide_data["imageData"]["contentType"],
-                "data": image_data,
-                "uploadedAt": datetime.utcnow()
-            }
-
-            # Store in images collection
-            result = await self.db.images.insert_one(image_doc)
+            # Store in the content-addressed image store
+            inserted_id = await self.image_store.save(
+                slide_data["imageId"], slide_data["imageName"],
+                slide_data["imageData"]["contentType"], image_data)
 
             # Create image URL
-            image_url = f"/api/images/{result.inserted_id}"
+            image_url = f"/api/images/{inserted_id}"
 
             # Update slide data
             slide_data_copy = slide_data.copy()
@@ -161,8 +312,7 @@ class SimulationService:
             if "imageData" in slide_data_copy:
                 del slide_data_copy["imageData"]
 
-            logger.info(
-                f"Slide image stored successfully, id={result.inserted_id}")
+            logger.info(f"Slide image stored successfully, id={inserted_id}")
             return slide_data_copy
 
         except Exception as e:
@@ -397,17 +547,11 @@ class SimulationService:
                 logger.debug("Processing slidesData for visual simulation.")
 
                 if slides_files and len(slides_files) > 0:
-                    for slide in request.slidesData:
-                        slide_dict = slide.dict()
+                    slide_dicts = [slide.dict() for slide in request.slidesData]
+                    for slide_dict in slide_dicts:
                         slide_dict.pop("imageData", None)
-                        image_id = slide_dict.get("imageId")
-                        if image_id in slides_files:
-                            file_obj = slides_files[image_id]
-                            processed_slide = await self._store_slide_file(
-                                slide_dict, file_obj)
-                            processed_slides.append(processed_slide)
-                        else:
-                            processed_slides.append(slide_dict)
+                    processed_slides = await self._store_slide_files(
+                        slide_dicts, slides_files)
                 else:
                     processed_slides = [
                         slide.dict() for slide in request.slidesData
@@ -585,6 +729,8 @@ class SimulationService:
                     "Failed to update simulation; no documents modified.")
                 raise HTTPException(status_code=500,
                                     detail="Failed to update simulation")
+            if request.script is not None:
+                script_index_cache.invalidate(sim_id)
 
             updated_simulation = await self.db.simulations.find_one(
                 {"_id": sim_id_object})
@@ -606,8 +752,11 @@ class SimulationService:
                                 detail=f"Error updating simulation: {str(e)}")
 
     async def start_visual_audio_preview(
-            self, sim_id: str,
-            user_id: str) -> StartVisualAudioPreviewResponse:
+        self,
+        sim_id: str,
+        user_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualAudioPreviewResponse:
         logger.info(f"Starting visual-audio preview for simulation {sim_id}")
         try:
             sim_id_object = ObjectId(sim_id)
@@ -679,25 +828,8 @@ class SimulationService:
                 metric_weightage=metric_weightage,
             )
 
-            images = []
-            if simulation_doc.get("slidesData"):
-                for slide in simulation_doc["slidesData"]:
-                    if slide.get("imageId"):
-                        try:
-                            image_id = slide["imageId"]
-                            image_doc = await self.db.images.find_one(
-                                {"imageId": image_id})
-                            if image_doc:
-                                images.append({
-                                    "image_id":
-                                    slide["imageId"],
-                                    "image_data":
-                                    base64.b64encode(
-                                        image_doc["data"]).decode("utf-8"),
-                                })
-                        except Exception as image_err:
-                            logger.warning(
-                                f"Failed to load image for slide: {image_err}")
+            images = await self._load_slide_images(
+                simulation_doc.get("slidesData"), image_delivery)
 
             logger.info(
                 f"Visual-audio preview for sim {sim_id} prepared successfully.")
@@ -717,7 +849,11 @@ class SimulationService:
                 detail=f"Error starting visual-audio preview: {str(e)}")
 
     async def start_visual_chat_preview(
-            self, sim_id: str, user_id: str) -> StartVisualChatPreviewResponse:
+        self,
+        sim_id: str,
+        user_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualChatPreviewResponse:
         logger.info(f"Starting visual-chat preview for simulation {sim_id}")
         try:
             sim_id_object = ObjectId(sim_id)
@@ -788,25 +924,8 @@ class SimulationService:
                 metric_weightage=metric_weightage,
             )
 
-            images = []
-            if simulation_doc.get("slidesData"):
-                for slide in simulation_doc["slidesData"]:
-                    if slide.get("imageId"):
-                        try:
-                            image_id = slide["imageId"]
-                            image_doc = await self.db.images.find_one(
-                                {"imageId": image_id})
-                            if image_doc:
-                                images.append({
-                                    "image_id":
-                                    slide["imageId"],
-                                    "image_data":
-                                    base64.b64encode(
-                                        image_doc["data"]).decode("utf-8"),
-                                })
-                        except Exception as image_err:
-                            logger.warning(
-                                f"Failed to load image for slide: {image_err}")
+            images = await self._load_slide_images(
+                simulation_doc.get("slidesData"), image_delivery)
 
             logger.info(
                 f"Visual-chat preview for sim {sim_id} prepared successfully.")
@@ -825,8 +944,12 @@ class SimulationService:
                 status_code=500,
                 detail=f"Error starting visual-chat preview: {str(e)}")
 
-    async def start_visual_preview(self, sim_id: str,
-                                   user_id: str) -> StartVisualPreviewResponse:
+    async def start_visual_preview(
+        self,
+        sim_id: str,
+        user_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> StartVisualPreviewResponse:
         logger.info(f"Starting visual preview for simulation {sim_id}")
         try:
             sim_id_object = ObjectId(sim_id)
@@ -897,25 +1020,8 @@ class SimulationService:
                 metric_weightage=metric_weightage,
             )
 
-            images = []
-            if simulation_doc.get("slidesData"):
-                for slide in simulation_doc["slidesData"]:
-                    if slide.get("imageId"):
-                        try:
-                            image_id = slide["imageId"]
-                            image_doc = await self.db.images.find_one(
-                                {"imageId": image_id})
-                            if image_doc:
-                                images.append({
-                                    "image_id":
-                                    slide["imageId"],
-                                    "image_data":
-                                    base64.b64encode(
-                                        image_doc["data"]).decode("utf-8"),
-                                })
-                        except Exception as image_err:
-                            logger.warning(
-                                f"Failed to load image for slide: {image_err}")
+            images = await self._load_slide_images(
+                simulation_doc.get("slidesData"), image_delivery)
 
             logger.info(
                 f"Visual preview for sim {sim_id} prepared successfully.")
@@ -940,7 +1046,7 @@ class SimulationService:
         logger.info("Creating Retell LLM.")
         logger.debug(f"Prompt: {prompt[:100]}...")  # Show first 100 chars
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("retell") as session:
                 headers = {
                     'Authorization': f'Bearer {RETELL_API_KEY}',
                     'Content-Type': 'application/json'
@@ -975,7 +1081,7 @@ class SimulationService:
         logger.info("Creating Retell Agent.")
         logger.debug(f"LLM ID: {llm_id}, Voice ID: {voice_id}")
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("retell") as session:
                 headers = {
                     'Authorization': f'Bearer {RETELL_API_KEY}',
                     'Content-Type': 'application/json'
@@ -1208,7 +1314,7 @@ class SimulationService:
         """Create a web call using Retell API"""
         logger.info(f"Creating web call for agent_id={agent_id}")
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("retell") as session:
                 headers = {
                     'Authorization': f'Bearer {RETELL_API_KEY}',
                     'Content-Type': 'application/json'
@@ -1240,9 +1346,12 @@ class SimulationService:
             self,
             user_id: str,
             workspace: str,
-            pagination: Optional[PaginationParams] = None) -> Dict[str, any]:
+            pagination: Optional[PaginationParams] = None,
+            view: SimulationView = SimulationView.FULL) -> Dict[str, any]:
         """Fetch all simulations with pagination and filtering
 
+        The summary view projects away script and slidesData.
+
         Returns a dictionary with:
         - simulations: List of SimulationData objects
         - total_count: Total number of simulations matching the query
@@ -1347,12 +1456,23 @@ class SimulationService:
             logger.debug(f"Sort options: {sort_options}")
             logger.debug(f"Skip: {skip}, Limit: {limit}")
 
-            # Execute the query with pagination
-            cursor = (self.db.simulations.find(query).sort(sort_options).skip(
-                skip).limit(limit))
+            # Fetch the page and its total in as few scans as possible
+            keyset = None
+            if is_cursor_mode(pagination):
+                try:
+                    keyset = KeysetPage(sort_options, pagination.cursor)
+                except ValueError as ve:
+                    raise HTTPException(status_code=400, detail=str(ve))
+            # Applied by the indexed find itself, so the summary view never
+            # reads script/slidesData off disk, cache hit or miss
+            projection = (SIMULATION_SUMMARY_PROJECTION
+                          if view == SimulationView.SUMMARY else None)
+            page = await fetch_page(self.db.simulations, query, sort_options,
+                                    skip, limit, keyset, projection)
+            total_count = page.total_count
             simulations = []
 
-            async for doc in cursor:
+            for doc in page.docs:
                 # Extract simulation scoring metrics with new fields
                 simulation_scoring_metrics = None
                 if doc.get("simulationScoringMetrics"):
@@ -1411,23 +1531,30 @@ class SimulationService:
                 )
                 simulations.append(simulation)
 
-            # Get total count for pagination metadata
-            total_count = await self.db.simulations.count_documents(query)
-
             logger.info(
                 f"Total simulations fetched: {len(simulations)}, Total count: {total_count}"
             )
-            return {"simulations": simulations, "total_count": total_count}
+            return {
+                "simulations": simulations,
+                "total_count": total_count,
+                "total_count_exact": page.total_exact,
+                "next_cursor": keyset.next_cursor if keyset else None
+            }
 
+        except HTTPException as he:
+            raise he
         except Exception as e:
             logger.error(f"Error fetching simulations: {str(e)}",
                          exc_info=True)
             raise HTTPException(status_code=500,
                                 detail=f"Error fetching simulations: {str(e)}")
 
-    async def get_simulation_by_id(self,
-                                   sim_id: str,
-                                   workspace: str) -> SimulationByIDResponse:
+    async def get_simulation_by_id(
+        self,
+        sim_id: str,
+        workspace: str,
+        image_delivery: ImageDelivery = ImageDelivery.INLINE
+    ) -> SimulationByIDResponse:
         logger.info(f"Fetching simulation by ID: {sim_id} in workspace {workspace}")
         try:
             sim_id_object = ObjectId(sim_id)
@@ -1512,25 +1639,8 @@ class SimulationService:
                 prompt=simulation_doc.get("prompt", ""),
             )
 
-            images = []
-            if simulation_doc.get("slidesData"):
-                for slide in simulation_doc["slidesData"]:
-                    if slide.get("imageId"):
-                        try:
-                            image_id = slide["imageId"]
-                            image_doc = await self.db.images.find_one(
-                                {"imageId": image_id})
-                            if image_doc:
-                                images.append({
-                                    "image_id":
-                                    slide["imageId"],
-                                    "image_data":
-                                    base64.b64encode(
-                                        image_doc["data"]).decode("utf-8"),
-                                })
-                        except Exception as image_err:
-                            logger.warning(
-                                f"Failed to load image for slide: {image_err}")
+            images = await self._load_slide_images(
+                simulation_doc.get("slidesData"), image_delivery)
 
             logger.info(f"Simulation {sim_id} fetched successfully.")
             return SimulationByIDResponse(simulation=simulation, images=images)
@@ -1546,8 +1656,15 @@ class SimulationService:
                 status_code=500,
                 detail=f"Error fetching simulation by ID: {str(e)}")
 
-    async def _get_simulation_by_id_internal(self, sim_id: str) -> SimulationByIDResponse:
-        """Internal method to get simulation by ID without workspace filtering"""
+    async def _get_simulation_by_id_internal(
+        self,
+        sim_id: str,
+        image_delivery: ImageDelivery = ImageDelivery.URL
+    ) -> SimulationByIDResponse:
+        """Internal method to get simulation by ID without workspace filtering
+
+        Scoring callers never read image bytes, so images default to URLs.
+        """
         logger.info(f"Fetching simulation by ID internally: {sim_id}")
         try:
             sim_id_object = ObjectId(sim_id)
@@ -1618,20 +1735,8 @@ class SimulationService:
                 prompt=simulation_doc.get("prompt", ""),
             )
 
-            images = []
-            if simulation_doc.get("slidesData"):
-                for slide in simulation_doc["slidesData"]:
-                    if slide.get("imageId"):
-                        try:
-                            image_id = slide["imageId"]
-                            image_doc = await self.db.images.find_one({"imageId": image_id})
-                            if image_doc:
-                                images.append({
-                                    "image_id": slide["imageId"],
-                                    "image_data": base64.b64encode(image_doc["data"]).decode("utf-8"),
-                                })
-                        except Exception as image_err:
-                            logger.warning(f"Failed to load image for slide: {image_err}")
+            images = await self._load_slide_images(
+                simulation_doc.get("slidesData"), image_delivery)
 
             logger.info(f"Simulation {sim_id} fetched successfully.")
             return SimulationByIDResponse(simulation=simulation, images=images)
@@ -1643,6 +1748,23 @@ class SimulationService:
             logger.error(f"Error fetching simulation by ID internally: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error fetching simulation by ID: {str(e)}")
 
+    async def _complete_progress(self, usersimulationprogress_id: str,
+                                 update_doc: Dict[str, Any]) -> Optional[Dict]:
+        """Mark an attempt completed and fold it into its progress summary"""
+        previous = await self.db.user_sim_progress.find_one_and_update(
+            {"_id": ObjectId(usersimulationprogress_id)}, {"$set": update_doc},
+            projection={
+                "userId": 1,
+                "assignmentId": 1,
+                "simulationId": 1,
+                "workspace": 1,
+                "status": 1
+            },
+            return_document=ReturnDocument.BEFORE)
+        await self.progress_summaries.record_completion(
+            previous, update_doc.get("scores"), update_doc["completedAt"])
+        return previous
+
     async def end_visual_audio_attempt(
             self, user_id: str, simulation_id: str,
             usersimulationprogress_id: str,
@@ -1727,9 +1849,8 @@ class SimulationService:
                 "transcription_data": slides_data
             }
 
-            response = await self.db.user_sim_progress.update_one(
-                {"_id": ObjectId(usersimulationprogress_id)},
-                {"$set": update_doc})
+            response = await self._complete_progress(usersimulationprogress_id,
+                                          update_doc)
 
             print("response ====== ", response)
 
@@ -1855,9 +1976,10 @@ class SimulationService:
                 [attempt.dict() for attempt in userAttemptSequence]
             }
 
-            await self.db.user_sim_progress.update_one(
-                {"_id": ObjectId(usersimulationprogress_id)},
-                {"$set": update_doc})
+            await self._complete_progress(usersimulationprogress_id,
+                                          update_doc)
+            await self.scoring_jobs.enqueue_attempt_analysis(
+                usersimulationprogress_id, "visual-chat")
 
             return EndSimulationResponse(id=usersimulationprogress_id,
                                          status="success",
@@ -1921,9 +2043,10 @@ class SimulationService:
                 "lastModifiedAt": datetime.utcnow()
             }
 
-            await self.db.user_sim_progress.update_one(
-                {"_id": ObjectId(usersimulationprogress_id)},
-                {"$set": update_doc})
+            await self._complete_progress(usersimulationprogress_id,
+                                          update_doc)
+            await self.scoring_jobs.enqueue_attempt_analysis(
+                usersimulationprogress_id, "chat")
 
             logger.info(
                 f"Chat simulation ended. ID={usersimulationprogress_id}")
@@ -1943,88 +2066,284 @@ class SimulationService:
     async def end_audio_simulation(self, user_id: str, simulation_id: str,
                                    usersimulationprogress_id: str,
                                    call_id: str) -> EndSimulationResponse:
-        try:
-            await asyncio.sleep(15)
-            async with aiohttp.ClientSession() as session:
-                headers = {"Authorization": f"Bearer {RETELL_API_KEY}"}
-                url = f"https://api.retellai.com/v2/get-call/{call_id}"
-
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            f"Failed to fetch call details. Status: {response.status}"
-                        )
-                        raise HTTPException(
-                            status_code=response.status,
-                            detail="Failed to fetch call details from Retell AI"
-                        )
-                    call_data = await response.json()
+        """Request completion of an audio attempt without waiting for Retell
 
-            # Use internal method that doesn't require workspace
-            sim: SimulationByIDResponse = await self._get_simulation_by_id_internal(simulation_id)
-            if not sim:
-                logger.warning(
-                    f"Simulation {simulation_id} not found for end_chat_simulation."
-                )
+        The attempt is scored once Retell's call data is ready: on the
+        ``call_ended``/``call_analyzed`` webhook, or by a background get-call
+        poll when no webhook arrives. Until then the response is
+        ``status="pending"``; clients poll ``get_audio_simulation_status``.
+        """
+        try:
+            progress = await self.db.user_sim_progress.find_one_and_update(
+                {"_id": ObjectId(usersimulationprogress_id)}, {
+                    "$set": {
+                        "callId": call_id,
+                        "endRequestedAt": datetime.utcnow(),
+                        "lastModifiedAt": datetime.utcnow()
+                    }
+                },
+                return_document=ReturnDocument.AFTER)
+            if not progress:
                 raise HTTPException(
                     status_code=404,
-                    detail=f"Simulation with id {simulation_id} not found")
+                    detail=
+                    f"Attempt with id {usersimulationprogress_id} not found")
 
-            scores = {
-                'SimAccuracy': 0,
-                'KeywordScore': 0,
-                'ClickScore': 0,
-                'Confidence': 0,
-                'Energy': 0,
-                'Concentration': 0
-            }
-            original_script = [{
-                **s.dict(), "script_sentence":
-                re.sub('<.*?>', '', s.script_sentence)
-            } for s in sim.simulation.script]
-            transcript = call_data.get("transcript", "").replace(
-                "User", "Customer").replace("Agent", "Trainee")
+            if progress.get("status") != "completed":
+                self._spawn_call_poll(call_id)
 
-            keyword_score = await self.scoring_service.get_keyword_score_analysis_regex(
-                original_script, transcript)
-            if keyword_score:
-                scores['KeywordScore'] = keyword_score.keyword_score
+            logger.info(f"Audio simulation end requested. "
+                        f"ID={usersimulationprogress_id}, call_id={call_id}")
+            return self._audio_end_response(progress)
+        except HTTPException as he:
+            raise he
+        except Exception as e:
+            logger.error(f"Error ending audio simulation: {e}", exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error ending audio simulation: {str(e)}")
 
-            transcriptObject = call_data.get("transcript_object", {})
-            duration = (call_data.get("end_timestamp", 0) -
-                        call_data.get("start_timestamp", 0)) // 1000
+    async def get_audio_simulation_status(
+            self, usersimulationprogress_id: str) -> EndSimulationResponse:
+        """Scoring state of an audio attempt ended via end_audio_simulation"""
+        try:
+            progress = await self.db.user_sim_progress.find_one(
+                {"_id": ObjectId(usersimulationprogress_id)})
+            if not progress:
+                raise HTTPException(
+                    status_code=404,
+                    detail=
+                    f"Attempt with id {usersimulationprogress_id} not found")
+            return self._audio_end_response(progress)
+        except HTTPException as he:
+            raise he
+        except Exception as e:
+            logger.error(f"Error fetching audio simulation status: {e}",
+                         exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error fetching audio simulation status: {str(e)}")
+
+    @staticmethod
+    def _audio_end_response(progress: Dict[str, Any]) -> EndSimulationResponse:
+        if progress.get("status") == "completed":
+            status = "success"
+        elif progress.get("scoringStatus") == "failed":
+            status = "failed"
+        else:
+            status = "pending"
+        return EndSimulationResponse(id=str(progress["_id"]),
+                                     status=status,
+                                     scores=progress.get("scores") or {},
+                                     duration=progress.get("duration", 0),
+                                     transcript=progress.get("transcript", ""),
+                                     audio_url=progress.get("audioUrl", ""))
+
+    async def handle_retell_webhook(self, event: str,
+                                    call_data: Dict[str, Any]) -> None:
+        """Score the attempt of a finished call in the background"""
+        logger.info(f"Retell webhook {event} for call "
+                    f"{call_data.get('call_id')}")
+        if event not in ("call_ended", "call_analyzed") or not call_ready(
+                call_data):
+            return
+        task = asyncio.create_task(self._finalize_audio_call(call_data))
+        _call_poll_tasks.add(task)
+        task.add_done_callback(_call_poll_tasks.discard)
+
+    async def _fetch_retell_call(self, call_id: str) -> Dict[str, Any]:
+        async with http_clients.session("retell") as session:
+            headers = {"Authorization": f"Bearer {RETELL_API_KEY}"}
+            url = f"https://api.retellai.com/v2/get-call/{call_id}"
+
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    logger.warning(
+                        f"Failed to fetch call details. Status: {response.status}"
+                    )
+                    raise HTTPException(
+                        status_code=response.status,
+                        detail="Failed to fetch call details from Retell AI")
+                return await response.json()
+
+    def _spawn_call_poll(self, call_id: str) -> None:
+        task = asyncio.create_task(self._poll_call_until_scored(call_id))
+        _call_poll_tasks.add(task)
+        task.add_done_callback(_call_poll_tasks.discard)
+
+    async def resume_call_polls(self) -> int:
+        """Restart fallback polling for ended calls a previous process left
+
+        Covers audio attempts ended within the poll window that are neither
+        completed nor marked failed. Finalizing is exactly-once, so a call
+        also resumed by another process (or its webhook) is scored once.
+        """
+        since = datetime.utcnow() - timedelta(
+            seconds=RETELL_CALL_POLL_TIMEOUT_SECONDS)
+        resumed = 0
+        async for progress in self.db.user_sim_progress.find(
+            {
+                "endRequestedAt": {
+                    "$gte": since
+                },
+                "status": {
+                    "$ne": "completed"
+                },
+                "scoringStatus": {
+                    "$ne": "failed"
+                }
+            }, {"callId": 1}):
+            if progress.get("callId"):
+                self._spawn_call_poll(progress["callId"])
+                resumed += 1
+        if resumed:
+            logger.info(f"Resumed polling for {resumed} ended Retell call(s)")
+        return resumed
+
+    async def _poll_call_until_scored(self, call_id: str) -> None:
+        """Fallback for a missing webhook: poll get-call with backoff"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + RETELL_CALL_POLL_TIMEOUT_SECONDS
+        delay = RETELL_CALL_POLL_INITIAL_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                progress = await self.db.user_sim_progress.find_one(
+                    {"callId": call_id}, {"status": 1})
+                if not progress or progress.get("status") == "completed":
+                    return
+                call_data = await self._fetch_retell_call(call_id)
+                if call_ready(call_data) and await self._finalize_audio_call(
+                        call_data):
+                    return
+            except Exception as e:
+                logger.warning(f"Polling Retell call {call_id} failed: {e}")
+            if loop.time() + delay > deadline:
+                break
+            delay = min(delay * 2, RETELL_CALL_POLL_MAX_INTERVAL_SECONDS)
+
+        logger.error(f"Timed out waiting for Retell call data, call={call_id}")
+        await self.db.user_sim_progress.update_one(
+            {
+                "callId": call_id,
+                "status": {
+                    "$ne": "completed"
+                }
+            }, {
+                "$set": {
+                    "scoringStatus": "failed",
+                    "scoringError": "Timed out waiting for call data",
+                    "lastModifiedAt": datetime.utcnow()
+                }
+            })
 
-            update_doc = {
-                "status": "completed",
-                "transcript": transcript,
-                "transcriptObject": transcriptObject,
-                "audioUrl": call_data.get("recording_url", ""),
-                "duration": duration,
-                "scores": scores,
-                "completedAt": datetime.utcnow(),
-                "lastModifiedAt": datetime.utcnow()
-            }
+    async def _finalize_audio_call(self, call_data: Dict[str, Any]) -> bool:
+        """Score and complete the attempt of a finished call exactly once
 
-            await self.db.user_sim_progress.update_one(
-                {"_id": ObjectId(usersimulationprogress_id)},
-                {"$set": update_doc})
+        Returns False when there is nothing to do (unknown call, already
+        completed, or being scored by a concurrent webhook/poll).
+        """
+        call_id = call_data.get("call_id")
+        now = datetime.utcnow()
+        progress = await self.db.user_sim_progress.find_one_and_update(
+            {
+                "callId": call_id,
+                "status": {
+                    "$ne": "completed"
+                },
+                "$or": [{
+                    "scoringStatus": {
+                        "$ne": "scoring"
+                    }
+                }, {
+                    "scoringStartedAt": {
+                        "$lt":
+                        now - timedelta(seconds=AUDIO_SCORING_LEASE_SECONDS)
+                    }
+                }]
+            }, {
+                "$set": {
+                    "scoringStatus": "scoring",
+                    "scoringStartedAt": now
+                }
+            },
+            projection={"simulationId": 1},
+            return_document=ReturnDocument.AFTER)
+        if not progress:
+            return False
 
+        usersimulationprogress_id = str(progress["_id"])
+        try:
+            update_doc = await self._score_audio_call(
+                progress["simulationId"], call_data)
+            await self._complete_progress(usersimulationprogress_id,
+                                          update_doc)
+            await self.scoring_jobs.enqueue_attempt_analysis(
+                usersimulationprogress_id, "audio")
             logger.info(
                 f"Audio simulation ended. ID={usersimulationprogress_id}")
-            return EndSimulationResponse(id=usersimulationprogress_id,
-                                         status="success",
-                                         scores=scores,
-                                         duration=duration,
-                                         transcript=transcript,
-                                         audio_url=call_data.get(
-                                             "recording_url", ""))
-        except HTTPException as he:
-            raise he
+            return True
         except Exception as e:
-            logger.error(f"Error ending audio simulation: {e}", exc_info=True)
+            logger.error(f"Error scoring audio simulation "
+                         f"{usersimulationprogress_id}: {e}",
+                         exc_info=True)
+            await self.db.user_sim_progress.update_one(
+                {"_id": progress["_id"]}, {
+                    "$set": {
+                        "scoringStatus": "failed",
+                        "scoringError": str(e),
+                        "lastModifiedAt": datetime.utcnow()
+                    }
+                })
+            return False
+
+    async def _score_audio_call(self, simulation_id: str,
+                                call_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Use internal method that doesn't require workspace
+        sim: SimulationByIDResponse = await self._get_simulation_by_id_internal(simulation_id)
+        if not sim:
+            logger.warning(
+                f"Simulation {simulation_id} not found for end_audio_simulation."
+            )
             raise HTTPException(
-                status_code=500,
-                detail=f"Error ending audio simulation: {str(e)}")
+                status_code=404,
+                detail=f"Simulation with id {simulation_id} not found")
+
+        scores = {
+            'SimAccuracy': 0,
+            'KeywordScore': 0,
+            'ClickScore': 0,
+            'Confidence': 0,
+            'Energy': 0,
+            'Concentration': 0
+        }
+        original_script = [{
+            **s.dict(), "script_sentence":
+            re.sub('<.*?>', '', s.script_sentence)
+        } for s in sim.simulation.script]
+        transcript = call_data.get("transcript", "").replace(
+            "User", "Customer").replace("Agent", "Trainee")
+
+        keyword_score = await self.scoring_service.get_keyword_score_analysis_regex(
+            original_script, transcript)
+        if keyword_score:
+            scores['KeywordScore'] = keyword_score.keyword_score
+
+        transcriptObject = call_data.get("transcript_object", {})
+        duration = (call_data.get("end_timestamp", 0) -
+                    call_data.get("start_timestamp", 0)) // 1000
+
+        return {
+            "status": "completed",
+            "scoringStatus": "completed",
+            "transcript": transcript,
+            "transcriptObject": transcriptObject,
+            "audioUrl": call_data.get("recording_url", ""),
+            "duration": duration,
+            "scores": scores,
+            "completedAt": datetime.utcnow(),
+            "lastModifiedAt": datetime.utcnow()
+        }
 
     async def end_visual_attempt(
             self, user_id: str, simulation_id: str,
@@ -2061,9 +2380,8 @@ class SimulationService:
                 "lastModifiedAt": datetime.utcnow()
             }
 
-            await self.db.user_sim_progress.update_one(
-                {"_id": ObjectId(usersimulationprogress_id)},
-                {"$set": update_doc})
+            await self._complete_progress(usersimulationprogress_id,
+                                          update_doc)
 
             return EndSimulationResponse(id=usersimulationprogress_id,
                                          status="success",
@@ -1,7 +1,7 @@
 from typing import List, Dict, Any
-import aiohttp
 from fastapi import HTTPException
 from config import RETELL_API_KEY
+from infrastructure.http_client import http_clients
 from utils.logger import Logger  # Make sure your import path is correct
 
 logger = Logger.get_logger(__name__)
@@ -13,7 +13,7 @@ class VoiceService:
         """Get list of available voices from Retell AI"""
         logger.info("Fetching list of available voices from Retell AI.")
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_clients.session("retell") as session:
                 headers = {'Authorization': f'Bearer {RETELL_API_KEY}'}
                 logger.debug(
                     f"GET request to Retell AI: /list-voices with headers: {headers}"
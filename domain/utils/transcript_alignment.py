@@ -0,0 +1,94 @@
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (is_trainee, normalised text) of a script line or transcript turn
+Line = Tuple[bool, str]
+
+
+def overlap_similarity(script_lines: Sequence[Line], turns: Sequence[Line],
+                       pairs: np.ndarray) -> np.ndarray:
+    """Dice token overlap of the given (script line, turn) index pairs"""
+    vocabulary: Dict[str, int] = {}
+    bags = []
+    for _, text in list(script_lines) + list(turns):
+        tokens = {vocabulary.setdefault(token, len(vocabulary))
+                  for token in text.split()}
+        bags.append(tokens)
+
+    matrix = np.zeros((len(bags), max(len(vocabulary), 1)), dtype=np.float32)
+    for row, tokens in enumerate(bags):
+        matrix[row, list(tokens)] = 1.0
+    sizes = matrix.sum(axis=1)
+
+    script_rows = pairs[:, 0]
+    turn_rows = pairs[:, 1] + len(script_lines)
+    shared = np.einsum("ij,ij->i", matrix[script_rows], matrix[turn_rows])
+    total = sizes[script_rows] + sizes[turn_rows]
+    return np.divide(2 * shared, total, out=np.zeros_like(shared),
+                     where=total > 0)
+
+
+def align_transcript(script_lines: Sequence[Line], turns: Sequence[Line],
+                     band: int, gap_cost: float = 0.5) -> List[Optional[int]]:
+    """Map each script line to the transcript turn it was spoken in
+
+    Banded global alignment: a script line may only pair with a turn of the
+    same role, at cost ``1 - token overlap``; skipping a script line (not
+    said) or a turn (ad-libbed) costs ``gap_cost``. Only cells within
+    ``band`` of the length-scaled diagonal are evaluated, so the cost is
+    O(n·band) rather than O(n·m).
+
+    Returns:
+        For every script line, the index of its turn or None if unmatched
+    """
+    n, m = len(script_lines), len(turns)
+    if not n or not m:
+        return [None] * n
+
+    # Wide enough that consecutive rows' windows always connect
+    band = max(band, math.ceil(m / n)) + 1
+    centers = [round(i * m / n) for i in range(n + 1)]
+    lo = [max(0, c - band) for c in centers]
+    hi = [min(m, c + band) for c in centers]
+
+    # Similarities of every same-role cell inside the band, in one batch
+    pairs = np.array([(i - 1, j - 1) for i in range(1, n + 1)
+                      for j in range(max(lo[i], 1), hi[i] + 1)
+                      if script_lines[i - 1][0] == turns[j - 1][0]],
+                     dtype=np.int64).reshape(-1, 2)
+    match_cost = np.full((n, m), np.inf)
+    if len(pairs):
+        match_cost[pairs[:, 0], pairs[:, 1]] = \
+            1.0 - overlap_similarity(script_lines, turns, pairs)
+
+    cost = np.full((n + 1, m + 1), np.inf)
+    # 0 = diagonal (pair), 1 = up (skip script line), 2 = left (skip turn)
+    move = np.zeros((n + 1, m + 1), dtype=np.int8)
+    cost[0, :hi[0] + 1] = gap_cost * np.arange(hi[0] + 1)
+    move[0, 1:] = 2
+    for i in range(1, n + 1):
+        for j in range(lo[i], hi[i] + 1):
+            best, step = cost[i - 1, j] + gap_cost, 1
+            if j:
+                diagonal = cost[i - 1, j - 1] + match_cost[i - 1, j - 1]
+                if diagonal <= best:
+                    best, step = diagonal, 0
+                left = cost[i, j - 1] + gap_cost
+                if left < best:
+                    best, step = left, 2
+            cost[i, j], move[i, j] = best, step
+
+    aligned: List[Optional[int]] = [None] * n
+    i, j = n, m
+    while i > 0:
+        step = move[i, j] if j else 1
+        if step == 0:
+            aligned[i - 1] = j - 1
+            i, j = i - 1, j - 1
+        elif step == 1:
+            i -= 1
+        else:
+            j -= 1
+    return aligned
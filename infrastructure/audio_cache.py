@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from typing import Dict
+from urllib.parse import urlparse
+
+from config import (AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES,
+                    AUDIO_DOWNLOAD_CHUNK_BYTES)
+from infrastructure.http_client import http_clients
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class AudioFileCache:
+    """Content-addressed on-disk cache of call recordings
+
+    Recordings are named by the SHA-256 of their URL, so re-scoring a call
+    reads the local copy instead of downloading it again. Downloads are
+    streamed chunk by chunk into a temp file in the cache directory and
+    renamed into place, so the body is never held in memory and readers
+    (the DSP processes) never see a partial file. The directory is bounded
+    by ``max_bytes``; least recently used recordings are removed first.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, chunk_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.chunk_bytes = chunk_bytes
+        self._downloads: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        # Keep the extension; audioread picks a decoder from it
+        suffix = os.path.splitext(urlparse(url).path)[1].lower() or ".wav"
+        return os.path.join(self.directory, digest + suffix)
+
+    async def fetch(self, url: str) -> str:
+        """Local path of the recording at ``url``, downloading it if needed"""
+        path = self.path_for(url)
+        if os.path.exists(path):
+            os.utime(path)
+            self.hits += 1
+            return path
+
+        # One download per recording even when jobs race for it
+        download = self._downloads.get(path)
+        if download is None:
+            self.misses += 1
+            download = asyncio.ensure_future(self._download(url, path))
+            self._downloads[path] = download
+            download.add_done_callback(
+                lambda _: self._downloads.pop(path, None))
+        await asyncio.shield(download)
+        return path
+
+    async def _download(self, url: str, path: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, partial_path = tempfile.mkstemp(dir=self.directory,
+                                            suffix=".part")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async with http_clients.session("audio") as session:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.content.iter_chunked(
+                                self.chunk_bytes):
+                            f.write(chunk)
+                            size += len(chunk)
+            os.replace(partial_path, path)
+            logger.debug(f"Cached recording {url} ({size} bytes) at {path}")
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        self._prune(keep=path)
+
+    def _prune(self, keep: str) -> None:
+        try:
+            entries = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if (entry.is_file() and entry.path != keep
+                            and not entry.name.endswith(".part")):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size,
+                                        entry.path))
+            total = sum(size for _, size, _ in entries) + os.path.getsize(keep)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+        except OSError as e:
+            logger.warning(f"Failed to prune audio cache: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+audio_cache = AudioFileCache(AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES,
+                             AUDIO_DOWNLOAD_CHUNK_BYTES)
@@ -1,5 +1,7 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from config import MONGO_URI, DB_NAME
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+from typing import Optional
+from config import MONGO_URI, DB_NAME, INDEX_BUILD_BACKGROUND
+from infrastructure.indexes import INDEX_REGISTRY, build_index_models
 
 from utils.logger import Logger
 
@@ -24,9 +26,18 @@ class Database:
                 cls._instance.modules = db["modules"]
                 cls._instance.simulations = db["simulations"]
                 cls._instance.user_sim_progress = db["userSimulationProgress"]
+                cls._instance.sim_progress_summaries = db[
+                    "simulationProgressSummaries"]
                 cls._instance.sim_attempts = db["simulationAttempts"]
                 cls._instance.images = db["images"]
+                cls._instance.image_blobs = AsyncIOMotorGridFSBucket(
+                    db, bucket_name="imageBlobs")
                 cls._instance.tags = db["tags"]  # Add tags collection
+                cls._instance.scoring_jobs = db["scoringJobs"]
+                cls._instance.advanced_scoring_results = db[
+                    "advancedScoringResults"]
+                cls._instance.advanced_scoring_errors = db[
+                    "advancedScoringErrors"]
                 logger.info("Database connection initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to connect to MongoDB: {str(e)}",
@@ -36,6 +47,23 @@ class Database:
 
         return cls._instance
 
+    async def ensure_indexes(self, background: Optional[bool] = None) -> None:
+        """Create every registered index; existing ones are left untouched"""
+        if background is None:
+            background = INDEX_BUILD_BACKGROUND
+        for attr, specs in INDEX_REGISTRY.items():
+            collection = getattr(self, attr)
+            try:
+                names = await collection.create_indexes(
+                    build_index_models(specs, background))
+                logger.debug(f"Indexes ensured on {collection.name}: {names}")
+            except Exception as e:
+                # A conflicting index must not keep the API from starting
+                logger.error(
+                    f"Failed to ensure indexes on {collection.name}: {str(e)}",
+                    exc_info=True)
+        logger.info("Database indexes ensured")
+
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
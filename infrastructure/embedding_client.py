@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import re
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from config import (SBERT_ENCODE_URL, SBERT_ENCODER, SBERT_BATCH_MAX_SENTENCES,
+                    SBERT_BATCH_WAIT_SECONDS)
+from infrastructure.http_client import http_clients
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class SbertEncoder:
+    """Sentence embeddings from the SBERT ``/encode`` endpoint"""
+
+    async def encode(self, sentences: List[str]) -> np.ndarray:
+        async with http_clients.session("sbert") as session:
+            async with session.post(
+                    SBERT_ENCODE_URL,
+                    json={"sentences": sentences},
+                    headers={"Content-Type": "application/json"}) as response:
+                if response.status != 200:
+                    raise RuntimeError(
+                        f"SBERT encode returned status {response.status}")
+                result = await response.json()
+        return np.asarray(result["embeddings"], dtype=np.float32)
+
+
+class StubEncoder:
+    """Deterministic local encoder for tests and offline development
+
+    Hashes words and character trigrams into a fixed-size vector, so
+    sentences sharing wording score a high cosine similarity.
+    """
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+
+    def _features(self, sentence: str) -> List[str]:
+        words = re.findall(r"[a-z0-9']+", sentence.lower())
+        text = f" {' '.join(words)} "
+        return words + [text[i:i + 3] for i in range(len(text) - 2)]
+
+    async def encode(self, sentences: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(sentences), self.dimensions), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            for feature in self._features(sentence):
+                digest = hashlib.md5(feature.encode("utf-8")).digest()
+                vectors[row, int.from_bytes(digest[:4], "little") %
+                        self.dimensions] += 1.0
+        return vectors
+
+
+class EmbeddingClient:
+    """Unit-normalised sentence embeddings, micro-batched across callers
+
+    ``embed`` queues sentences and sends them to the encoder together with
+    whatever other scoring jobs queued within ``max_wait`` seconds, up to
+    ``max_batch`` sentences per request. ``embed_static`` is for fixed
+    sentence lists (objection patterns): they are encoded once per process
+    and kept. Rows are unit length, so cosine similarity is a dot product.
+    """
+
+    def __init__(self, encoder, max_batch: int, max_wait: float):
+        self.encoder = encoder
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle = None
+        # The loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+        self._static: Dict[Tuple[str, ...], asyncio.Future] = {}
+        self.requests = 0
+        self.sentences = 0
+
+    async def embed(self, sentences: Sequence[str]) -> np.ndarray:
+        if not sentences:
+            return np.zeros((0, 0), dtype=np.float32)
+        loop = asyncio.get_running_loop()
+        futures = []
+        for sentence in sentences:
+            future = loop.create_future()
+            self._pending.append((sentence, future))
+            futures.append(future)
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return np.vstack(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch):
+            task = asyncio.ensure_future(
+                self._encode_batch(pending[start:start + self.max_batch]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _encode_batch(self,
+                            batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Callers that timed out have cancelled their futures; skip them
+        batch = [(sentence, future) for sentence, future in batch
+                 if not future.done()]
+        if not batch:
+            return
+        unique = list(dict.fromkeys(sentence for sentence, _ in batch))
+        try:
+            vectors = _normalize(await self.encoder.encode(unique))
+            self.requests += 1
+            self.sentences += len(unique)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        rows = dict(zip(unique, vectors))
+        for sentence, future in batch:
+            if not future.done():
+                future.set_result(rows[sentence])
+
+    async def embed_static(self, sentences: Sequence[str]) -> np.ndarray:
+        """Embeddings of a fixed sentence list, encoded once and cached"""
+        key = tuple(sentences)
+        cached = self._static.get(key)
+        if cached is None:
+            cached = asyncio.ensure_future(self._encode_static(list(key)))
+            self._static[key] = cached
+        try:
+            return await asyncio.shield(cached)
+        except Exception:
+            # Retry on the next call rather than caching the failure
+            if self._static.get(key) is cached:
+                del self._static[key]
+            raise
+
+    async def _encode_static(self, sentences: List[str]) -> np.ndarray:
+        vectors = _normalize(await self.encoder.encode(sentences))
+        self.requests += 1
+        self.sentences += len(sentences)
+        logger.info(f"Cached embeddings for {len(sentences)} static sentences")
+        return vectors
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "sentences": self.sentences,
+            "static_sets": len(self._static)
+        }
+
+
+embedding_client = EmbeddingClient(
+    StubEncoder() if SBERT_ENCODER == "stub" else SbertEncoder(),
+    SBERT_BATCH_MAX_SENTENCES, SBERT_BATCH_WAIT_SECONDS)
@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
+
+import aiohttp
+
+from config import (HTTP_POOL_LIMIT, HTTP_POOL_LIMIT_PER_HOST,
+                    HTTP_KEEPALIVE_SECONDS, HTTP_DNS_CACHE_TTL_SECONDS,
+                    HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TOTAL_TIMEOUT_SECONDS)
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class HttpClientRegistry:
+    """Long-lived pooled ``aiohttp`` sessions, one per upstream service
+
+    Each named client (``retell``, ``deepgram``, ``sbert``, ``qwen``,
+    ``audio``) owns its own connector, so a slow upstream can't starve the
+    others, and connections are kept alive and reused across requests.
+    Sessions are created lazily on the running loop and closed by the app
+    lifespan.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, Tuple[aiohttp.ClientSession,
+                                        asyncio.AbstractEventLoop]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _trace_config(self, name: str) -> aiohttp.TraceConfig:
+        counters = self._counters.setdefault(name, {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0
+        })
+
+        async def on_request_start(session, context, params):
+            counters["requests"] += 1
+
+        async def on_connection_create_end(session, context, params):
+            counters["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            counters["connections_reused"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def get(self, name: str) -> aiohttp.ClientSession:
+        """The shared session for ``name``; never close it yourself"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(name)
+        if entry and not entry[0].closed and entry[1] is loop:
+            return entry[0]
+
+        logger.info(f"Opening pooled HTTP client '{name}'")
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS)
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=HTTP_TOTAL_TIMEOUT_SECONDS,
+                connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            trace_configs=[self._trace_config(name)])
+        self._sessions[name] = (session, loop)
+        return session
+
+    @asynccontextmanager
+    async def session(self, name: str) -> AsyncIterator[aiohttp.ClientSession]:
+        """Drop-in for ``async with aiohttp.ClientSession()`` that keeps the
+        pooled session open on exit"""
+        yield self.get(name)
+
+    async def close(self) -> None:
+        sessions, self._sessions = self._sessions, {}
+        for name, (session, loop) in sessions.items():
+            if not session.closed and loop is asyncio.get_running_loop():
+                await session.close()
+                logger.info(f"Closed pooled HTTP client '{name}'")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for name, (session, _) in self._sessions.items():
+            connector = session.connector
+            stats[name] = {
+                "closed": session.closed,
+                "limit": connector.limit if connector else 0,
+                "limit_per_host": connector.limit_per_host if connector else 0,
+                # Private connector state; there is no public pool API
+                "active_connections":
+                len(getattr(connector, "_acquired", ())),
+                "idle_connections":
+                sum(len(conns)
+                    for conns in getattr(connector, "_conns", {}).values()),
+                **self._counters.get(name, {})
+            }
+        return stats
+
+
+http_clients = HttpClientRegistry()
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import IMAGE_CACHE_MAX_BYTES, IMAGE_CACHE_MAX_ITEM_BYTES
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class CachedImage:
+    """Image bytes plus the metadata needed to answer a request"""
+
+    def __init__(self, data: bytes, content_type: str, etag: str,
+                 last_modified: Optional[datetime]):
+        self.data = data
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ImageByteCache:
+    """Per-worker LRU of hot images bounded by total bytes
+
+    Images are immutable per id, so entries never need invalidation; they
+    only leave on eviction. Images larger than ``max_item_bytes`` are never
+    cached so one huge upload can't flush the working set.
+    """
+
+    def __init__(self, max_bytes: int, max_item_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = min(max_item_bytes, max_bytes)
+        self._entries: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, image_id: str) -> Optional[CachedImage]:
+        image = self._entries.get(image_id)
+        if image is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(image_id)
+        self.hits += 1
+        return image
+
+    def cacheable(self, size: int) -> bool:
+        return 0 < size <= self.max_item_bytes
+
+    def put(self, image_id: str, image: CachedImage) -> None:
+        if not self.cacheable(len(image.data)):
+            return
+        previous = self._entries.pop(image_id, None)
+        if previous:
+            self.size_bytes -= len(previous.data)
+        self._entries[image_id] = image
+        self.size_bytes += len(image.data)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted.data)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+image_cache = ImageByteCache(IMAGE_CACHE_MAX_BYTES, IMAGE_CACHE_MAX_ITEM_BYTES)
@@ -0,0 +1,73 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Optional, Union
+
+from PIL import Image, ImageOps
+
+from config import (IMAGE_DERIVATIVE_WORKERS, IMAGE_THUMB_WIDTH,
+                    IMAGE_MEDIUM_WIDTH, IMAGE_WEBP_QUALITY)
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Variant name -> target width; None keeps the original resolution.
+# Every variant is WebP-encoded.
+DERIVATIVE_WIDTHS: Dict[str, Optional[int]] = {
+    "thumb": IMAGE_THUMB_WIDTH,
+    "medium": IMAGE_MEDIUM_WIDTH,
+    "webp": None,
+}
+
+DERIVATIVE_CONTENT_TYPE = "image/webp"
+
+# Decoding and re-encoding slides is CPU-bound; Pillow releases the GIL
+# while doing so, which keeps the event loop responsive
+_executor = ThreadPoolExecutor(max_workers=IMAGE_DERIVATIVE_WORKERS,
+                               thread_name_prefix="image-derivatives")
+
+
+def render_derivatives(data: Union[bytes, BinaryIO]) -> Dict[str, bytes]:
+    """Encode every variant of ``data`` that is smaller than the original
+
+    ``data`` is the image bytes or a seekable file holding them. Widths are
+    never upscaled; a variant that would not be smaller than the uploaded
+    bytes is skipped, so serving falls back to the original.
+    """
+    if isinstance(data, bytes):
+        size, data = len(data), io.BytesIO(data)
+    else:
+        size = data.seek(0, io.SEEK_END)
+        data.seek(0)
+    with Image.open(data) as source:
+        source = ImageOps.exif_transpose(source)
+        if source.mode not in ("RGB", "RGBA"):
+            source = source.convert(
+                "RGBA" if "transparency" in source.info
+                or source.mode in ("LA", "PA") else "RGB")
+
+        rendered = {}
+        for name, width in DERIVATIVE_WIDTHS.items():
+            if width is not None and source.width <= width:
+                continue
+            image = source
+            if width is not None:
+                height = max(round(source.height * width / source.width), 1)
+                image = source.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, "WEBP", quality=IMAGE_WEBP_QUALITY, method=4)
+            encoded = buffer.getvalue()
+            if len(encoded) < size:
+                rendered[name] = encoded
+        return rendered
+
+
+async def generate_derivatives(
+        data: Union[bytes, BinaryIO]) -> Dict[str, bytes]:
+    """Render derivatives on the worker pool; undecodable images get none"""
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, render_derivatives, data)
+    except Exception as e:
+        logger.warning(f"Skipping image derivatives: {str(e)}")
+        return {}
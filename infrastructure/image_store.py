@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+from datetime import datetime
+from typing import (Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple,
+                    Union)
+
+from gridfs.errors import FileExists, NoFile
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from infrastructure.database import Database
+from infrastructure.image_derivatives import (DERIVATIVE_CONTENT_TYPE,
+                                              generate_derivatives)
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class ImageStore:
+    """Content-addressed slide image storage
+
+    Bytes live once in the ``imageBlobs`` GridFS bucket under their SHA-256
+    hex digest, however many slides, updates or clones reference them.
+    ``images`` documents stay small: slide metadata plus the digest. The
+    ``_id`` of an ``images`` document is what ``/images/{image_id}`` serves.
+    Legacy documents that still carry inline ``data`` keep working.
+
+    Resized/WebP ``derivatives`` are rendered once per new document and
+    stored the same way, keyed by variant name.
+    """
+
+    def __init__(self):
+        self.db = Database()
+
+    async def save(self,
+                   image_id: str,
+                   name: str,
+                   content_type: str,
+                   data: bytes,
+                   digest: Optional[str] = None) -> Any:
+        """Store image bytes and return the ``images`` document id"""
+        digest = digest or hashlib.sha256(data).hexdigest()
+        await self._save_blob(digest, data)
+
+        # Re-uploading the same slide content reuses its images document
+        key = {"imageId": image_id, "sha256": digest}
+        try:
+            result = await self._upsert_image(key, name, content_type,
+                                              len(data))
+        except DuplicateKeyError:
+            # Lost an upsert race on the (imageId, sha256) unique index
+            result = await self.db.images.find_one(key, {
+                "_id": 1,
+                "derivatives": 1
+            })
+        if "derivatives" not in result:
+            await self._save_derivatives(result["_id"], data)
+        return result["_id"]
+
+    async def save_stream(self, image_id: str, name: str, content_type: str,
+                          upload: Any, length: int, digest: str,
+                          chunk_size: int) -> Any:
+        """Store an upload already hashed to ``digest`` without buffering it
+
+        ``upload`` is an ``UploadFile``: it is rewound and copied into GridFS
+        ``chunk_size`` bytes at a time, and derivatives are rendered from its
+        spooled file. Returns the ``images`` document id.
+        """
+        if not await self._blob_exists(digest):
+            await upload.seek(0)
+            grid_in = self.db.image_blobs.open_upload_stream_with_id(
+                digest, digest)
+            try:
+                while True:
+                    chunk = await upload.read(chunk_size)
+                    if not chunk:
+                        break
+                    await grid_in.write(chunk)
+                await grid_in.close()
+                logger.debug(f"Streamed image blob {digest} ({length} bytes)")
+            except (DuplicateKeyError, FileExists):
+                # A concurrent upload of the same content owns the chunks;
+                # aborting here would delete them
+                pass
+            except BaseException:
+                await grid_in.abort()
+                raise
+
+        key = {"imageId": image_id, "sha256": digest}
+        try:
+            result = await self._upsert_image(key, name, content_type, length)
+        except DuplicateKeyError:
+            result = await self.db.images.find_one(key, {
+                "_id": 1,
+                "derivatives": 1
+            })
+        if "derivatives" not in result:
+            await self._save_derivatives(result["_id"], upload.file)
+        return result["_id"]
+
+    async def save_many(self,
+                        images: List[Tuple[str, str, str, bytes, str]],
+                        concurrency: int) -> List[Any]:
+        """Store ``(image_id, name, content_type, data, digest)`` tuples
+
+        Blobs are written concurrently (at most ``concurrency`` at a time)
+        and every ``images`` document is upserted in one unordered bulk
+        write. Returns the document ids in input order.
+        """
+        if not images:
+            return []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def save_blob(digest: str, data: bytes) -> None:
+            async with semaphore:
+                await self._save_blob(digest, data)
+
+        blobs = {digest: data for _, _, _, data, digest in images}
+        await asyncio.gather(*(save_blob(digest, data)
+                               for digest, data in blobs.items()))
+
+        now = datetime.utcnow()
+        upserts = {}
+        for image_id, name, content_type, data, digest in images:
+            upserts.setdefault((image_id, digest),
+                               UpdateOne(
+                                   {
+                                       "imageId": image_id,
+                                       "sha256": digest
+                                   }, {
+                                       "$setOnInsert": {
+                                           "imageId": image_id,
+                                           "sha256": digest,
+                                           "name": name,
+                                           "contentType": content_type,
+                                           "length": len(data),
+                                           "uploadedAt": now
+                                       }
+                                   },
+                                   upsert=True))
+        try:
+            await self.db.images.bulk_write(list(upserts.values()),
+                                            ordered=False)
+        except BulkWriteError as e:
+            # Upsert races on the (imageId, sha256) unique index are benign
+            if any(error.get("code") != 11000
+                   for error in e.details.get("writeErrors", [])):
+                raise
+
+        docs = {}
+        async for doc in self.db.images.find(
+            {
+                "$or": [{
+                    "imageId": image_id,
+                    "sha256": digest
+                } for image_id, digest in upserts]
+            }, {
+                "imageId": 1,
+                "sha256": 1,
+                "derivatives": 1
+            }):
+            docs[(doc["imageId"], doc["sha256"])] = doc
+
+        async def save_derivatives(doc: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self._save_derivatives(doc["_id"], blobs[doc["sha256"]])
+
+        await asyncio.gather(*(save_derivatives(doc) for doc in docs.values()
+                               if "derivatives" not in doc))
+        return [
+            docs[(image_id, digest)]["_id"]
+            for image_id, _, _, _, digest in images
+        ]
+
+    async def _save_derivatives(self, image_object_id: Any,
+                                data: Union[bytes, BinaryIO]) -> None:
+        rendered = await generate_derivatives(data)
+        derivatives = {}
+        for name, variant in rendered.items():
+            digest = hashlib.sha256(variant).hexdigest()
+            await self._save_blob(digest, variant)
+            derivatives[name] = {
+                "sha256": digest,
+                "contentType": DERIVATIVE_CONTENT_TYPE,
+                "length": len(variant)
+            }
+        # Recorded even when empty so the same content isn't re-rendered
+        await self.db.images.update_one({"_id": image_object_id},
+                                        {"$set": {
+                                            "derivatives": derivatives
+                                        }})
+        logger.debug(f"Stored derivatives {list(derivatives)} for image "
+                     f"{image_object_id}")
+
+    async def _upsert_image(self, key: Dict[str, Any], name: str,
+                            content_type: str, length: int) -> Dict[str, Any]:
+        return await self.db.images.find_one_and_update(
+            key, {
+                "$setOnInsert": {
+                    **key,
+                    "name": name,
+                    "contentType": content_type,
+                    "length": length,
+                    "uploadedAt": datetime.utcnow()
+                }
+            },
+            projection={
+                "_id": 1,
+                "derivatives": 1
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER)
+
+    async def _blob_exists(self, digest: str) -> bool:
+        try:
+            # Opening reads only the files document, not the chunks
+            await self.db.image_blobs.open_download_stream(digest)
+        except NoFile:
+            return False
+        logger.debug(f"Image blob {digest} already stored")
+        return True
+
+    async def _save_blob(self, digest: str, data: bytes) -> None:
+        if await self._blob_exists(digest):
+            return
+        try:
+            await self.db.image_blobs.upload_from_stream_with_id(
+                digest, digest, data)
+            logger.debug(f"Stored image blob {digest} ({len(data)} bytes)")
+        except (DuplicateKeyError, FileExists):
+            # A concurrent upload stored the same content first
+            pass
+
+    async def iter_chunks(self,
+                          image_doc: Dict[str, Any],
+                          start: int = 0,
+                          end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream image bytes ``[start, end]`` one GridFS chunk at a time"""
+        if image_doc.get("data") is not None:
+            data = image_doc["data"]
+            yield data[start:None if end is None else end + 1]
+            return
+        try:
+            grid_out = await self.db.image_blobs.open_download_stream(
+                image_doc["sha256"])
+        except NoFile:
+            logger.error(f"Missing image blob {image_doc.get('sha256')}")
+            return
+        if start:
+            grid_out.seek(start)
+        remaining = (grid_out.length if end is None else end + 1) - start
+        while remaining > 0:
+            chunk = await grid_out.read(min(remaining, grid_out.chunk_size))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    async def read(self, image_doc: Dict[str, Any]) -> bytes:
+        """Read the full image bytes (for callers that must inline them)"""
+        if image_doc.get("data") is not None:
+            return image_doc["data"]
+        return b"".join([chunk async for chunk in self.iter_chunks(image_doc)])
+
+    @staticmethod
+    def variant(image_doc: Dict[str, Any], size: str) -> Dict[str, Any]:
+        """The document to serve for ``size``, falling back to the original
+
+        Images already narrower than a resize target fall back to their
+        full-resolution WebP first.
+        """
+        derivatives = image_doc.get("derivatives") or {}
+        derivative = derivatives.get(size) or (derivatives.get("webp")
+                                               if size != "original" else None)
+        if not derivative:
+            return image_doc
+        return {
+            **derivative, "_id": image_doc["_id"],
+            "uploadedAt": image_doc.get("uploadedAt")
+        }
+
+    def size(self, image_doc: Dict[str, Any]) -> int:
+        if image_doc.get("data") is not None:
+            return len(image_doc["data"])
+        return image_doc.get("length", 0)
@@ -0,0 +1,324 @@
+"""Declarative index registry and query-shape verification
+
+Indexes are keyed by the ``Database`` collection attribute and applied
+idempotently at startup (see ``Database.ensure_indexes``).
+
+Run ``python -m infrastructure.indexes --check`` against a local mongod to
+build the registry and fail (exit 1) when a known query shape would still
+COLLSCAN.
+"""
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def _index(keys, name: str, **options) -> Dict[str, Any]:
+    return {"keys": keys, "name": name, **options}
+
+
+INDEX_REGISTRY: Dict[str, List[Dict[str, Any]]] = {
+    "user_sim_progress": [
+        _index([("userId", ASCENDING), ("assignmentId", ASCENDING),
+                ("simulationId", ASCENDING), ("workspace", ASCENDING)],
+               "user_assignment_simulation_workspace"),
+        _index([("userId", ASCENDING), ("simulationId", ASCENDING)],
+               "user_simulation"),
+        # Retell webhooks and call polls find the audio attempt by call
+        _index([("callId", ASCENDING)],
+               "callId",
+               partialFilterExpression={"callId": {
+                   "$exists": True
+               }}),
+        # Startup resumes polling for recently ended, unscored calls
+        _index([("endRequestedAt", ASCENDING)],
+               "endRequestedAt",
+               partialFilterExpression={"endRequestedAt": {
+                   "$exists": True
+               }}),
+    ],
+    "sim_progress_summaries": [
+        _index([("userId", ASCENDING), ("assignmentId", ASCENDING),
+                ("simulationId", ASCENDING), ("workspace", ASCENDING)],
+               "user_assignment_simulation_workspace"),
+    ],
+    "users": [
+        # Lookups by (_id, workspace) are served by the _id index
+        _index([("workspace", ASCENDING)], "workspace"),
+    ],
+    "assignments": [
+        _index([("workspace", ASCENDING), ("lastModifiedAt", DESCENDING)],
+               "workspace_lastModifiedAt"),
+        _index([("teamId.team_id", ASCENDING)], "teamId_team_id"),
+        _index([("traineeId", ASCENDING)], "traineeId"),
+        _index([("id", ASCENDING)], "entity_id"),
+    ],
+    "simulations": [
+        _index([("workspace", ASCENDING), ("lastModified", DESCENDING)],
+               "workspace_lastModified"),
+        _index([("workspace", ASCENDING), ("tags", ASCENDING)],
+               "workspace_tags"),
+        _index([("workspace", ASCENDING), ("status", ASCENDING),
+                ("lastModified", DESCENDING)],
+               "workspace_status_lastModified"),
+    ],
+    "training_plans": [
+        _index([("workspace", ASCENDING), ("lastModifiedAt", DESCENDING)],
+               "workspace_lastModifiedAt"),
+    ],
+    "modules": [
+        _index([("workspace", ASCENDING), ("lastModifiedAt", DESCENDING)],
+               "workspace_lastModifiedAt"),
+    ],
+    "sim_attempts": [
+        _index([("userId", ASCENDING), ("simulationId", ASCENDING)],
+               "user_simulation"),
+    ],
+    "images": [
+        _index([("imageId", ASCENDING)], "imageId"),
+        # One images document per (slide image, content); legacy inline
+        # documents have no digest and are left out
+        _index([("imageId", ASCENDING), ("sha256", ASCENDING)],
+               "imageId_sha256",
+               unique=True,
+               partialFilterExpression={"sha256": {
+                   "$exists": True
+               }}),
+    ],
+    "tags": [
+        _index([("workspace", ASCENDING)], "workspace"),
+    ],
+    "scoring_jobs": [
+        # Claims: due queued jobs, then expired leases
+        _index([("status", ASCENDING), ("runAt", ASCENDING)],
+               "status_runAt"),
+        _index([("status", ASCENDING), ("leaseUntil", ASCENDING)],
+               "status_leaseUntil"),
+        _index([("dedupeKey", ASCENDING)],
+               "dedupeKey",
+               unique=True,
+               partialFilterExpression={"dedupeKey": {
+                   "$exists": True
+               }}),
+        # Succeeded jobs expire; dead-lettered ones are kept
+        _index([("completedAt", ASCENDING)],
+               "completedAt_ttl",
+               expireAfterSeconds=7 * 24 * 3600),
+    ],
+}
+
+# Representative filters/sorts of the hot read paths. Values are samples;
+# only the shape matters to the planner.
+QUERY_SHAPES: List[Dict[str, Any]] = [
+    {
+        "collection": "user_sim_progress",
+        "filter": {
+            "userId": "u",
+            "assignmentId": "a",
+            "simulationId": "s",
+            "workspace": "w"
+        }
+    },
+    {
+        "collection": "user_sim_progress",
+        "filter": {
+            "userId": {
+                "$in": ["u"]
+            },
+            "assignmentId": {
+                "$in": ["a"]
+            },
+            "simulationId": {
+                "$in": ["s"]
+            }
+        }
+    },
+    {
+        "collection": "user_sim_progress",
+        "filter": {
+            "userId": "u",
+            "simulationId": "s"
+        }
+    },
+    {
+        "collection": "user_sim_progress",
+        "filter": {
+            "callId": "c"
+        }
+    },
+    {
+        "collection": "users",
+        "filter": {
+            "_id": "u",
+            "workspace": "w"
+        }
+    },
+    {
+        "collection": "assignments",
+        "filter": {
+            "workspace": "w"
+        },
+        "sort": [("lastModifiedAt", DESCENDING)]
+    },
+    {
+        "collection": "assignments",
+        "filter": {
+            "$or": [{
+                "traineeId": {
+                    "$in": ["u"]
+                }
+            }, {
+                "teamId": {
+                    "$elemMatch": {
+                        "team_id": {
+                            "$in": ["t"]
+                        }
+                    }
+                }
+            }]
+        }
+    },
+    {
+        "collection": "simulations",
+        "filter": {
+            "workspace": "w"
+        },
+        "sort": [("lastModified", DESCENDING)]
+    },
+    {
+        "collection": "simulations",
+        "filter": {
+            "workspace": "w",
+            "tags": {
+                "$in": ["t"]
+            }
+        }
+    },
+    {
+        "collection": "simulations",
+        "filter": {
+            "workspace": "w",
+            "status": {
+                "$in": ["published"]
+            }
+        },
+        "sort": [("lastModified", DESCENDING)]
+    },
+    {
+        "collection": "training_plans",
+        "filter": {
+            "workspace": "w"
+        },
+        "sort": [("lastModifiedAt", DESCENDING)]
+    },
+    {
+        "collection": "modules",
+        "filter": {
+            "workspace": "w"
+        },
+        "sort": [("lastModifiedAt", DESCENDING)]
+    },
+    {
+        "collection": "images",
+        "filter": {
+            "imageId": "i"
+        }
+    },
+    {
+        "collection": "scoring_jobs",
+        "filter": {
+            "status": "queued",
+            "runAt": {
+                "$lte": 0
+            }
+        },
+        "sort": [("runAt", ASCENDING)]
+    },
+    {
+        "collection": "tags",
+        "filter": {
+            "workspace": "w"
+        }
+    },
+]
+
+
+def build_index_models(specs: List[Dict[str, Any]],
+                       background: bool) -> List[IndexModel]:
+    return [
+        IndexModel(spec["keys"],
+                   background=background,
+                   **{k: v
+                      for k, v in spec.items() if k != "keys"})
+        for spec in specs
+    ]
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """Collect every stage name in an explain plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+async def find_collection_scans(db) -> List[Dict[str, Any]]:
+    """Explain every registered query shape, returning those that COLLSCAN"""
+    scans = []
+    for shape in QUERY_SHAPES:
+        cursor = getattr(db, shape["collection"]).find(shape["filter"])
+        if shape.get("sort"):
+            cursor = cursor.sort(shape["sort"])
+        explain = await cursor.explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        if "COLLSCAN" in _plan_stages(winning_plan):
+            scans.append(shape)
+    return scans
+
+
+async def _check() -> int:
+    from infrastructure.database import Database
+
+    db = Database()
+    await db.ensure_indexes(background=False)
+    scans = await find_collection_scans(db)
+    for shape in scans:
+        logger.error(f"COLLSCAN on {shape['collection']}: "
+                     f"filter={shape['filter']} sort={shape.get('sort')}")
+    if scans:
+        return 1
+    logger.info(f"All {len(QUERY_SHAPES)} query shapes use an index")
+    return 0
+
+
+async def _apply() -> int:
+    from infrastructure.database import Database
+
+    await Database().ensure_indexes()
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Apply the index registry or verify query shapes")
+    parser.add_argument("--check",
+                        action="store_true",
+                        help="fail if a known query shape would COLLSCAN")
+    args = parser.parse_args(argv)
+    return asyncio.run(_check() if args.check else _apply())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
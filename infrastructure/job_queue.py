@@ -0,0 +1,228 @@
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from config import (SCORING_JOB_LEASE_SECONDS, SCORING_JOB_MAX_ATTEMPTS,
+                    SCORING_JOB_BACKOFF_BASE_SECONDS,
+                    SCORING_JOB_BACKOFF_MAX_SECONDS,
+                    SCORING_JOB_QUEUED_MAX_AGE_SECONDS)
+from infrastructure.database import Database
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+
+
+class JobQueue:
+    """Durable job queue on the ``scoringJobs`` collection
+
+    Workers lease one job at a time with a single ``find_one_and_update``;
+    a job whose lease expires (crashed worker) becomes claimable again.
+    Failures are retried with exponential backoff and jitter until
+    ``maxAttempts``, after which the job is dead-lettered (``status=dead``)
+    and kept for inspection.
+
+    A job whose lease expires on its last allowed attempt (its worker
+    crashed or was OOM-killed every time) is not reclaimed; ``sweep``
+    dead-letters it, along with queued jobs no worker claimed within
+    ``SCORING_JOB_QUEUED_MAX_AGE_SECONDS`` of being due.
+    """
+
+    def __init__(self):
+        self.db = Database()
+
+    async def enqueue(self,
+                      job_type: str,
+                      payload: Dict[str, Any],
+                      dedupe_key: Optional[str] = None,
+                      max_attempts: int = SCORING_JOB_MAX_ATTEMPTS) -> None:
+        """Queue a job; a repeated ``dedupe_key`` is ignored"""
+        now = datetime.utcnow()
+        job = {
+            "type": job_type,
+            "payload": payload,
+            "status": QUEUED,
+            "attempts": 0,
+            "maxAttempts": max_attempts,
+            "runAt": now,
+            "createdAt": now,
+            "updatedAt": now
+        }
+        if dedupe_key:
+            job["dedupeKey"] = dedupe_key
+        try:
+            await self.db.scoring_jobs.insert_one(job)
+            logger.debug(f"Enqueued {job_type} job, dedupe_key={dedupe_key}")
+        except DuplicateKeyError:
+            logger.debug(f"{job_type} job {dedupe_key} already queued")
+
+    async def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Lease the next due job, or return None when the queue is idle"""
+        now = datetime.utcnow()
+        return await self.db.scoring_jobs.find_one_and_update(
+            {
+                "$or": [{
+                    "status": QUEUED,
+                    "runAt": {
+                        "$lte": now
+                    }
+                }, {
+                    "status": RUNNING,
+                    "leaseUntil": {
+                        "$lt": now
+                    },
+                    # Attempts that died with their worker count too
+                    "$expr": {
+                        "$lt": ["$attempts", "$maxAttempts"]
+                    }
+                }]
+            }, {
+                "$set": {
+                    "status": RUNNING,
+                    "workerId": worker_id,
+                    "leaseUntil":
+                    now + timedelta(seconds=SCORING_JOB_LEASE_SECONDS),
+                    "updatedAt": now
+                },
+                "$inc": {
+                    "attempts": 1
+                }
+            },
+            sort=[("runAt", ASCENDING)],
+            return_document=ReturnDocument.AFTER)
+
+    @staticmethod
+    def _lease(job: Dict[str, Any]) -> Dict[str, Any]:
+        # Only the worker holding this attempt's lease may settle the job
+        return {
+            "_id": job["_id"],
+            "status": RUNNING,
+            "workerId": job["workerId"],
+            "attempts": job["attempts"]
+        }
+
+    async def extend_lease(self, job: Dict[str, Any]) -> bool:
+        """Heartbeat for long-running jobs; False if the lease was lost"""
+        now = datetime.utcnow()
+        result = await self.db.scoring_jobs.update_one(
+            self._lease(job), {
+                "$set": {
+                    "leaseUntil":
+                    now + timedelta(seconds=SCORING_JOB_LEASE_SECONDS),
+                    "updatedAt": now
+                }
+            })
+        return result.modified_count == 1
+
+    async def complete(self, job: Dict[str, Any]) -> None:
+        now = datetime.utcnow()
+        await self.db.scoring_jobs.update_one(self._lease(job), {
+            "$set": {
+                "status": SUCCEEDED,
+                "completedAt": now,
+                "updatedAt": now
+            },
+            "$unset": {
+                "leaseUntil": ""
+            }
+        })
+
+    async def fail(self, job: Dict[str, Any], error: str) -> None:
+        """Schedule a retry with backoff, or dead-letter the job"""
+        now = datetime.utcnow()
+        if job["attempts"] >= job.get("maxAttempts", SCORING_JOB_MAX_ATTEMPTS):
+            update = {"status": DEAD, "deadAt": now}
+            logger.error(f"{job['type']} job {job['_id']} dead-lettered "
+                         f"after {job['attempts']} attempt(s): {error}")
+        else:
+            delay = min(
+                SCORING_JOB_BACKOFF_BASE_SECONDS * 2**(job["attempts"] - 1),
+                SCORING_JOB_BACKOFF_MAX_SECONDS)
+            update = {
+                "status": QUEUED,
+                "runAt": now + timedelta(seconds=delay * random.uniform(
+                    0.5, 1.0))
+            }
+            logger.warning(f"{job['type']} job {job['_id']} failed "
+                           f"(attempt {job['attempts']}), retrying in "
+                           f"~{delay:.0f}s: {error}")
+        await self.db.scoring_jobs.update_one(
+            self._lease(job), {
+                "$set": {
+                    **update, "lastError": error,
+                    "updatedAt": now
+                },
+                "$unset": {
+                    "leaseUntil": ""
+                }
+            })
+
+    async def sweep(self) -> Dict[str, int]:
+        """Dead-letter jobs that will never run successfully
+
+        - leases that expired on the job's last allowed attempt
+        - queued jobs still unclaimed ``SCORING_JOB_QUEUED_MAX_AGE_SECONDS``
+          after they were due
+        """
+        now = datetime.utcnow()
+        lost = await self.db.scoring_jobs.update_many(
+            {
+                "status": RUNNING,
+                "leaseUntil": {
+                    "$lt": now
+                },
+                "$expr": {
+                    "$gte": ["$attempts", "$maxAttempts"]
+                }
+            }, {
+                "$set": {
+                    "status": DEAD,
+                    "deadAt": now,
+                    "lastError": "Lease expired on the final attempt",
+                    "updatedAt": now
+                },
+                "$unset": {
+                    "leaseUntil": ""
+                }
+            })
+        stale = await self.db.scoring_jobs.update_many(
+            {
+                "status": QUEUED,
+                "runAt": {
+                    "$lt":
+                    now - timedelta(seconds=SCORING_JOB_QUEUED_MAX_AGE_SECONDS)
+                }
+            }, {
+                "$set": {
+                    "status": DEAD,
+                    "deadAt": now,
+                    "lastError": "Not claimed within "
+                    f"{SCORING_JOB_QUEUED_MAX_AGE_SECONDS:.0f}s of being due",
+                    "updatedAt": now
+                }
+            })
+        swept = {"lease_expired": lost.modified_count,
+                 "unclaimed": stale.modified_count}
+        if any(swept.values()):
+            logger.error(f"Dead-lettered scoring jobs: {swept}")
+        return swept
+
+    async def stats(self) -> Dict[str, int]:
+        counts = {QUEUED: 0, RUNNING: 0, SUCCEEDED: 0, DEAD: 0}
+        async for row in self.db.scoring_jobs.aggregate([{
+                "$group": {
+                    "_id": "$status",
+                    "count": {
+                        "$sum": 1
+                    }
+                }
+        }]):
+            counts[row["_id"]] = row["count"]
+        return counts
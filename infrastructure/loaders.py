@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bson import ObjectId
+
+from config import PROGRESS_SUMMARY_READS
+from infrastructure.repositories.progress_summary_repository import (
+    ProgressSummaryRepository)
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class BatchLoader:
+    """Request-scoped loader that resolves ``_id`` lookups with one ``$in`` query"""
+
+    def __init__(self, collection, workspace: Optional[str] = None):
+        self.collection = collection
+        self.workspace = workspace
+        self._cache: Dict[str, Optional[dict]] = {}
+
+    async def load_many(self, ids: Iterable[Any]) -> None:
+        """Fetch every id not already cached in a single round trip"""
+        pending = {str(doc_id) for doc_id in ids} - self._cache.keys()
+        if not pending:
+            return
+
+        object_ids = []
+        for doc_id in pending:
+            # Unknown or malformed ids resolve to None, like a missed find_one
+            self._cache[doc_id] = None
+            if ObjectId.is_valid(doc_id):
+                object_ids.append(ObjectId(doc_id))
+            else:
+                logger.warning(f"Skipping invalid ObjectId {doc_id}")
+
+        if not object_ids:
+            return
+
+        query = {"_id": {"$in": object_ids}}
+        if self.workspace is not None:
+            query["workspace"] = self.workspace
+
+        async for doc in self.collection.find(query):
+            self._cache[str(doc["_id"])] = doc
+        logger.debug(
+            f"Loaded {len(object_ids)} id(s) from {self.collection.name}")
+
+    def get(self, doc_id: Any) -> Optional[dict]:
+        return self._cache.get(str(doc_id))
+
+
+class ProgressLoader:
+    """Request-scoped loader for userSimulationProgress rows of many trainees"""
+
+    def __init__(self, collection, workspace: Optional[str] = None):
+        self.collection = collection
+        self.workspace = workspace
+        self._rows: Dict[Tuple[Any, Any, Any], List[dict]] = {}
+
+    async def load_many(self, user_ids: Iterable[str],
+                        assignment_ids: Iterable[str],
+                        sim_ids: Iterable[Any]) -> None:
+        """Fetch progress for every (user, assignment, simulation) at once"""
+        user_ids = list(dict.fromkeys(user_ids))
+        assignment_ids = list(dict.fromkeys(assignment_ids))
+        sim_ids = list(dict.fromkeys(sim_ids))
+        if not user_ids or not assignment_ids or not sim_ids:
+            return
+
+        query = {
+            "userId": {
+                "$in": user_ids
+            },
+            "assignmentId": {
+                "$in": assignment_ids
+            },
+            "simulationId": {
+                "$in": sim_ids
+            }
+        }
+        if self.workspace is not None:
+            query["workspace"] = self.workspace
+
+        async for row in self.collection.find(query):
+            key = (row.get("userId"), row.get("assignmentId"),
+                   row.get("simulationId"))
+            self._rows.setdefault(key, []).append(row)
+
+    def get(self, user_id: str, assignment_id: str, sim_id: Any) -> List[dict]:
+        return self._rows.get((user_id, assignment_id, sim_id), [])
+
+
+class SummaryProgressLoader(ProgressLoader):
+    """ProgressLoader backed by simulationProgressSummaries
+
+    Returns one condensed row per key carrying the consolidated status
+    (and first completion time), which is all status rollups need.
+    """
+
+    async def load_many(self, user_ids: Iterable[str],
+                        assignment_ids: Iterable[str],
+                        sim_ids: Iterable[Any]) -> None:
+        user_ids = list(dict.fromkeys(user_ids))
+        assignment_ids = list(dict.fromkeys(assignment_ids))
+        sim_ids = list(dict.fromkeys(sim_ids))
+        if not user_ids or not assignment_ids or not sim_ids:
+            return
+
+        query = {
+            "userId": {
+                "$in": user_ids
+            },
+            "assignmentId": {
+                "$in": assignment_ids
+            },
+            "simulationId": {
+                "$in": sim_ids
+            }
+        }
+        if self.workspace is not None:
+            query["workspace"] = self.workspace
+
+        async for summary in self.collection.find(query):
+            key = (summary.get("userId"), summary.get("assignmentId"),
+                   summary.get("simulationId"))
+            self._rows[key] = ProgressSummaryRepository.to_progress_list(
+                summary)
+
+
+class PlanStructureResolver:
+    """Request-scoped cache of the plan -> module -> simulation tree"""
+
+    def __init__(self, db, workspace: Optional[str] = None):
+        self.training_plans = BatchLoader(db.training_plans, workspace)
+        self.modules = BatchLoader(db.modules, workspace)
+        self.simulations = BatchLoader(db.simulations, workspace)
+
+    async def resolve(self, assignments: Iterable[dict]) -> List[Any]:
+        """Load every node reachable from the assignments, one query per level
+
+        Trees already resolved for this request are served from cache.
+        Returns the simulation ids that were reached.
+        """
+        plan_ids, module_ids, sim_ids = [], [], []
+        for assignment in assignments:
+            if assignment["type"] == "TrainingPlan":
+                plan_ids.append(assignment["id"])
+            elif assignment["type"] == "Module":
+                module_ids.append(assignment["id"])
+            elif assignment["type"] == "Simulation":
+                sim_ids.append(assignment["id"])
+
+        await self.training_plans.load_many(plan_ids)
+        for plan_id in plan_ids:
+            plan = self.training_plans.get(plan_id)
+            for added_obj in (plan or {}).get("addedObject", []):
+                if added_obj["type"] == "module":
+                    module_ids.append(added_obj["id"])
+                elif added_obj["type"] == "simulation":
+                    sim_ids.append(added_obj["id"])
+
+        await self.modules.load_many(module_ids)
+        for module_id in module_ids:
+            module = self.modules.get(module_id)
+            sim_ids.extend((module or {}).get("simulationIds", []))
+
+        await self.simulations.load_many(sim_ids)
+        return list(dict.fromkeys(sim_ids))
+
+
+class AssignedPlanLoader(PlanStructureResolver):
+    """Prefetches the plan tree and trainee progress for a page of assignments"""
+
+    def __init__(self, db, user_ids: Iterable[str],
+                 workspace: Optional[str] = None):
+        super().__init__(db, workspace)
+        self.user_ids = list(user_ids)
+        if PROGRESS_SUMMARY_READS:
+            self.progress = SummaryProgressLoader(db.sim_progress_summaries,
+                                                  workspace)
+        else:
+            self.progress = ProgressLoader(db.user_sim_progress, workspace)
+
+    async def load(self, assignments: List[dict]) -> None:
+        sim_ids = await self.resolve(assignments)
+        await self.progress.load_many(
+            self.user_ids,
+            [str(assignment["_id"]) for assignment in assignments], sim_ids)
@@ -0,0 +1,209 @@
+import asyncio
+import base64
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+
+from config import COUNT_CACHE_TTL_SECONDS
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def is_cursor_mode(pagination) -> bool:
+    """Whether the request opted into keyset paging"""
+    return bool(pagination) and (pagination.useCursor
+                                 or pagination.cursor is not None)
+
+
+class KeysetPage:
+    """Keyset (cursor) paging over a ``(sort field, _id)`` order
+
+    Instead of skipping ``(page - 1) * pagesize`` documents, each page
+    continues after the last document of the previous one with a range
+    query, so every page costs the same as the first. The opaque cursor
+    encodes the sort key, its direction and the last ``_id``.
+    """
+
+    def __init__(self, sort_options: List[Tuple[str, int]],
+                 cursor: Optional[str] = None):
+        # Only the primary sort key is used; _id breaks ties
+        self.field, self.direction = (sort_options[0]
+                                      if sort_options else ("_id", 1))
+        self.sort = [(self.field, self.direction)]
+        if self.field != "_id":
+            self.sort.append(("_id", self.direction))
+        self.after = self._decode(cursor) if cursor else None
+        self.next_cursor: Optional[str] = None
+
+    def _decode(self, cursor: str) -> Dict[str, Any]:
+        try:
+            position = json_util.loads(
+                base64.urlsafe_b64decode(cursor.encode()).decode())
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+        if position.get("f") != self.field or position.get(
+                "d") != self.direction:
+            raise ValueError("Pagination cursor does not match the sort order")
+        return position
+
+    def _encode(self, doc: Dict[str, Any]) -> str:
+        position = {
+            "f": self.field,
+            "d": self.direction,
+            "v": doc.get(self.field),
+            "id": doc["_id"]
+        }
+        return base64.urlsafe_b64encode(
+            json_util.dumps(position).encode()).decode()
+
+    def filter(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Restrict ``query`` to documents after the cursor position"""
+        after = self.after_filter()
+        if not after:
+            return query
+        return {"$and": [query, after]} if query else after
+
+    def after_filter(self) -> Optional[Dict[str, Any]]:
+        """Range predicate selecting documents after the cursor position"""
+        if not self.after:
+            return None
+
+        op = "$gt" if self.direction == 1 else "$lt"
+        value, last_id = self.after["v"], self.after["id"]
+        if self.field == "_id":
+            after = {"_id": {op: last_id}}
+        elif value is None:
+            # Missing/null keys sort before every other value
+            after = {self.field: None, "_id": {op: last_id}}
+            if self.direction == 1:
+                after = {"$or": [{self.field: {"$ne": None}}, after]}
+        else:
+            branches = [{
+                self.field: {
+                    op: value
+                }
+            }, {
+                self.field: value,
+                "_id": {
+                    op: last_id
+                }
+            }]
+            if self.direction == -1:
+                branches.append({self.field: None})
+            after = {"$or": branches}
+        return after
+
+    def trim(self, docs: List[Dict[str, Any]],
+             limit: int) -> List[Dict[str, Any]]:
+        """Drop the look-ahead document and record ``next_cursor``"""
+        if len(docs) > limit:
+            docs = docs[:limit]
+            self.next_cursor = self._encode(docs[-1])
+        return docs
+
+
+class CountCache:
+    """Short-lived cache of exact totals per (collection, normalized filter)
+
+    The workspace is part of the filter, so entries are per tenant. Totals
+    served from here may lag writes by up to the TTL and are reported as
+    approximate.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+
+    @staticmethod
+    def _key(collection, query: Dict[str, Any]) -> str:
+        return f"{collection.name}:{json_util.dumps(query, sort_keys=True)}"
+
+    def get(self, collection, query: Dict[str, Any]) -> Optional[int]:
+        key = self._key(collection, query)
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        expires_at, total = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return total
+
+    def set(self, collection, query: Dict[str, Any], total: int) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        key = self._key(collection, query)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+count_cache = CountCache(COUNT_CACHE_TTL_SECONDS)
+
+
+class PageResult:
+    """One page of documents plus the total matching the unpaged filter"""
+
+    def __init__(self, docs: List[Dict[str, Any]], total_count: int,
+                 total_exact: bool):
+        self.docs = docs
+        self.total_count = total_count
+        self.total_exact = total_exact
+
+
+async def fetch_page(collection,
+                     query: Dict[str, Any],
+                     sort_options: List[Tuple[str, int]],
+                     skip: int,
+                     limit: int,
+                     keyset: Optional[KeysetPage] = None,
+                     projection: Optional[Dict[str, Any]] = None) -> PageResult:
+    """Fetch a page and its total using the cheapest count strategy
+
+    The page is always read with an indexed ``find().sort()`` (a keyset
+    range scan when paging by cursor), projected server-side. The total is:
+
+    - ``estimated_document_count`` (metadata only) for an empty filter
+    - a cached total, reused for its TTL
+    - otherwise ``count_documents``, run concurrently with the page query
+      (workspace-only filters included: ``estimated_document_count`` would
+      count every tenant's documents)
+    """
+    if keyset:
+        sort_options, skip, fetch_limit = keyset.sort, 0, limit + 1
+        if projection:
+            # The cursor is built from the sort key of the last document
+            projection = {**projection, keyset.field: 1}
+    else:
+        fetch_limit = limit
+
+    cursor = collection.find(keyset.filter(query) if keyset else query,
+                             projection)
+    if sort_options:
+        cursor = cursor.sort(sort_options)
+    page = cursor.skip(skip).limit(fetch_limit).to_list(None)
+
+    if not query:
+        docs, total = await asyncio.gather(
+            page, collection.estimated_document_count())
+        exact = False
+    else:
+        total = count_cache.get(collection, query)
+        if total is not None:
+            docs, exact = await page, False
+        else:
+            docs, total = await asyncio.gather(
+                page, collection.count_documents(query))
+            exact = True
+            count_cache.set(collection, query, total)
+
+    if keyset:
+        docs = keyset.trim(docs, limit)
+    logger.debug(f"Fetched {len(docs)} doc(s) from {collection.name}, "
+                 f"total={total} exact={exact}")
+    return PageResult(docs, total, exact)
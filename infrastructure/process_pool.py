@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+from config import AUDIO_DSP_WORKERS, AUDIO_DSP_TIMEOUT_SECONDS
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class ProcessPool:
+    """Lazily started worker processes for CPU-bound work with per-job timeouts
+
+    Jobs must be picklable module-level functions. Workers are spawned
+    rather than forked so they never inherit the event loop, Mongo client
+    or open sockets. Each of the ``max_workers`` slots is its own
+    single-process executor and runs one job at a time; callers queue for a
+    free slot, and a job's timeout only starts once it holds one.
+
+    A job that exceeds its timeout can't be cancelled inside its process, so
+    that slot's process is killed and respawned on its next use; jobs in the
+    other slots are unaffected. A job whose caller is cancelled runs to
+    completion and keeps its slot until then.
+    """
+
+    def __init__(self, name: str, max_workers: int, timeout: float):
+        self.name = name
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executors: List[Optional[ProcessPoolExecutor]] = \
+            [None] * max_workers
+        self._idle = list(range(max_workers))
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        return self._slots
+
+    def _get_executor(self, slot: int) -> ProcessPoolExecutor:
+        executor = self._executors[slot]
+        if executor is None:
+            logger.info(f"Starting {self.name} worker {slot}")
+            executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            self._executors[slot] = executor
+        return executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        slots = self._get_slots()
+        await slots.acquire()
+        slot = self._idle.pop()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._idle.append(slot)
+                slots.release()
+
+        try:
+            executor = self._get_executor(slot)
+            job = executor.submit(fn, *args)
+        except BaseException:
+            self._terminate(slot)
+            release()
+            raise
+
+        # The slot frees when the job itself finishes, even if the caller
+        # stopped waiting for it
+        loop = asyncio.get_running_loop()
+
+        def on_done(_) -> None:
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        job.add_done_callback(on_done)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job),
+                                          self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{self.name} job {fn.__name__} exceeded "
+                         f"{self.timeout}s; killing worker {slot}")
+            self._terminate(slot)
+            release()
+            raise
+        except BrokenProcessPool:
+            logger.error(f"{self.name} worker {slot} died; replacing it")
+            self._terminate(slot)
+            raise
+
+    def _terminate(self, slot: int) -> None:
+        executor, self._executors[slot] = self._executors[slot], None
+        if executor is None:
+            return
+        # No public API stops a running job; kill its process instead
+        for process in list((getattr(executor, "_processes", None)
+                             or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        for slot, executor in enumerate(self._executors):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executors[slot] = None
+
+
+dsp_pool = ProcessPool("audio-dsp", AUDIO_DSP_WORKERS,
+                       AUDIO_DSP_TIMEOUT_SECONDS)
@@ -1,9 +1,10 @@
-from typing import Dict, List, Optional ,Type, Union
+from typing import Callable, Dict, List, Optional ,Type, Union
 from datetime import datetime
 from bson import ObjectId
 from domain.interfaces.manager_repository import IManagerRepository
 from domain.services.assignment_service import AssignmentService
 from infrastructure.database import Database
+from infrastructure.loaders import AssignedPlanLoader, PlanStructureResolver
 from api.schemas.requests import PaginationParams
 from api.schemas.responses import ( ModuleDetails, SimulationDetails,
     ModuleDetailsByUser, TrainingPlanDetailsByUser, TrainingPlanDetailsMinimal, 
@@ -366,35 +367,38 @@ class ManagerRepository(IManagerRepository):
                 "simulationId":sim_id
             }).to_list(None)
 
-            # Determine status with precedence: completed > in_progress > not_started
-            status = self.calculate_simulation_attempts_status(progress_list, due_date)
-            logger.debug(
-                f"Simulation {sim_id} retrieved with consolidated status {status}"
-            )
-            # Getting scores
-            # TODO: Ask do we need the latest attempt response score?
-            scores = {}
-            avg_score_attempts = self.calculate_simulation_attempts_score(progress_list)
-
-            return SimulationDetailsByUser(
-                simulation_id=str(sim["_id"]),
-                name=sim.get("name", ""),
-                type=sim.get("type", ""),
-                level= "beginner",
-                est_time=sim.get("estimatedTimeToAttemptInMins", 0),
-                dueDate=due_date,
-                status=status,
-                scores=scores,
-                highest_attempt_score=0,
-                average_score=avg_score_attempts,
-                assignment_id=assignment_id,
-                user_id=user_id
-            )
+            return self._build_simulation_stats(sim, progress_list, assignment_id, user_id, due_date)
 
         except Exception as e:
             logger.error(f"Error fetching simulation stats: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error fetching simulation stats: {str(e)}")
 
+    def _build_simulation_stats(self, sim: Dict, progress_list: List[Dict], assignment_id: str, user_id: str, due_date: str) -> SimulationDetailsByUser:
+        # Determine status with precedence: completed > in_progress > not_started
+        status = self.calculate_simulation_attempts_status(progress_list, due_date)
+        logger.debug(
+            f"Simulation {sim['_id']} retrieved with consolidated status {status}"
+        )
+        # Getting scores
+        # TODO: Ask do we need the latest attempt response score?
+        scores = {}
+        avg_score_attempts = self.calculate_simulation_attempts_score(progress_list)
+
+        return SimulationDetailsByUser(
+            simulation_id=str(sim["_id"]),
+            name=sim.get("name", ""),
+            type=sim.get("type", ""),
+            level= "beginner",
+            est_time=sim.get("estimatedTimeToAttemptInMins", 0),
+            dueDate=due_date,
+            status=status,
+            scores=scores,
+            highest_attempt_score=0,
+            average_score=avg_score_attempts,
+            assignment_id=assignment_id,
+            user_id=user_id
+        )
+
     async def get_module_stats(self, module_id, assignment_id, user_id, due_date):
         try:
             module = await self.db.modules.find_one({"_id": ObjectId(module_id)})
@@ -403,100 +407,198 @@ class ManagerRepository(IManagerRepository):
                 return None
 
             module_simulations = []
-            module_sim_statuses = []
-            module_sim_scores = []
-            total_module_est_time = 0
             for sim_id in module.get("simulationIds", []):
                 sim_details = await self.get_simulation_stats(sim_id, assignment_id, user_id, due_date)
                 if sim_details:
                     module_simulations.append(sim_details)
-                    module_sim_statuses.append(sim_details.status)
-                    module_sim_scores.append(sim_details.average_score)
-                    total_module_est_time += sim_details.est_time
-
-            # Determine module status
-            module_status = self.calculate_status_modules_and_training_plans(module_sim_statuses)
-
-            # Determine module completion and adherence percentage
-            module_completion_rate = self.calculate_single_training_entity_completion_rate(module_sim_statuses)
-
-            # Determine module average score
-            module_average_score = sum(module_sim_scores) / len(module_sim_scores) if module_sim_scores else 0
-
-            logger.debug(
-                f"Module {module_id} has {len(module_simulations)} simulation(s) with status={module_status}"
-            )
-
-            return ModuleDetailsByUser(
-                name=module.get("name", ""),
-                total_simulations=len(module_simulations),
-                average_score=module_average_score,
-                due_date=due_date,
-                status=module_status,
-                user_id=user_id,
-                simulations=module_simulations,
-                completion_percentage=module_completion_rate["completion_rate"],
-                adherence_percentage=module_completion_rate["adherence_rate"],
-                est_time=total_module_est_time
-            )
+
+            return self._build_module_stats(module, module_simulations, user_id, due_date)
         except Exception as e:
             logger.error(f"Error fetching module stats: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error fetching module stats: {str(e)}")
 
-    async def get_training_plan_stats(self, assignment, userId):
+    def _build_module_stats(self, module: Dict, module_simulations: List[SimulationDetailsByUser], user_id: str, due_date: str) -> ModuleDetailsByUser:
+        module_sim_statuses = [sim.status for sim in module_simulations]
+        module_sim_scores = [sim.average_score for sim in module_simulations]
+        total_module_est_time = sum(sim.est_time for sim in module_simulations)
+
+        # Determine module status
+        module_status = self.calculate_status_modules_and_training_plans(module_sim_statuses)
+
+        # Determine module completion and adherence percentage
+        module_completion_rate = self.calculate_single_training_entity_completion_rate(module_sim_statuses)
+
+        # Determine module average score
+        module_average_score = sum(module_sim_scores) / len(module_sim_scores) if module_sim_scores else 0
+
+        logger.debug(
+            f"Module {module['_id']} has {len(module_simulations)} simulation(s) with status={module_status}"
+        )
+
+        return ModuleDetailsByUser(
+            name=module.get("name", ""),
+            total_simulations=len(module_simulations),
+            average_score=module_average_score,
+            due_date=due_date,
+            status=module_status,
+            user_id=user_id,
+            simulations=module_simulations,
+            completion_percentage=module_completion_rate["completion_rate"],
+            adherence_percentage=module_completion_rate["adherence_rate"],
+            est_time=total_module_est_time
+        )
+
+    def _build_training_plan_stats(self, training_plan: Dict, plan_modules: List[ModuleDetailsByUser], plan_simulations: List[SimulationDetailsByUser], assignment: Dict, userId: str) -> TrainingPlanDetailsByUser:
+        plan_total_simulations = sum(mod.total_simulations for mod in plan_modules) + len(plan_simulations)
+        plan_est_time = sum(mod.est_time for mod in plan_modules) + sum(sim.est_time for sim in plan_simulations)
+
+        modules_statuses = [mod.status for mod in plan_modules]
+        simulations_statuses = [sim.status for sim in plan_simulations]
+        tp_children_statuses = modules_statuses + simulations_statuses
+
+        # Determine Training Plan status
+        plan_status = self.calculate_status_modules_and_training_plans(tp_children_statuses)
+
+        # Determine Training Plan completion and adherence percentage
+        plan_completion_rate = self.calculate_single_training_entity_completion_rate(tp_children_statuses)
+
+        # Determine Training Plan average score
+        plan_average_score = (sum(sim.average_score for sim in plan_simulations) + sum(mod.average_score for mod in plan_modules)) / (len(plan_simulations) + len(plan_modules)) if plan_simulations or plan_modules else 0
+
+        return TrainingPlanDetailsByUser(
+            name=training_plan.get("name", ""),
+            completion_percentage=plan_completion_rate["completion_rate"],
+            adherence_percentage=plan_completion_rate["adherence_rate"],
+            total_modules=len(plan_modules),
+            total_simulations=plan_total_simulations,
+            est_time=plan_est_time,
+            average_score=plan_average_score,
+            due_date=assignment["endDate"],
+            status=plan_status,
+            user_id=userId,
+            modules=plan_modules,
+            simulations=plan_simulations
+        )
+
+    async def aggregate_simulation_progress(self, sim_ids: List[str], user_ids: List[str], assignment_ids: List[str]) -> Dict[tuple, List[Dict]]:
+        """Group progress rows per (user, assignment, simulation) in one aggregation
+
+        Each value is a condensed progress list accepted by
+        ``calculate_simulation_attempts_status`` and
+        ``calculate_simulation_attempts_score``: one row per distinct
+        non-completed status plus every completed attempt, oldest first.
+        """
+        if not sim_ids or not user_ids or not assignment_ids:
+            return {}
+
+        pipeline = [
+            {"$match": {
+                "userId": {"$in": user_ids},
+                "assignmentId": {"$in": assignment_ids},
+                "simulationId": {"$in": list(set(sim_ids))}
+            }},
+            # The score is averaged in attempt order, so push completions oldest first
+            {"$sort": {"completedAt": 1}},
+            {"$group": {
+                "_id": {"userId": "$userId", "assignmentId": "$assignmentId", "simulationId": "$simulationId"},
+                # Like attempt.get("status", "not_started"): only a missing status
+                # defaults, an explicit null stays null
+                "statuses": {"$addToSet": {"$cond": [
+                    {"$eq": [{"$type": "$status"}, "missing"]},
+                    "not_started",
+                    "$status"
+                ]}},
+                # Only completed attempts matter for first completion time and score
+                "completed": {"$push": {"$cond": [
+                    {"$eq": ["$status", "completed"]},
+                    {"status": "completed", "completedAt": "$completedAt", "scores": "$scores"},
+                    None
+                ]}}
+            }}
+        ]
+
+        progress = {}
+        async for group in self.db.user_sim_progress.aggregate(pipeline):
+            key = (group["_id"].get("userId"), group["_id"].get("assignmentId"), group["_id"].get("simulationId"))
+            completed = [attempt for attempt in group["completed"] if attempt]
+            progress[key] = [{"status": status} for status in group["statuses"] if status != "completed"] + completed
+        return progress
+
+    async def get_training_entity_stats_bulk(self, assignments: List[Dict]) -> Dict[tuple, Union[TrainingPlanDetailsByUser, ModuleDetailsByUser, SimulationDetailsByUser]]:
+        """Compute per-user stats for a page of training entity assignments
+
+        Keyed by (assignment _id, user id). The plan trees are resolved once
+        through a shared PlanStructureResolver and the simulation progress of
+        every trainee is grouped server-side in a single aggregation.
+        """
         try:
-            training_plan = await self.db.training_plans.find_one({"_id": ObjectId(assignment["id"])})
-            if training_plan:
-                plan_modules = []
-                plan_total_simulations = 0
-                plan_est_time = 0
-                plan_simulations = []
-                for added_obj in training_plan.get("addedObject", []):
-                    if added_obj["type"] == "module":
-                        module_details = await self.get_module_stats(added_obj["id"], str(assignment["_id"]), userId, assignment["endDate"])
-                        if module_details:
-                            plan_modules.append(module_details)
-                            plan_total_simulations += module_details.total_simulations
-                            plan_est_time += module_details.est_time
+            resolver = PlanStructureResolver(self.db)
+            sim_ids = await resolver.resolve(assignments)
 
-                    elif added_obj["type"] == "simulation":
-                        sim_details = await self.get_simulation_stats(added_obj["id"], str(assignment["_id"]), userId, assignment["endDate"])
-                        if sim_details:
-                            plan_simulations.append(sim_details)
-                            plan_total_simulations += 1
-                            plan_est_time += sim_details.est_time
-
-                modules_statuses = [mod.status for mod in plan_modules]
-                simulations_statuses = [sim.status for sim in plan_simulations]
-                tp_children_statuses = modules_statuses + simulations_statuses
-
-                # Determine Training Plan status
-                plan_status = self.calculate_status_modules_and_training_plans(tp_children_statuses)
-
-                # Determine Training Plan completion and adherence percentage
-                plan_completion_rate = self.calculate_single_training_entity_completion_rate(tp_children_statuses)
-
-                # Determine Training Plan average score
-                plan_average_score = (sum(sim.average_score for sim in plan_simulations) + sum(mod.average_score for mod in plan_modules)) / (len(plan_simulations) + len(plan_modules)) if plan_simulations or plan_modules else 0
-
-                return TrainingPlanDetailsByUser(
-                    name=training_plan.get("name", ""),
-                    completion_percentage=plan_completion_rate["completion_rate"],
-                    adherence_percentage=plan_completion_rate["adherence_rate"],
-                    total_modules=len(plan_modules),
-                    total_simulations=plan_total_simulations,
-                    est_time=plan_est_time,
-                    average_score=plan_average_score,
-                    due_date=assignment["endDate"],
-                    status=plan_status,
-                    user_id=userId,
-                    modules=plan_modules,
-                    simulations=plan_simulations
-                )
-            return None
+            user_ids = list({user_id for a in assignments for user_id in a["traineeId"]})
+            assignment_ids = list({str(a["_id"]) for a in assignments})
+            progress = await self.aggregate_simulation_progress(sim_ids, user_ids, assignment_ids)
+
+            def get_progress(user_id, assignment_id, sim_id):
+                return progress.get((user_id, assignment_id, sim_id), [])
+
+            stats = {}
+            for assignment in assignments:
+                for user_id in assignment["traineeId"]:
+                    user_stats = self._build_assignment_stats(assignment, user_id, resolver, get_progress)
+                    if user_stats:
+                        stats[(str(assignment["_id"]), user_id)] = user_stats
+            return stats
         except Exception as e:
-            logger.error(f"Error fetching training plan stats: {str(e)}", exc_info=True)
-            return None
+            logger.error(f"Error fetching training entity stats: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Error fetching training entity stats: {str(e)}")
+
+    def _build_assignment_stats(self, assignment: Dict, user_id: str, resolver: PlanStructureResolver, get_progress: Callable[[str, str, str], List[Dict]]):
+        """Build one trainee's stats for an assignment from an already resolved tree"""
+        assignment_id = str(assignment["_id"])
+        due_date = assignment["endDate"]
+
+        def simulation_stats(sim_id):
+            sim = resolver.simulations.get(sim_id)
+            if not sim:
+                logger.warning(f"Simulation {sim_id} not found.")
+                return None
+            progress_list = get_progress(user_id, assignment_id, sim_id)
+            return self._build_simulation_stats(sim, progress_list, assignment_id, user_id, due_date)
+
+        def module_stats(module_id):
+            module = resolver.modules.get(module_id)
+            if not module:
+                logger.warning(f"Module {module_id} not found.")
+                return None
+            module_simulations = []
+            for sim_id in module.get("simulationIds", []):
+                sim_details = simulation_stats(sim_id)
+                if sim_details:
+                    module_simulations.append(sim_details)
+            return self._build_module_stats(module, module_simulations, user_id, due_date)
+
+        if assignment["type"] == "TrainingPlan":
+            training_plan = resolver.training_plans.get(assignment["id"])
+            if not training_plan:
+                return None
+            plan_modules = []
+            plan_simulations = []
+            for added_obj in training_plan.get("addedObject", []):
+                if added_obj["type"] == "module":
+                    module_details = module_stats(added_obj["id"])
+                    if module_details:
+                        plan_modules.append(module_details)
+                elif added_obj["type"] == "simulation":
+                    sim_details = simulation_stats(added_obj["id"])
+                    if sim_details:
+                        plan_simulations.append(sim_details)
+            return self._build_training_plan_stats(training_plan, plan_modules, plan_simulations, assignment, user_id)
+        elif assignment["type"] == "Module":
+            return module_stats(assignment["id"])
+        elif assignment["type"] == "Simulation":
+            return simulation_stats(assignment["id"])
+        return None
 
     async def get_all_assigments_by_user_details(self,
         user_id: str, reporting_userIds: List[str], type: str, 
@@ -568,6 +670,9 @@ class ManagerRepository(IManagerRepository):
                                     assignmentWithUser["traineeId"].add(reporting_userId)
                                     break
             assignment_service = AssignmentService()
+            # Resolve every plan tree once and fetch all trainees' progress together
+            loader = AssignedPlanLoader(self.db, reporting_userIds)
+            await loader.load(assignmentWithUsers)
             userMap = {}
             training_plans = []
             modules = []
@@ -579,8 +684,7 @@ class ManagerRepository(IManagerRepository):
                 logger.debug(f"Processing assignment: {assignment}")
 
                 if assignment["type"] == "TrainingPlan":
-                    training_plan = await self.db.training_plans.find_one(
-                        {"_id": ObjectId(assignment["id"])})
+                    training_plan = loader.training_plans.get(assignment["id"])
                     if training_plan:
                         training_plans_by_user = []
                         for userId in assignment['traineeId']:
@@ -596,6 +700,8 @@ class ManagerRepository(IManagerRepository):
                                         assignment["endDate"],
                                         str(assignment["_id"]),
                                         userId,
+                                        None,
+                                        loader,
                                     )
                                     if module_details:
                                         plan_modules.append(module_details)
@@ -612,6 +718,8 @@ class ManagerRepository(IManagerRepository):
                                         assignment["endDate"],
                                         str(assignment["_id"]),
                                         userId,
+                                        None,
+                                        loader,
                                     )
                                     if sim_details:
                                         plan_modules.append(
@@ -672,6 +780,8 @@ class ManagerRepository(IManagerRepository):
                             assignment["endDate"],
                             str(assignment["_id"]),
                             userId,
+                            None,
+                            loader,
                         )
                         if module_details:
                             module_total_simulations += module_details.total_simulations    
@@ -712,6 +822,8 @@ class ManagerRepository(IManagerRepository):
                             assignment["endDate"],
                             str(assignment["_id"]),
                             userId,
+                            None,
+                            loader,
                         )
                         if sim_details:
                             simulation_by_user.append(
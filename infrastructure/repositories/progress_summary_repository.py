@@ -0,0 +1,261 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from infrastructure.database import Database
+
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Consolidated status precedence: completed > in_progress > not_started
+STATUS_RANKS = {"not_started": 0, "in_progress": 1, "completed": 2}
+RANK_STATUSES = {rank: status for status, rank in STATUS_RANKS.items()}
+
+# Same precedence the manager dashboard uses to pick one score per attempt.
+# The end_* write paths store the unspaced key variants.
+SCORE_KEYS = [("Sim Accuracy", "SimAccuracy"), ("Keyword Score", "KeywordScore"),
+              ("Click Score", "ClickScore"), ("Confidence", ), ("Energy", ),
+              ("Concentration", )]
+
+
+def summary_id(user_id: str, assignment_id: str, simulation_id: Any) -> str:
+    return f"{user_id}:{assignment_id}:{simulation_id}"
+
+
+def key_part(field: str) -> Dict:
+    """Aggregation counterpart of ``str(value)`` for a summary_id part"""
+    return {"$ifNull": [{"$toString": field}, "None"]}
+
+
+def summary_keys(progress: Dict) -> Dict:
+    """Identifying fields a summary copies from its progress rows"""
+    return {
+        "userId": progress.get("userId"),
+        "assignmentId": progress.get("assignmentId"),
+        "simulationId": progress.get("simulationId"),
+        "workspace": progress.get("workspace")
+    }
+
+
+def attempt_score(scores: Optional[Dict]) -> float:
+    """Pick the score that represents an attempt, first non-zero key wins"""
+    if not scores:
+        return 0
+    for keys in SCORE_KEYS:
+        for key in keys:
+            if scores.get(key):
+                return scores[key]
+    return 0
+
+
+class ProgressSummaryRepository:
+    """Maintains one summary document per (userId, assignmentId, simulationId)
+
+    Summaries hold the best status, first completion time, attempt counts
+    and highest/total score so dashboards don't have to scan the full
+    userSimulationProgress history. They carry the workspace of their
+    progress rows so reads can be scoped the same way. Every write is a
+    single upsert, so concurrent attempts can't lose updates.
+
+    Backfill or repair with ``python -m scripts.rebuild_progress_summaries``.
+    """
+
+    def __init__(self):
+        self.db = Database()
+
+    async def record_start(self, progress: Dict) -> None:
+        """Count a new attempt and mark the simulation in progress
+
+        ``progress`` is the userSimulationProgress document just inserted.
+        """
+        try:
+            now = datetime.utcnow()
+            await self.db.sim_progress_summaries.update_one(
+                {
+                    "_id":
+                    summary_id(progress.get("userId"),
+                               progress.get("assignmentId"),
+                               progress.get("simulationId"))
+                }, {
+                    "$inc": {
+                        "attemptCount": 1
+                    },
+                    "$max": {
+                        "statusRank": STATUS_RANKS["in_progress"]
+                    },
+                    "$set": {
+                        "lastAttemptAt": now,
+                        "lastModifiedAt": now
+                    },
+                    "$setOnInsert": summary_keys(progress)
+                },
+                upsert=True)
+        except Exception as e:
+            # Summaries can always be rebuilt from userSimulationProgress
+            logger.error(f"Error recording attempt start in summary: {str(e)}",
+                         exc_info=True)
+
+    async def record_completion(self, progress: Optional[Dict],
+                                scores: Optional[Dict],
+                                completed_at: datetime) -> None:
+        """Fold a completed attempt into its summary
+
+        ``progress`` is the userSimulationProgress document as it was before
+        the completion update; re-ending an already completed attempt does
+        not count it twice.
+        """
+        if not progress:
+            return
+        try:
+            score = attempt_score(scores)
+            update = {
+                "$max": {
+                    "statusRank": STATUS_RANKS["completed"],
+                    "highestScore": score
+                },
+                "$min": {
+                    "firstCompletedAt": completed_at
+                },
+                "$set": {
+                    "lastModifiedAt": datetime.utcnow()
+                },
+                "$setOnInsert": summary_keys(progress)
+            }
+            if progress.get("status") != "completed":
+                update["$inc"] = {"completedCount": 1, "scoreTotal": score}
+
+            await self.db.sim_progress_summaries.update_one(
+                {
+                    "_id":
+                    summary_id(progress.get("userId"),
+                               progress.get("assignmentId"),
+                               progress.get("simulationId"))
+                },
+                update,
+                upsert=True)
+        except Exception as e:
+            logger.error(
+                f"Error recording attempt completion in summary: {str(e)}",
+                exc_info=True)
+
+    @staticmethod
+    def best_status(summary: Optional[Dict]) -> str:
+        if not summary:
+            return "not_started"
+        return RANK_STATUSES.get(summary.get("statusRank", 0), "not_started")
+
+    @staticmethod
+    def to_progress_list(summary: Optional[Dict]) -> List[Dict]:
+        """Condensed progress rows with the same consolidated status semantics"""
+        if not summary:
+            return []
+        status = ProgressSummaryRepository.best_status(summary)
+        if status == "completed":
+            return [{
+                "status": "completed",
+                "completedAt": summary.get("firstCompletedAt")
+            }]
+        return [{"status": status}]
+
+    async def rebuild(self, match: Optional[Dict] = None) -> None:
+        """Recompute summaries from userSimulationProgress (backfill/repair)
+
+        Replaces the summaries of every (user, assignment, simulation)
+        matched by ``match``; run it while the matched attempts are idle.
+        """
+        logger.info(f"Rebuilding progress summaries for match={match}")
+
+        score_expr: Any = 0
+        for keys in reversed(SCORE_KEYS):
+            for key in reversed(keys):
+                value = {"$getField": {"field": key, "input": "$scores"}}
+                score_expr = {
+                    "$cond": [{
+                        "$ne": [{
+                            "$ifNull": [value, 0]
+                        }, 0]
+                    }, value, score_expr]
+                }
+
+        is_completed = {"$eq": ["$status", "completed"]}
+        pipeline = [{
+            "$match": match or {}
+        }, {
+            "$group": {
+                # Same key as summary_id(): str() of each part, so missing
+                # or null ids become "None" rather than nulling the key
+                "_id": {
+                    "$concat": [
+                        key_part("$userId"), ":",
+                        key_part("$assignmentId"), ":",
+                        key_part("$simulationId")
+                    ]
+                },
+                "userId": {
+                    "$first": "$userId"
+                },
+                "assignmentId": {
+                    "$first": "$assignmentId"
+                },
+                "simulationId": {
+                    "$first": "$simulationId"
+                },
+                "workspace": {
+                    "$first": "$workspace"
+                },
+                "statusRank": {
+                    "$max": {
+                        "$switch": {
+                            "branches": [{
+                                "case": is_completed,
+                                "then": STATUS_RANKS["completed"]
+                            }, {
+                                "case": {
+                                    "$eq": ["$status", "in_progress"]
+                                },
+                                "then": STATUS_RANKS["in_progress"]
+                            }],
+                            "default": STATUS_RANKS["not_started"]
+                        }
+                    }
+                },
+                "attemptCount": {
+                    "$sum": 1
+                },
+                "completedCount": {
+                    "$sum": {
+                        "$cond": [is_completed, 1, 0]
+                    }
+                },
+                "firstCompletedAt": {
+                    "$min": {
+                        "$cond": [is_completed, "$completedAt", None]
+                    }
+                },
+                "highestScore": {
+                    "$max": {
+                        "$cond": [is_completed, score_expr, 0]
+                    }
+                },
+                "scoreTotal": {
+                    "$sum": {
+                        "$cond": [is_completed, score_expr, 0]
+                    }
+                },
+                "lastAttemptAt": {
+                    "$max": "$createdAt"
+                }
+            }
+        }, {
+            "$set": {
+                "lastModifiedAt": "$$NOW"
+            }
+        }, {
+            "$merge": {
+                "into": self.db.sim_progress_summaries.name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert"
+            }
+        }]
+        await self.db.user_sim_progress.aggregate(pipeline).to_list(None)
+        logger.info("Progress summaries rebuilt")
@@ -0,0 +1,78 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from config import SCRIPT_INDEX_CACHE_MAX_ENTRIES
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+CacheKey = Tuple[str, Optional[str], str]
+
+
+class ScriptIndexCache:
+    """Per-process LRU of indexes derived from a simulation script
+
+    Entries (BM25 models, keyword matchers, ...) are keyed by
+    ``(kind, simulation_id, script hash)``. Editing a script changes its
+    hash, so a stale index is never served; caching a new version drops the
+    older ones of the same simulation, and ``update_simulation`` calls
+    ``invalidate`` so the process handling the edit frees them immediately.
+    Cached values are shared between attempts and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def script_hash(sentences: Iterable[str]) -> str:
+        digest = hashlib.sha256()
+        for sentence in sentences:
+            digest.update(sentence.encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def get_or_build(self, kind: str, simulation_id: Optional[str],
+                     script_hash: str, build: Callable[[], Any]) -> Any:
+        """Cached index for this script version, built on a miss"""
+        key = (kind, simulation_id, script_hash)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = build()
+        if simulation_id is not None:
+            for stale in [k for k in self._entries
+                          if k[0] == kind and k[1] == simulation_id]:
+                del self._entries[stale]
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def invalidate(self, simulation_id: str) -> None:
+        stale = [k for k in self._entries if k[1] == simulation_id]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Dropped {len(stale)} cached script index(es) "
+                         f"for simulation {simulation_id}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+script_index_cache = ScriptIndexCache(SCRIPT_INDEX_CACHE_MAX_ENTRIES)
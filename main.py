@@ -1,9 +1,11 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import uvicorn
 from api.controllers.training_controller import router as training_router
 from api.controllers.playback_controller import router as playback_router
 from api.controllers.script_converter_controller import router as script_converter_router
 from api.controllers.simulation_controller import router as simulation_router
+from api.controllers.simulation_controller import controller as simulation_controller
 from api.controllers.voice_controller import router as voice_router
 from api.controllers.module_controller import router as module_router
 from api.controllers.training_plan_controller import router as training_plan_router
@@ -14,15 +16,30 @@ from api.controllers.tag_controller import router as tag_router
 from api.controllers.manager_controller import router as manager_router
 from api.controllers.admin_controller import router as admin_router
 from api.controllers.user_controller import router as user_router
+from api.controllers.retell_webhook_controller import router as retell_webhook_router
 from middleware.auth_middleware import JWTAuthMiddleware
 from utils.logger import Logger
 from fastapi.middleware.cors import CORSMiddleware
 from config import ALLOWED_ORIGINS
+from infrastructure.database import Database
+from infrastructure.http_client import http_clients
+from domain.services.simulation_service import shutdown_call_tasks
 
 # Initialize logger
 logger = Logger.get_logger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await Database().ensure_indexes()
+    await simulation_controller.service.resume_call_polls()
+    yield
+    # Before the HTTP clients they use are closed
+    await shutdown_call_tasks()
+    await http_clients.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add JWT authentication middleware
 app.add_middleware(JWTAuthMiddleware)
@@ -50,6 +67,7 @@ app.include_router(tag_router)
 app.include_router(manager_router)
 app.include_router(admin_router)
 app.include_router(user_router)
+app.include_router(retell_webhook_router)
 
 
 @app.get("/")
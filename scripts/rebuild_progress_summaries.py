@@ -0,0 +1,50 @@
+"""Backfill or repair simulationProgressSummaries from userSimulationProgress
+
+    python -m scripts.rebuild_progress_summaries
+    python -m scripts.rebuild_progress_summaries --workspace <id> \\
+        [--user-id <id>] [--assignment-id <id>]
+
+Replaces the summary of every (user, assignment, simulation) whose progress
+rows match the filters. Run it once before turning on
+PROGRESS_SUMMARY_READS, and while the matched attempts are idle.
+"""
+import argparse
+import asyncio
+from typing import Dict, List, Optional
+
+from infrastructure.repositories.progress_summary_repository import (
+    ProgressSummaryRepository)
+
+
+def build_match(args: argparse.Namespace) -> Dict:
+    match = {}
+    if args.workspace:
+        match["workspace"] = args.workspace
+    if args.user_id:
+        match["userId"] = args.user_id
+    if args.assignment_id:
+        match["assignmentId"] = args.assignment_id
+    return match
+
+
+async def rebuild(match: Dict) -> int:
+    repository = ProgressSummaryRepository()
+    await repository.db.ensure_indexes()
+    await repository.rebuild(match)
+    return await repository.db.sim_progress_summaries.count_documents(match)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workspace", help="only this workspace")
+    parser.add_argument("--user-id", help="only this trainee")
+    parser.add_argument("--assignment-id", help="only this assignment")
+    args = parser.parse_args(argv)
+
+    match = build_match(args)
+    total = asyncio.run(rebuild(match))
+    print(f"{total} summary document(s) now match {match or 'all'}")
+
+
+if __name__ == "__main__":
+    main()
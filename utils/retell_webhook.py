@@ -0,0 +1,38 @@
+import hashlib
+import hmac
+import re
+import time
+from typing import Optional
+
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Retell signs ``body + timestamp`` with the API key and sends
+# ``x-retell-signature: v=<unix ms>,d=<hex HMAC-SHA256>``
+SIGNATURE_PATTERN = re.compile(r"v=(\d+),d=([0-9a-f]+)")
+SIGNATURE_MAX_AGE_MS = 5 * 60 * 1000
+
+
+def sign_payload(body: str, api_key: str,
+                 timestamp_ms: Optional[int] = None) -> str:
+    """Build an ``x-retell-signature`` header value for ``body``"""
+    timestamp_ms = timestamp_ms or int(time.time() * 1000)
+    digest = hmac.new(api_key.encode(), (body + str(timestamp_ms)).encode(),
+                      hashlib.sha256).hexdigest()
+    return f"v={timestamp_ms},d={digest}"
+
+
+def verify_signature(body: str, api_key: str,
+                     signature: Optional[str]) -> bool:
+    """Check a webhook signature, rejecting stale timestamps"""
+    match = SIGNATURE_PATTERN.fullmatch(signature or "")
+    if not match:
+        logger.warning("Missing or malformed Retell webhook signature")
+        return False
+    timestamp_ms = int(match.group(1))
+    if abs(time.time() * 1000 - timestamp_ms) > SIGNATURE_MAX_AGE_MS:
+        logger.warning("Stale Retell webhook signature")
+        return False
+    return hmac.compare_digest(
+        sign_payload(body, api_key, timestamp_ms), signature)
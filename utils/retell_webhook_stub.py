@@ -0,0 +1,84 @@
+"""Send a signed, synthetic Retell call webhook to a local server
+
+    python -m utils.retell_webhook_stub --call-id <call_id> \
+        --transcript "Agent: Hello\nUser: Hi" [--event call_ended]
+
+The payload mimics Retell's ``call_ended``/``call_analyzed`` shape closely
+enough for the end-audio scoring path.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+import aiohttp
+
+from utils.retell_webhook import sign_payload
+
+
+def build_call(call_id: str, transcript: str, duration_seconds: int,
+               recording_url: str) -> Dict[str, Any]:
+    end_timestamp = int(time.time() * 1000)
+    transcript_object = []
+    for line in transcript.splitlines():
+        role, _, content = line.partition(":")
+        transcript_object.append({
+            "role": "agent" if role.strip().lower() == "agent" else "user",
+            "content": content.strip(),
+            "words": []
+        })
+    return {
+        "call_id": call_id,
+        "call_type": "web_call",
+        "call_status": "ended",
+        "start_timestamp": end_timestamp - duration_seconds * 1000,
+        "end_timestamp": end_timestamp,
+        "transcript": transcript,
+        "transcript_object": transcript_object,
+        "recording_url": recording_url
+    }
+
+
+async def send(url: str, api_key: str, event: str,
+               call: Dict[str, Any]) -> int:
+    body = json.dumps({"event": event, "call": call})
+    headers = {
+        "Content-Type": "application/json",
+        "x-retell-signature": sign_payload(body, api_key)
+    }
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, data=body, headers=headers) as response:
+            print(f"{event} -> {response.status}")
+            return response.status
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Send a stub Retell webhook to a local server")
+    parser.add_argument("--url", default="http://localhost:8000/retell/webhook")
+    parser.add_argument("--call-id", required=True)
+    parser.add_argument("--event",
+                        default="call_ended",
+                        choices=["call_started", "call_ended", "call_analyzed"])
+    parser.add_argument("--transcript", default="Agent: Hello\nUser: Hi")
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--recording-url", default="")
+    parser.add_argument("--api-key",
+                        help="signing key (defaults to RETELL_API_KEY)")
+    args = parser.parse_args(argv)
+
+    api_key = args.api_key
+    if not api_key:
+        from config import RETELL_API_KEY
+        api_key = RETELL_API_KEY
+    call = build_call(args.call_id,
+                      args.transcript.replace("\\n", "\n"), args.duration,
+                      args.recording_url)
+    status = asyncio.run(send(args.url, api_key, args.event, call))
+    return 0 if status < 300 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Background scoring worker
+
+    python -m worker [--concurrency N]
+
+Drains the ``scoringJobs`` queue with ``SCORING_WORKER_CONCURRENCY`` jobs in
+flight. Run as many worker processes as needed; leases keep them from
+running the same job twice. Every SCORING_JOB_SWEEP_INTERVAL_SECONDS the
+worker also dead-letters jobs that can never complete (see JobQueue.sweep).
+SIGINT/SIGTERM stop claiming and let in-flight jobs finish.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import sys
+from typing import List
+
+from config import (SCORING_JOB_LEASE_SECONDS,
+                    SCORING_JOB_SWEEP_INTERVAL_SECONDS,
+                    SCORING_WORKER_CONCURRENCY, SCORING_WORKER_POLL_SECONDS)
+from domain.services.scoring_job_service import ScoringJobHandlers
+from infrastructure.database import Database
+from infrastructure.http_client import http_clients
+from infrastructure.job_queue import JobQueue
+from infrastructure.process_pool import dsp_pool
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class Worker:
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.queue = JobQueue()
+        self.handlers = ScoringJobHandlers()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = asyncio.Event()
+
+    async def _heartbeat(self, job) -> None:
+        while True:
+            await asyncio.sleep(SCORING_JOB_LEASE_SECONDS / 3)
+            if not await self.queue.extend_lease(job):
+                logger.warning(f"Lost lease on job {job['_id']}")
+                return
+
+    async def _run_job(self, job) -> None:
+        logger.info(f"Running {job['type']} job {job['_id']} "
+                    f"(attempt {job['attempts']})")
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self.handlers.run(job)
+            await self.queue.complete(job)
+            logger.info(f"Job {job['_id']} succeeded")
+        except Exception as e:
+            logger.error(f"Job {job['_id']} failed: {str(e)}", exc_info=True)
+            await self.queue.fail(job, str(e))
+        finally:
+            heartbeat.cancel()
+
+    async def _slot(self, slot: int) -> None:
+        worker_id = f"{self.worker_id}:{slot}"
+        while not self.stopping.is_set():
+            try:
+                job = await self.queue.claim(worker_id)
+            except Exception as e:
+                logger.error(f"Failed to claim a job: {str(e)}", exc_info=True)
+                job = None
+            if job:
+                await self._run_job(job)
+                continue
+            try:
+                await asyncio.wait_for(self.stopping.wait(),
+                                       SCORING_WORKER_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _sweep(self) -> None:
+        """Periodically dead-letter jobs that can never complete"""
+        while not self.stopping.is_set():
+            try:
+                await self.queue.sweep()
+            except Exception as e:
+                logger.error(f"Failed to sweep the job queue: {str(e)}",
+                             exc_info=True)
+            try:
+                await asyncio.wait_for(self.stopping.wait(),
+                                       SCORING_JOB_SWEEP_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stopping.set)
+
+        await Database().ensure_indexes()
+        await self.handlers.advanced_scoring_service.warm_up()
+        logger.info(f"Worker {self.worker_id} started with "
+                    f"{self.concurrency} slot(s)")
+        try:
+            await asyncio.gather(self._sweep(),
+                                 *(self._slot(slot)
+                                   for slot in range(self.concurrency)))
+        finally:
+            await http_clients.close()
+            dsp_pool.shutdown()
+            logger.info(f"Worker {self.worker_id} stopped")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Drain the scoring job queue")
+    parser.add_argument("--concurrency",
+                        type=int,
+                        default=SCORING_WORKER_CONCURRENCY,
+                        help="jobs processed concurrently by this process")
+    args = parser.parse_args(argv)
+    asyncio.run(Worker(args.concurrency).run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())